@@ -0,0 +1,104 @@
+import time
+from argparse import ArgumentParser
+from collections import defaultdict
+from pathlib import Path
+
+from resim import Resim
+from rng import Rng
+from run import FRAGMENTS_WITH_SEASON
+
+
+class TimedResim(Resim):
+    """
+    Resim that keeps track of how long handle() takes for each event type.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.handle_times = defaultdict(float)
+        self.handle_counts = defaultdict(int)
+
+    def handle(self, event):
+        start = time.perf_counter()
+        super().handle(event)
+        self.handle_times[event["type"]] += time.perf_counter() - start
+        self.handle_counts[event["type"]] += 1
+
+
+def run_fragment(fragment, stream_file_dir):
+    season, rng_state, rng_offset, step, start_time, end_time = fragment
+    rng = Rng(rng_state, rng_offset)
+    rng.step(step)
+    resim = TimedResim(rng, None, f"s{season}-{start_time}", raise_on_errors=False, stream_file_dir=stream_file_dir)
+    resim.run(start_time, end_time, None)
+    return resim
+
+
+def compare_streams(a_dir: Path, b_dir: Path):
+    """
+    Checks that two --roll-stream directories contain exactly the same rolls
+    """
+    mismatches = 0
+    for a_file in sorted(a_dir.glob("*.rolls*")):
+        b_file = b_dir / a_file.name
+        if not b_file.exists():
+            print(f"{a_file.name}: missing from {b_dir}")
+            mismatches += 1
+        elif a_file.read_bytes() != b_file.read_bytes():
+            print(f"{a_file.name}: differs")
+            mismatches += 1
+    print(f"{mismatches} mismatched roll streams")
+    return mismatches
+
+
+def main():
+    parser = ArgumentParser("bench_event_types")
+    parser.add_argument(
+        "--fragment",
+        type=str,
+        action="append",
+        help="Start date of a fragment to run. Can be given multiple times. Default is the first fragment",
+    )
+    parser.add_argument(
+        "--roll-stream", default=None, type=Path, help="Write the roll stream for each fragment into this directory"
+    )
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        default=None,
+        type=Path,
+        metavar="DIR",
+        help="Don't run anything, just check two --roll-stream directories are identical",
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        exit(1 if compare_streams(*args.compare) else 0)
+
+    if args.fragment:
+        fragments = [fragment for fragment in FRAGMENTS_WITH_SEASON if fragment[4] in args.fragment]
+    else:
+        fragments = FRAGMENTS_WITH_SEASON[:1]
+    if args.roll_stream:
+        args.roll_stream.mkdir(parents=True, exist_ok=True)
+
+    times = defaultdict(float)
+    counts = defaultdict(int)
+    for fragment in fragments:
+        resim = run_fragment(fragment, args.roll_stream)
+        for event_type, secs in resim.handle_times.items():
+            times[event_type] += secs
+            counts[event_type] += resim.handle_counts[event_type]
+
+    print(f"{'event type':<45} {'count':>8} {'total ms':>10} {'us/event':>10}")
+    for event_type in sorted(times, key=times.get, reverse=True):
+        print(
+            f"{event_type.name:<45} {counts[event_type]:>8} {times[event_type] * 1000:>10.1f} "
+            f"{times[event_type] / counts[event_type] * 1e6:>10.1f}"
+        )
+    total_secs = sum(times.values())
+    print(f"{'total':<45} {sum(counts.values()):>8} {total_secs * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import time
+from argparse import ArgumentParser
+
+import formulas
+from data import GameData, Weather
+from formulas import StatRelevantData, season_formulas
+from run import FRAGMENTS_WITH_SEASON
+
+THRESHOLDS = [
+    "strike",
+    "swing_strike",
+    "swing_ball",
+    "contact_strike",
+    "contact_ball",
+    "foul",
+    "hr",
+    "fly_or_ground",
+    "out",
+    "double",
+    "triple",
+]
+
+
+def get_matchups(data: GameData, count: int):
+    """
+    (batter, batting team, pitcher, pitching team, fielder, stadium) for the first few batters of each team,
+    against the next team's first pitcher, in whatever stadium is first
+    """
+    stadium = next(iter(data.stadiums.values()))
+    teams = [team for team in data.teams.values() if team.lineup and team.rotation]
+    matchups = []
+    for batting_team, pitching_team in zip(teams, teams[1:] + teams[:1]):
+        pitcher = data.get_player(pitching_team.rotation[0])
+        for batter_id, fielder_id in zip(batting_team.lineup, pitching_team.lineup):
+            matchups.append(
+                (data.get_player(batter_id), batting_team, pitcher, pitching_team, data.get_player(fielder_id), stadium)
+            )
+            if len(matchups) == count:
+                return matchups
+    return matchups
+
+
+def call_args(name: str, matchup, meta: StatRelevantData):
+    batter, batting_team, pitcher, pitching_team, fielder, stadium = matchup
+    if name == "strike":
+        return batter, batting_team, pitcher, pitching_team, stadium, meta, False
+    if name == "foul":
+        return batter, batting_team, stadium, meta
+    if name in ("out", "double", "triple"):
+        return batter, batting_team, pitcher, pitching_team, fielder, stadium, meta
+    return batter, batting_team, pitcher, pitching_team, stadium, meta
+
+
+def time_calls(fn, calls, repeat: int) -> float:
+    """
+    Best time per call out of `repeat` passes over all the calls
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for args in calls:
+            fn(*args)
+        secs = time.perf_counter() - start
+        best = secs if best is None else min(best, secs)
+    return best / len(calls)
+
+
+def main():
+    parser = ArgumentParser("bench_formulas")
+    parser.add_argument(
+        "--fragment",
+        type=str,
+        default=None,
+        help="Start date of the fragment whose league data to use. Default is the first fragment",
+    )
+    parser.add_argument(
+        "--season",
+        type=int,
+        action="append",
+        help="Zero-indexed season to time the formulas for. Can be given multiple times. "
+        "Default is the fragment's season",
+    )
+    parser.add_argument("--matchups", type=int, default=100, help="How many batter/pitcher pairs to call them with")
+    parser.add_argument("--repeat", type=int, default=20, help="Passes over the matchups, the best one is reported")
+    args = parser.parse_args()
+
+    fragment = next(
+        fragment for fragment in FRAGMENTS_WITH_SEASON if args.fragment is None or fragment[4] == args.fragment
+    )
+    data = GameData()
+    data.fetch_league_data(fragment[4])
+    matchups = get_matchups(data, args.matchups)
+
+    print(f"{'season':>6} {'threshold':<16} {'get_* us':>10} {'kernel us':>10} {'fresh meta us':>14}")
+    for season in args.season or [fragment[0]]:
+        kernels = season_formulas(season)
+        for name in THRESHOLDS:
+            # one meta for every call, like the rolls of one event
+            meta = StatRelevantData(Weather.SUN_2, season, 50, 1, True, False, 2)
+            calls = [call_args(name, matchup, meta) for matchup in matchups]
+            dispatched = time_calls(getattr(formulas, f"get_{name}_threshold"), calls, args.repeat)
+            kernel = time_calls(getattr(kernels, f"{name}_threshold"), calls, args.repeat)
+            # a new meta for every call, so nothing is memoized
+            fresh_calls = [
+                call_args(name, matchup, StatRelevantData(Weather.SUN_2, season, 50, 1, True, False, 2))
+                for matchup in matchups
+            ]
+            fresh = time_calls(getattr(kernels, f"{name}_threshold"), fresh_calls, 1)
+            print(f"{season:>6} {name:<16} {dispatched * 1e6:>10.2f} {kernel * 1e6:>10.2f} {fresh * 1e6:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import os
+import pickle
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+CHECKPOINT_DIR = "checkpoints"
+COMPLETE_MARKER = "complete"
+CHECKPOINT_FILE = re.compile(r"s(\d+)d(\d+)\.pickle")
+
+
+def checkpoint_dir_for(run_name: str) -> str:
+    return os.path.join(CHECKPOINT_DIR, run_name.replace(":", "_"))
+
+
+def write_checkpoint(checkpoint_dir: str, season: int, day: int, header: Dict[str, Any], state: Dict[str, Any]):
+    """
+    The header is a small separate pickle at the start of the file, so it can be read without loading the state
+    """
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    path = os.path.join(checkpoint_dir, f"s{season}d{day}.pickle")
+    # so a crash while writing doesn't leave a broken checkpoint for --resume to pick up
+    with open(f"{path}.partial", "wb") as f:
+        pickle.dump(header, f, pickle.HIGHEST_PROTOCOL)
+        pickle.dump(state, f, pickle.HIGHEST_PROTOCOL)
+    os.replace(f"{path}.partial", path)
+
+
+def read_checkpoint_header(path: str) -> Dict[str, Any]:
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def read_checkpoint(path: str) -> Dict[str, Any]:
+    with open(path, "rb") as f:
+        header = pickle.load(f)
+        return {**header, **pickle.load(f)}
+
+
+def list_checkpoints(checkpoint_dir: str) -> List[Tuple[int, int, str]]:
+    """
+    (season, day, path) of each checkpoint for a fragment, in order. Seasons and days are zero-indexed
+    """
+    if not os.path.isdir(checkpoint_dir):
+        return []
+    checkpoints = []
+    for filename in os.listdir(checkpoint_dir):
+        match = CHECKPOINT_FILE.fullmatch(filename)
+        if match:
+            checkpoints.append((int(match.group(1)), int(match.group(2)), os.path.join(checkpoint_dir, filename)))
+    return sorted(checkpoints)
+
+
+def find_checkpoint(checkpoint_dir: str, from_day: Optional[int] = None) -> Optional[Tuple[int, int, str]]:
+    """
+    The latest checkpoint, or the latest one at or before from_day
+    """
+    checkpoints = [c for c in list_checkpoints(checkpoint_dir) if from_day is None or c[1] <= from_day]
+    return checkpoints[-1] if checkpoints else None
+
+
+def clear_checkpoints(checkpoint_dir: str):
+    """
+    Removes a fragment's checkpoints and its complete marker, so a new run doesn't leave a mix of old and new ones
+    """
+    if not os.path.isdir(checkpoint_dir):
+        return
+    for filename in os.listdir(checkpoint_dir):
+        if filename == COMPLETE_MARKER or CHECKPOINT_FILE.fullmatch(filename.removesuffix(".partial")):
+            os.remove(os.path.join(checkpoint_dir, filename))
+
+
+def mark_complete(checkpoint_dir: str):
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    with open(os.path.join(checkpoint_dir, COMPLETE_MARKER), "w"):
+        pass
+
+
+def is_complete(checkpoint_dir: str) -> bool:
+    return os.path.exists(os.path.join(checkpoint_dir, COMPLETE_MARKER))
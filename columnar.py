@@ -0,0 +1,335 @@
+import json
+import os
+from enum import Enum, unique
+from glob import glob
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from output import ROW_FIELDS, SaveCsv
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    # optional - without it the columnar files are .npz
+    pyarrow = None
+
+COLUMNAR_DIR = "roll_data/columnar"
+EXTENSION = ".parquet" if pyarrow is not None else ".npz"
+# compacted files are named like this, one per season, next to the per-fragment files
+SEASON_FILE_PREFIX = "season-"
+# the run that wrote each row, so compacting a fragment again replaces its rows instead of adding them twice
+RUN_COLUMN = "run_name"
+
+
+@unique
+class ColumnKind(Enum):
+    FLOAT = "float"
+    INT = "int"
+    BOOL = "bool"
+    STRING = "string"
+    # strings with few distinct values - stored as codes into a list of categories
+    CATEGORY = "category"
+    INT_LIST = "int_list"
+
+
+# everything not in here is a *_digest column, which is a CATEGORY
+ROW_KINDS = {
+    "event_type": ColumnKind.CATEGORY,
+    "event_time": ColumnKind.STRING,
+    "roll": ColumnKind.FLOAT,
+    "passed": ColumnKind.BOOL,
+    "batting_team_hype": ColumnKind.FLOAT,
+    "pitching_team_hype": ColumnKind.FLOAT,
+    "game_id": ColumnKind.CATEGORY,
+    "play_count": ColumnKind.INT,
+    "ball_count": ColumnKind.INT,
+    "strike_count": ColumnKind.INT,
+    "out_count": ColumnKind.INT,
+    "home_score": ColumnKind.FLOAT,
+    "away_score": ColumnKind.FLOAT,
+    "inning": ColumnKind.INT,
+    "baserunner_count": ColumnKind.INT,
+    "baserunners": ColumnKind.INT_LIST,
+    "baserunners_next": ColumnKind.INT_LIST,
+    "is_strike": ColumnKind.BOOL,
+    "strike_roll": ColumnKind.FLOAT,
+    "strike_threshold": ColumnKind.FLOAT,
+    "fielder_roll": ColumnKind.FLOAT,
+    "batter_consecutive_hits": ColumnKind.INT,
+    "weather": ColumnKind.INT,
+    "season": ColumnKind.INT,
+    "day": ColumnKind.INT,
+    "runner_count": ColumnKind.INT,
+    "top_of_inning": ColumnKind.BOOL,
+    "is_maximum_blaseball": ColumnKind.BOOL,
+    "batter_at_bats": ColumnKind.INT,
+}
+assert list(ROW_KINDS) == ROW_FIELDS
+
+ITEM_KINDS = {
+    "season": ColumnKind.INT,
+    "day": ColumnKind.INT,
+    "roll_type": ColumnKind.CATEGORY,
+    "category": ColumnKind.CATEGORY,
+    "element": ColumnKind.CATEGORY,
+    "roll": ColumnKind.FLOAT,
+    "prefix_index": ColumnKind.INT,
+}
+
+Columns = Dict[str, List[Any]]
+Kinds = Dict[str, ColumnKind]
+
+
+def _write_parquet(path: str, columns: Columns, kinds: Kinds):
+    arrow_types = {
+        ColumnKind.FLOAT: pyarrow.float64(),
+        ColumnKind.INT: pyarrow.int64(),
+        ColumnKind.BOOL: pyarrow.bool_(),
+        ColumnKind.STRING: pyarrow.string(),
+        ColumnKind.CATEGORY: pyarrow.string(),
+        ColumnKind.INT_LIST: pyarrow.list_(pyarrow.int8()),
+    }
+    arrays = []
+    for name, values in columns.items():
+        array = pyarrow.array(values, arrow_types[kinds[name]])
+        if kinds[name] == ColumnKind.CATEGORY:
+            array = array.dictionary_encode()
+        arrays.append(array)
+    table = pyarrow.Table.from_arrays(arrays, names=list(columns))
+    table = table.replace_schema_metadata({"resim_kinds": json.dumps({k: v.value for k, v in kinds.items()})})
+    pyarrow.parquet.write_table(table, path)
+
+
+def _read_parquet(path: str) -> Tuple[Columns, Kinds]:
+    table = pyarrow.parquet.read_table(path)
+    kinds = {k: ColumnKind(v) for k, v in json.loads(table.schema.metadata[b"resim_kinds"]).items()}
+    return table.to_pydict(), kinds
+
+
+def _write_npz(path: str, columns: Columns, kinds: Kinds):
+    arrays = {"__kinds__": np.array(json.dumps({k: v.value for k, v in kinds.items()}))}
+    for name, values in columns.items():
+        kind = kinds[name]
+        if kind == ColumnKind.FLOAT:
+            arrays[name] = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+        elif kind == ColumnKind.INT:
+            if None in values:
+                # same as pandas does with a missing int
+                arrays[name] = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+            else:
+                arrays[name] = np.array(values, dtype=np.int64)
+        elif kind == ColumnKind.BOOL:
+            # -1 is missing
+            arrays[name] = np.array([-1 if v is None else v for v in values], dtype=np.int8)
+        elif kind == ColumnKind.STRING:
+            arrays[name] = np.array(values, dtype=np.str_)
+        elif kind == ColumnKind.CATEGORY:
+            categories = sorted({v for v in values if v is not None})
+            codes = {category: i for i, category in enumerate(categories)}
+            arrays[name] = np.array([-1 if v is None else codes[v] for v in values], dtype=np.int32)
+            arrays[name + ".categories"] = np.array(categories, dtype=np.str_)
+        elif kind == ColumnKind.INT_LIST:
+            lengths = [-1 if v is None else len(v) for v in values]
+            arrays[name] = np.array(lengths, dtype=np.int16)  # -1 is missing
+            arrays[name + ".values"] = np.array([x for v in values if v is not None for x in v], dtype=np.int8)
+
+    with open(path, "wb") as f:
+        np.savez_compressed(f, **arrays)
+
+
+def _read_npz(path: str) -> Tuple[Columns, Kinds]:
+    with np.load(path, allow_pickle=False) as npz:
+        kinds = {k: ColumnKind(v) for k, v in json.loads(str(npz["__kinds__"])).items()}
+        columns = {}
+        for name, kind in kinds.items():
+            array = npz[name]
+            if kind == ColumnKind.INT and array.dtype == np.float64:
+                columns[name] = [None if np.isnan(v) else int(v) for v in array]
+            elif kind == ColumnKind.FLOAT:
+                columns[name] = [None if np.isnan(v) else v for v in array.tolist()]
+            elif kind == ColumnKind.BOOL:
+                columns[name] = [None if v == -1 else bool(v) for v in array.tolist()]
+            elif kind == ColumnKind.CATEGORY:
+                categories = npz[name + ".categories"].tolist()
+                columns[name] = [None if v == -1 else categories[v] for v in array.tolist()]
+            elif kind == ColumnKind.INT_LIST:
+                flat = npz[name + ".values"].tolist()
+                values = []
+                offset = 0
+                for length in array.tolist():
+                    if length == -1:
+                        values.append(None)
+                    else:
+                        values.append(flat[offset : offset + length])
+                        offset += length
+                columns[name] = values
+            else:
+                columns[name] = array.tolist()
+    return columns, kinds
+
+
+def write_columns(path: str, columns: Columns, kinds: Kinds):
+    """
+    Writes a table to a .parquet or .npz (whichever the path ends with), via a .partial file
+    """
+    partial_path = f"{path}.partial"
+    if path.endswith(".parquet"):
+        _write_parquet(partial_path, columns, kinds)
+    else:
+        _write_npz(partial_path, columns, kinds)
+    os.replace(partial_path, path)
+
+
+def read_columns(path: str) -> Tuple[Columns, Kinds]:
+    """
+    Reads a table written by write_columns back into python lists, with None for missing values
+    """
+    if path.endswith(".parquet"):
+        return _read_parquet(path)
+    return _read_npz(path)
+
+
+class SaveColumnar(SaveCsv):
+    """
+    SaveCsv that writes typed columns instead of csv text: roll_data/columnar/<category>/<run>.parquet
+    (or .npz without pyarrow). The whole fragment is kept in column lists on the writer thread and written on close.
+    """
+
+    def __init__(self, run_name: str, category_name: str, *args, **kwargs):
+        super().__init__(run_name, category_name, *args, **kwargs)
+        self.final_filename = f"{COLUMNAR_DIR}/{category_name}/{run_name}{EXTENSION}"
+        self.run_name = run_name
+        self.columns: Columns = {}
+        self.kinds: Kinds = {}
+        self.row_count = 0
+
+    def _add_column(self, name: str, kind: ColumnKind):
+        self.kinds[name] = kind
+        # rows before this column showed up don't have it
+        self.columns[name] = [None] * self.row_count
+
+    def _write_rows(self, rows):
+        # runs on the writer thread
+        if not self.columns:
+            for name, kind in ROW_KINDS.items():
+                self._add_column(name, kind)
+            self._add_column("stadium_digest", ColumnKind.CATEGORY)
+            self._add_column(RUN_COLUMN, ColumnKind.CATEGORY)
+
+        digests = self.store.digests
+        value_columns = [self.columns[name] for name in ROW_FIELDS]
+        runs = self.columns[RUN_COLUMN]
+        for values, objects in rows:
+            for column, value in zip(value_columns, values):
+                column.append(value)
+            runs.append(self.run_name)
+            for key, ref in objects:
+                if key not in self.columns:
+                    self._add_column(key, ColumnKind.CATEGORY)
+                self.columns[key].append(digests[ref])
+            self.row_count += 1
+            # objects that aren't in this row
+            for column in self.columns.values():
+                if len(column) < self.row_count:
+                    column.append(None)
+
+        # enums (weather) go in as their value
+        weather = self.columns["weather"]
+        for i in range(self.row_count - len(rows), self.row_count):
+            if weather[i] is not None:
+                weather[i] = int(weather[i])
+
+    def _write_item_row(self, row):
+        # runs on the writer thread
+        if not self.columns:
+            for name in row:
+                self._add_column(name, ITEM_KINDS[name])
+            self._add_column(RUN_COLUMN, ColumnKind.CATEGORY)
+        for name, value in row.items():
+            self.columns[name].append(value)
+        self.columns[RUN_COLUMN].append(self.run_name)
+        self.row_count += 1
+
+    def _close(self):
+        # runs on the writer thread
+        self.store.flush()
+        if not self.row_count:
+            return
+        os.makedirs(os.path.dirname(self.final_filename), exist_ok=True)
+        write_columns(self.final_filename, self.columns, self.kinds)
+        self.columns = {}
+
+
+def concat_tables(tables: List[Tuple[Columns, Kinds]]) -> Tuple[Columns, Kinds]:
+    kinds: Kinds = {}
+    for _, table_kinds in tables:
+        kinds.update(table_kinds)
+    columns: Columns = {name: [] for name in kinds}
+    for table_columns, _ in tables:
+        row_count = len(next(iter(table_columns.values()), []))
+        for name, column in columns.items():
+            column.extend(table_columns.get(name, [None] * row_count))
+    return columns, kinds
+
+
+def merge_runs(paths: List[str], out_path: str, run_name: str):
+    """
+    Puts the files of a fragment's segments together into the file one run of the whole fragment would have written
+    """
+    columns, kinds = concat_tables([read_columns(path) for path in paths])
+    if RUN_COLUMN in columns:
+        columns[RUN_COLUMN] = [run_name] * len(columns[RUN_COLUMN])
+    write_columns(out_path, columns, kinds)
+
+
+def _take_rows(columns: Columns, rows: List[int]) -> Columns:
+    return {name: [column[i] for i in rows] for name, column in columns.items()}
+
+
+def compact(category_dir: str) -> Dict[int, int]:
+    """
+    Merges the per-fragment files in one category's directory into one file per season, adding to the season files
+    from earlier compactions. Rows a season file already has from the same run are replaced, so compacting a
+    fragment that was run again doesn't count it twice. Returns the number of rows in each season that got new rows.
+    """
+    fragment_paths = [
+        path
+        for path in sorted(glob(os.path.join(category_dir, "*" + EXTENSION)))
+        if not os.path.basename(path).startswith(SEASON_FILE_PREFIX)
+    ]
+    if not fragment_paths:
+        return {}
+
+    by_season: Dict[int, List[Tuple[Columns, Kinds]]] = {}
+    runs = set()
+    for path in fragment_paths:
+        columns, kinds = read_columns(path)
+        if RUN_COLUMN not in columns:
+            # written before the run column was, the file is named after its run
+            columns[RUN_COLUMN] = [os.path.basename(path)[: -len(EXTENSION)]] * len(columns["season"])
+            kinds[RUN_COLUMN] = ColumnKind.CATEGORY
+        runs.update(columns[RUN_COLUMN])
+        seasons = columns["season"]
+        for season in sorted(set(seasons)):
+            rows = [i for i, row_season in enumerate(seasons) if row_season == season]
+            by_season.setdefault(season, []).append((_take_rows(columns, rows), kinds))
+
+    row_counts = {}
+    for season, tables in by_season.items():
+        season_path = os.path.join(category_dir, f"{SEASON_FILE_PREFIX}{season}{EXTENSION}")
+        if os.path.exists(season_path):
+            columns, kinds = read_columns(season_path)
+            # season files from before the run column have None here, those rows can't be matched to a run
+            season_runs = columns.get(RUN_COLUMN, [None] * len(columns["season"]))
+            rows = [i for i, run in enumerate(season_runs) if run not in runs]
+            tables.insert(0, (_take_rows(columns, rows), kinds))
+        columns, kinds = concat_tables(tables)
+        write_columns(season_path, columns, kinds)
+        row_counts[season] = len(columns["season"])
+
+    # only once every season file has everything from them
+    for path in fragment_paths:
+        os.remove(path)
+    return row_counts
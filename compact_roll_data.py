@@ -0,0 +1,23 @@
+import os
+from argparse import ArgumentParser
+from glob import glob
+
+from columnar import COLUMNAR_DIR, compact
+
+
+def main():
+    parser = ArgumentParser(description="Merges per-fragment columnar roll data into one file per season and category")
+    parser.add_argument("--dir", default=COLUMNAR_DIR, help="Directory run.py --roll-format columnar wrote to")
+    parser.add_argument("--category", nargs="+", default=None, help="Only compact these categories. Default is all")
+    args = parser.parse_args()
+
+    for category_dir in sorted(glob(os.path.join(args.dir, "*", ""))):
+        category = os.path.basename(os.path.dirname(category_dir))
+        if args.category and category not in args.category:
+            continue
+        for season, rows in sorted(compact(category_dir).items()):
+            print(f"{category} season {season}: {rows} rows")
+
+
+if __name__ == "__main__":
+    main()
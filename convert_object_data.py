@@ -0,0 +1,86 @@
+import csv
+import json
+import os
+from argparse import ArgumentParser
+from glob import glob
+
+from tqdm import tqdm
+
+from object_store import OBJECT_STORE_FILE, ObjectStore
+
+
+def import_objects(store: ObjectStore, object_dir: str):
+    """
+    Puts every object_data/<run>/<id>-<time>.json file into the store.
+    Returns the digest for each file, by the path the csvs use for it.
+    """
+    digests = {}
+    for path in tqdm(sorted(glob(os.path.join(object_dir, "*", "*.json"))), unit="objects"):
+        with open(path, "r") as f:
+            obj = json.load(f)
+        run_dir, filename = os.path.split(path)
+        # what SaveCsv wrote in the *_file columns, wherever the directory is now
+        digests[f"object_data/{os.path.basename(run_dir)}/{filename}"] = store.add(obj["type"], obj["data"])
+    store.flush()
+    return digests
+
+
+def convert_csv(path: str, digests):
+    """
+    Rewrites a roll csv's *_file columns into *_digest columns. Returns False if there was nothing to convert.
+    """
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None or not any(name.endswith("_file") for name in header):
+            return False
+        file_columns = [i for i, name in enumerate(header) if name.endswith("_file")]
+
+        partial_path = f"{path}.partial"
+        with open(partial_path, "w", newline="", encoding="utf-8") as out:
+            writer = csv.writer(out)
+            writer.writerow(name[: -len("_file")] + "_digest" if name.endswith("_file") else name for name in header)
+            for row in reader:
+                for i in file_columns:
+                    if row[i]:
+                        if row[i] not in digests:
+                            raise ValueError(f"{path} refers to {row[i]}, which isn't in the object data")
+                        row[i] = digests[row[i]]
+                writer.writerow(row)
+
+    os.replace(partial_path, path)
+    return True
+
+
+def main():
+    parser = ArgumentParser(
+        description="Moves object_data/<run>/*.json into the object store, and points the roll csvs at it"
+    )
+    parser.add_argument("--object-data", default="object_data", help="Directory with the per-run object files")
+    parser.add_argument("--roll-data", default="roll_data", help="Directory with the roll csvs to convert")
+    parser.add_argument("--store", default=OBJECT_STORE_FILE, help="Object store to add the objects to")
+    parser.add_argument(
+        "--delete", action="store_true", help="Delete the json files once everything has been converted"
+    )
+    args = parser.parse_args()
+
+    store = ObjectStore(args.store)
+    digests = import_objects(store, args.object_data)
+    store.close()
+    print(f"{len(digests)} object files, {len(set(digests.values()))} distinct objects")
+
+    converted = 0
+    for path in tqdm(sorted(glob(os.path.join(args.roll_data, "*.csv"))), unit="csvs"):
+        converted += convert_csv(path, digests)
+    print(f"converted {converted} csvs")
+
+    if args.delete:
+        for path in glob(os.path.join(args.object_data, "*", "*.json")):
+            os.remove(path)
+        for run_dir in glob(os.path.join(args.object_data, "*", "")):
+            if not os.listdir(run_dir):
+                os.rmdir(run_dir)
+
+
+if __name__ == "__main__":
+    main()
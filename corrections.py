@@ -0,0 +1,125 @@
+import json
+import os
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from data import Mod, ModType
+
+CORRECTIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corrections.json")
+
+
+@dataclass
+class GameModCorrection:
+    mod: Mod
+    mod_type: ModType
+    # whether the team/player should have the mod or not
+    present: bool
+    team_id: Optional[str] = None
+    player_id: Optional[str] = None
+    also_remove: List[Mod] = field(default_factory=list)
+    # set last_update_time on the team/player when changing it
+    touch: bool = True
+
+
+@dataclass
+class EventCorrections:
+    """
+    Every manual fix that applies to one event. Shared between events and resims, so don't modify it.
+    """
+
+    rng_step: Optional[int] = None
+    game_mods: List[GameModCorrection] = field(default_factory=list)
+    # play -> (play to take the update from instead, fields to set on it)
+    replacement_updates: Dict[int, Tuple[int, Dict[str, Any]]] = field(default_factory=dict)
+    use_previous_update: bool = False
+    update_fields: Dict[str, Any] = field(default_factory=dict)
+    is_strike: Optional[bool] = None
+    # player ids
+    item_broken: FrozenSet[str] = frozenset()
+    item_damage_results: Dict[str, bool] = field(default_factory=dict)
+    flags: FrozenSet[str] = frozenset()
+
+
+NO_CORRECTIONS = EventCorrections()
+
+
+class Corrections:
+    """
+    The data fixes from corrections.json, indexed by event timestamp and game id.
+    """
+
+    def __init__(self, raw: Dict[str, Any]):
+        by_time: Dict[str, Dict[str, Any]] = {}
+        by_game: Dict[str, Dict[str, Any]] = {}
+
+        def at_time(entry):
+            return by_time.setdefault(entry["created"], {})
+
+        def for_game(entry):
+            return by_game.setdefault(entry["game_id"], {})
+
+        for entry in raw["rng_steps"]["entries"]:
+            at_time(entry)["rng_step"] = entry["steps"]
+        for entry in raw["use_previous_update"]["entries"]:
+            at_time(entry)["use_previous_update"] = True
+        for entry in raw["update_fields"]["entries"]:
+            at_time(entry)["update_fields"] = entry["fields"]
+        for entry in raw["strike_results"]["entries"]:
+            at_time(entry)["is_strike"] = entry["is_strike"]
+        for entry in raw["item_broken"]["entries"]:
+            corrections = at_time(entry)
+            corrections["item_broken"] = corrections.get("item_broken", frozenset()) | {entry["player_id"]}
+        for entry in raw["item_damage_results"]["entries"]:
+            at_time(entry).setdefault("item_damage_results", {})[entry["player_id"]] = entry["successful"]
+        for flag, flagged in raw["flags"].items():
+            for entry in flagged["entries"]:
+                corrections = at_time(entry)
+                corrections["flags"] = corrections.get("flags", frozenset()) | {flag}
+
+        for entry in raw["game_mods"]["entries"]:
+            for_game(entry).setdefault("game_mods", []).append(
+                GameModCorrection(
+                    mod=Mod(entry["mod"]),
+                    mod_type=ModType[entry["type"]],
+                    present=entry["present"],
+                    team_id=entry.get("team_id"),
+                    player_id=entry.get("player_id"),
+                    also_remove=[Mod(mod) for mod in entry.get("also_remove", [])],
+                    touch=entry.get("touch", True),
+                )
+            )
+        for entry in raw["replacement_updates"]["entries"]:
+            for_game(entry).setdefault("replacement_updates", {})[entry["play"]] = (
+                entry["source_play"],
+                entry.get("fields", {}),
+            )
+
+        self.by_time = {timestamp: EventCorrections(**fields) for timestamp, fields in by_time.items()}
+        self.by_game = {game_id: EventCorrections(**fields) for game_id, fields in by_game.items()}
+        self.merged: Dict[Tuple[str, str], EventCorrections] = {}
+
+    def lookup(self, timestamp: str, game_id: Optional[str]) -> EventCorrections:
+        at_time = self.by_time.get(timestamp)
+        for_game = self.by_game.get(game_id)
+        if for_game is None:
+            return at_time or NO_CORRECTIONS
+        if at_time is None:
+            return for_game
+
+        key = (timestamp, game_id)
+        merged = self.merged.get(key)
+        if merged is None:
+            merged = replace(at_time, game_mods=for_game.game_mods, replacement_updates=for_game.replacement_updates)
+            self.merged[key] = merged
+        return merged
+
+
+_corrections: Optional[Corrections] = None
+
+
+def get_corrections() -> Corrections:
+    global _corrections
+    if _corrections is None:
+        with open(CORRECTIONS_FILE, encoding="utf-8") as f:
+            _corrections = Corrections(json.load(f))
+    return _corrections
@@ -1,13 +1,17 @@
 import collections
+from array import array
 from dataclasses import dataclass, field
+import hashlib
 import os
 import json
+import pickle
+import time
 import requests
 from dataclasses_json import DataClassJsonMixin, config
 from typing import Any, List, Dict, Iterable, Mapping, Optional, Set, Union, ClassVar
 from datetime import datetime, timedelta
 from enum import Enum, IntEnum, auto, unique
-from sin_values import SIN_PHASES
+from sin_values import SIN_PHASE_ROWS
 
 EXCLUDE_FROM_CACHE = {
     "team": {"runs", "wins", "eDensity"},
@@ -46,6 +50,15 @@ stat_indices = [
 ]
 
 
+def _stat_attr(stat: str) -> str:
+    return "ground_friction" if stat == "groundFriction" else stat
+
+
+STAT_INDEX = {stat: i for i, stat in enumerate(stat_indices)}
+STAT_ATTR_INDEX = {_stat_attr(stat): i for i, stat in enumerate(stat_indices)}
+STAT_ATTRS = list(STAT_ATTR_INDEX)
+
+
 def offset_timestamp(timestamp: str, delta_secs: float) -> str:
     timestamp = timestamp.replace("Z", "+00:00")
     dt = datetime.fromisoformat(timestamp)
@@ -54,10 +67,15 @@ def offset_timestamp(timestamp: str, delta_secs: float) -> str:
     return timestamp.replace("+00:00", "Z")
 
 
-def get_cached(key, url):
-    key = key.replace(":", "_")
+def _cache_path(key):
+    return os.path.join("cache", key.replace(":", "_") + ".json")
+
 
-    path = os.path.join("cache", key + ".json")
+def get_cached(key, url, on_write=None):
+    """
+    on_write(path, data) is called after a fresh download has been written to the cache
+    """
+    path = _cache_path(key)
     if not os.path.exists(os.path.dirname(path)):
         os.makedirs(os.path.dirname(path))
 
@@ -71,9 +89,50 @@ def get_cached(key, url):
     data = requests.get(url).json()
     with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f)
+    if on_write is not None:
+        on_write(path, data)
     return data
 
 
+def _source_version() -> str:
+    with open(__file__, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()[:16]
+
+
+# parsed entity snapshots are only valid for the code that built them, so the
+# pickles are keyed on this as well as on the snapshot key
+PARSED_CACHE_VERSION = _source_version()
+
+
+def get_cached_parsed(key, url, build, tag):
+    """
+    Like get_cached, but caches the result of build(data) as a pickle instead
+    of re-parsing the JSON (and re-constructing every entity) on each run.
+    Returns (value, was_hit).
+    """
+    key = key.replace(":", "_")
+
+    path = os.path.join("cache", "parsed", f"{key}-{tag}.pickle")
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            try:
+                version, value = pickle.load(f)
+                if version == PARSED_CACHE_VERSION:
+                    return value, True
+            except (pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+                pass
+
+    value = build(get_cached(key, url))
+    if not os.path.exists(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    # write-then-rename so parallel fragments never see a half-written pickle
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump((PARSED_CACHE_VERSION, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return value, False
+
+
 @unique
 class Mod(Enum):
     """
@@ -188,14 +247,97 @@ class Mod(Enum):
         return self.value
 
 
+# Mods are interned to single-bit ints so entities can keep them as bitmasks. Mods in the enum get
+# fixed bits; anything else gets the next free bit the first time it's seen, which is per-process,
+# so masks must never be persisted (see ModsMixin.__setstate__).
+_MOD_BITS: Dict[Union[Mod, str], int] = {}
+_MODS_BY_BIT: Dict[int, Union[Mod, str]] = {}
+
+
+def mod_bit(mod: Union[Mod, str]) -> int:
+    bit = _MOD_BITS.get(mod)
+    if bit is None:
+        name = str(mod)
+        bit = _MOD_BITS.get(name)
+        if bit is None:
+            bit = 1 << len(_MODS_BY_BIT)
+            _MOD_BITS[name] = bit
+            _MODS_BY_BIT[bit] = Mod.coerce(name) or name
+        _MOD_BITS[mod] = bit
+    return bit
+
+
+def mods_mask(*mods: Union[Mod, str]) -> int:
+    mask = 0
+    for mod in mods:
+        mask |= mod_bit(mod)
+    return mask
+
+
+def iter_mask(mask: int):
+    """Yields the mods set in mask, as Mod members where possible."""
+    while mask:
+        bit = mask & -mask
+        yield _MODS_BY_BIT[bit]
+        mask ^= bit
+
+
+for _mod in Mod:
+    mod_bit(_mod)
+
+
+# (key, events) of the last feed range loaded in this process. Every segment of a fragment reads the same feed, and
+# a pool worker often gets several of them in a row. Resim only ever replaces an event's type with the EventType,
+# so handing out the same events again is fine
+_last_feed = (None, None)
+
+
 def get_feed_between(start, end):
+    global _last_feed
     key = f"feed_range_{start}_{end}"
+    if _last_feed[0] == key:
+        return _last_feed[1]
     resp = get_cached(
-        key, f"https://api.sibr.dev/eventually/v2/events?after={start}&before={end}&sortorder=asc&limit=200000"
+        key,
+        f"https://api.sibr.dev/eventually/v2/events?after={start}&before={end}&sortorder=asc&limit=200000",
+        on_write=_write_feed_meta,
     )
+    _last_feed = (key, resp)
     return resp
 
 
+def _feed_meta_path(path):
+    return path[: -len(".json")] + ".meta.json"
+
+
+def _write_feed_meta(path, events):
+    meta = {
+        "count": len(events),
+        "first_timestamp": events[0]["created"] if events else None,
+        "last_timestamp": events[-1]["created"] if events else None,
+        "size": os.path.getsize(path),
+    }
+    with open(_feed_meta_path(path), "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    return meta
+
+
+def get_feed_meta(start, end) -> Dict[str, Any]:
+    """
+    Event count, first/last timestamps and byte size of a feed range, from the small file written next to it in the
+    cache. Only feeds cached before these existed (or changed since) get parsed, once.
+    """
+    path = _cache_path(f"feed_range_{start}_{end}")
+    try:
+        with open(_feed_meta_path(path), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta["size"] == os.path.getsize(path):
+            return meta
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        pass
+    return _write_feed_meta(path, get_feed_between(start, end))
+
+
 def get_game_feed(game_id):
     key = f"feed_game_{game_id}"
     resp = get_cached(key, f"https://api.sibr.dev/eventually/v2/events?gameTags={game_id}&sortorder=asc&limit=1000")
@@ -489,12 +631,50 @@ def mods_by_type_decoder(raw: Dict[str, List[str]]):
 def weather_dict_decoder(raw: Dict[str, int]):
     return {Weather(int(k)): v for k, v in raw.items()}
 
-@dataclass
-class TeamOrPlayerMods(DataClassJsonMixin):
-    mods: Set[str]
-    # Used internally only
-    _mods_by_type: Dict[ModType, Set[str]] = field(metadata=config(decoder=mods_by_type_decoder))
-    _raw_mods: tuple[list, list, list, list, list] # needed for psychoacoustics mod ordering
+
+# how many times any entity has changed, in one list so other modules can read the current count without going
+# through this module. formulas.FormulaContext drops what it's memoized when this moves
+ENTITY_CHANGES = [0]
+
+
+class ContentDigestMixin:
+    """
+    Gives entities a digest of the fields that matter for cache equivalence (_digest_fields),
+    so comparing a fresh snapshot against the previous version is one string comparison.
+    The digest is computed on first use (the snapshot cache computes it up front, so it gets
+    pickled along with the object) and dropped on any attribute assignment. Resim always sets
+    last_update_time after editing lists like lineups in place, so that drops it too.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != "_digest":
+            object.__setattr__(self, "_digest", None)
+            ENTITY_CHANGES[0] += 1
+
+    @property
+    def digest(self) -> str:
+        digest = getattr(self, "_digest", None)
+        if digest is None:
+            digest = hashlib.blake2b(repr(self._digest_fields()).encode(), digest_size=16).hexdigest()
+            object.__setattr__(self, "_digest", digest)
+        return digest
+
+    def _digest_fields(self) -> tuple:
+        raise NotImplementedError
+
+    def is_cache_equivalent(self, other) -> bool:
+        return self.digest == other.digest
+
+
+class ModsMixin:
+    # Mod handling shared by the dataclasses below and CompactPlayerData, which can't inherit
+    # from a dataclass and still use __slots__.
+    # _mods_by_type and _raw_mods are the source of truth (and what gets serialized), _mod_masks
+    # mirrors _mods_by_type as one bitmask per ModType and _mod_mask is their union.
+    __slots__ = ()
 
     @classmethod
     def mods_init_args(cls, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -511,42 +691,87 @@ class TeamOrPlayerMods(DataClassJsonMixin):
         raw_mods = (data.get("permAttr", []), data.get("seasAttr", []), data.get("weekAttr", []), data.get("gameAttr", []), data.get("itemAttr", []))
         return dict(_mods_by_type=mods_by_type, _raw_mods=raw_mods, mods=cls._concatenate_mods(mods_by_type))
 
+    def _init_mod_masks(self):
+        self._mod_masks = [0] * len(ModType)
+        for mod_type, mods in self._mods_by_type.items():
+            self._mod_masks[mod_type] = mods_mask(*mods)
+        self._mod_mask = mods_mask(*self.mods)
+
+    def __setstate__(self, state):
+        # bits for mods outside the enum depend on the process, so rebuild the masks after unpickling
+        dict_state, slot_state = state if isinstance(state, tuple) else (state, None)
+        state = {**(dict_state or {}), **(slot_state or {})}
+        for key, value in state.items():
+            object.__setattr__(self, key, value)
+        self._init_mod_masks()
+        # the masks aren't part of the digest, so keep the pickled one
+        object.__setattr__(self, "_digest", state.get("_digest"))
+
     def add_mod(self, mod: Union[Mod, str], mod_type: ModType):
-        mod = str(mod)
-        if mod in self._mods_by_type[mod_type]:
+        bit = mod_bit(mod)
+        if self._mod_masks[mod_type] & bit:
             return
+        mod = str(mod)
         self._mods_by_type[mod_type].add(mod)
-        self._raw_mods[int(mod_type)].append(str(mod))
-        self._update_mods()
+        self._raw_mods[int(mod_type)].append(mod)
+        self._mod_masks[mod_type] |= bit
+        self._mod_mask |= bit
+        self.mods.add(mod)
 
     def remove_mod(self, mod: Union[Mod, str], mod_type: ModType):
-        mod = str(mod)
-        if mod not in self._mods_by_type[mod_type]:
+        bit = mod_bit(mod)
+        if not self._mod_masks[mod_type] & bit:
             return
+        mod = str(mod)
         self._mods_by_type[mod_type].remove(mod)
-        self._raw_mods[int(mod_type)].remove(str(mod))
+        self._raw_mods[int(mod_type)].remove(mod)
+        self._mod_masks[mod_type] &= ~bit
         self._update_mods()
+        if not self._mod_mask & bit:
+            # might still be there from another mod type
+            self.mods.discard(mod)
 
     def has_mod(self, mod: Union[Mod, str], mod_type: Optional[ModType] = None) -> bool:
-        mod = str(mod)
+        bit = _MOD_BITS.get(mod) or mod_bit(mod)
         if mod_type is None:
-            return mod in self.mods
-        return mod in self._mods_by_type[mod_type]
+            return bool(self._mod_mask & bit)
+        return bool(self._mod_masks[mod_type] & bit)
 
     def has_any(self, *mods: Mod) -> bool:
-        return any(self.has_mod(mod) for mod in mods)
+        return bool(self._mod_mask & mods_mask(*mods))
+
+    def has_any_mask(self, mask: int) -> bool:
+        return bool(self._mod_mask & mask)
+
+    def iter_mods(self, mask: int = -1):
+        """Yields this entity's mods that are in mask. Known mods come out as Mod members."""
+        return iter_mask(self._mod_mask & mask)
 
     def print_mods(self, mod_type: Optional[ModType] = None) -> str:
         return str(list(self._mods_by_type.get(mod_type) if mod_type is not None else self.mods))
 
     def _update_mods(self):
-        self.mods = self._concatenate_mods(self._mods_by_type)
+        mask = 0
+        for type_mask in self._mod_masks:
+            mask |= type_mask
+        self._mod_mask = mask
 
     @staticmethod
     def _concatenate_mods(mods_by_type: Dict[ModType, Set[str]]) -> Set[str]:
         return set().union(*mods_by_type.values())
 
 
+@dataclass
+class TeamOrPlayerMods(ContentDigestMixin, ModsMixin, DataClassJsonMixin):
+    mods: Set[str]
+    # Used internally only
+    _mods_by_type: Dict[ModType, Set[str]] = field(metadata=config(decoder=mods_by_type_decoder))
+    _raw_mods: tuple[list, list, list, list, list] # needed for psychoacoustics mod ordering
+
+    def __post_init__(self):
+        self._init_mod_masks()
+
+
 @dataclass
 class TeamData(TeamOrPlayerMods):
     object_type: ClassVar[str] = "team"
@@ -582,18 +807,16 @@ class TeamData(TeamOrPlayerMods):
 
         return team_data
 
-    def is_cache_equivalent(self, other: "TeamData") -> bool:
+    def _digest_fields(self) -> tuple:
         return (
-            self.id == other.id
-            and
+            self.id,
             # Excluding last update time
-            self.lineup == other.lineup
-            and self.rotation == other.rotation
-            and self.shadows == other.shadows
-            and
+            self.lineup,
+            self.rotation,
+            self.shadows,
             # Excluding eDensity
-            self.level == other.level
-            and self.nickname == other.nickname
+            self.level,
+            self.nickname,
             # Excluding rotation slot
         )
 
@@ -617,7 +840,7 @@ TeamData.null = TeamData.make_null()
 
 
 @dataclass
-class StadiumData(DataClassJsonMixin):
+class StadiumData(ContentDigestMixin, DataClassJsonMixin):
     object_type: ClassVar[str] = "stadium"
     null: ClassVar["StadiumData"]
     id: Optional[str]
@@ -638,12 +861,27 @@ class StadiumData(DataClassJsonMixin):
     hype: float
     weather: Dict[Weather, int] = field(metadata=config(decoder=weather_dict_decoder))
 
-    def has_mod(self, mod: Mod) -> bool:
-        return mod.value in self.mods
-    
+    def __post_init__(self):
+        # not a field, see ModsMixin
+        self._mod_mask = mods_mask(*self.mods)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._mod_mask = mods_mask(*self.mods)
+        object.__setattr__(self, "_digest", state.get("_digest"))
+
+    def has_mod(self, mod: Union[Mod, str]) -> bool:
+        return bool(self._mod_mask & (_MOD_BITS.get(mod) or mod_bit(mod)))
+
+    def add_mod(self, mod: Union[Mod, str]):
+        mod = str(mod)
+        self.mods.add(mod)
+        self._mod_mask |= mod_bit(mod)
+
     def remove_mod(self, mod: Union[Mod, str]):
         mod = str(mod)
         self.mods.remove(mod)
+        self._mod_mask &= ~mod_bit(mod)
 
     def print_mods(self) -> str:
         return list(set(self.mods))
@@ -676,26 +914,24 @@ class StadiumData(DataClassJsonMixin):
 
         return stadium_data
 
-    def is_cache_equivalent(self, other: "StadiumData") -> bool:
+    def _digest_fields(self) -> tuple:
         return (
-            self.id == other.id
-            and
+            self.id,
             # Excluding last update time
-            self.mods == other.mods
-            and self.weather == other.weather
-            and self.name == other.name
-            and self.nickname == other.nickname
-            and self.mysticism == other.mysticism
-            and self.viscosity == other.viscosity
-            and self.elongation == other.elongation
-            and
+            sorted(self.mods),
+            sorted((int(weather), value) for weather, value in self.weather.items()),
+            self.name,
+            self.nickname,
+            self.mysticism,
+            self.viscosity,
+            self.elongation,
             # Excluding filthiness
-            self.obtuseness == other.obtuseness
-            and self.forwardness == other.forwardness
-            and self.grandiosity == other.grandiosity
-            and self.ominousness == other.ominousness
-            and self.fortification == other.fortification
-            and self.inconvenience == other.inconvenience
+            self.obtuseness,
+            self.forwardness,
+            self.grandiosity,
+            self.ominousness,
+            self.fortification,
+            self.inconvenience,
             # Excluding hype
         )
 
@@ -766,6 +1002,20 @@ class ItemData:
             elements=elements,
         )
 
+    def digest_fields(self) -> tuple:
+        return (
+            self.id,
+            self.name,
+            self.health,
+            self.durability,
+            self.defense_rating,
+            self.hitting_rating,
+            self.pitching_rating,
+            self.baserunning_rating,
+            sorted(self.stats.items()),
+            self.elements,
+        )
+
     @staticmethod
     def null():
         return ItemData(
@@ -873,7 +1123,7 @@ class PlayerData(TeamOrPlayerMods):
         frequency = 6 + round(10 * self.data["buoyancy"])
 
         # Pull from pre-computed sin values
-        sin_phase = SIN_PHASES[frequency][day]
+        sin_phase = SIN_PHASE_ROWS[frequency][day]
         # Original formula:
         # sin_phase = math.sin(math.pi * ((2 / frequency) * day + 0.5))
 
@@ -884,6 +1134,13 @@ class PlayerData(TeamOrPlayerMods):
     def stats_with_items(self) -> Dict[str, float]:
         return self._get_stats_with_items(self.data, self.items)
 
+    def raw_stat(self, stat: str) -> float:
+        return self.data[stat]
+
+    def set_raw_stat(self, stat: str, value: float):
+        self.data[stat] = value
+        ENTITY_CHANGES[0] += 1
+
     def multiplied(self, stat: str, multiplier: float) -> float:
         # we can do this nicer i think but whatevs
         raw_stat = self.data[stat.replace("ground_friction", "groundFriction")]
@@ -895,51 +1152,22 @@ class PlayerData(TeamOrPlayerMods):
         # todo: actually *do* the rolls...
         return self.has_mod(Mod.SCATTERED) and self.has_mod(Mod.UNDEFINED)
 
-    def is_cache_equivalent(self, other: "PlayerData") -> bool:
+    def _digest_fields(self) -> tuple:
         return (
-            self.id == other.id
-            and
+            self.id,
             # Excluding last update time
-            self.raw_name == other.raw_name
-            and self.unscattered_name == other.unscattered_name
-            and
+            self.raw_name,
+            self.unscattered_name,
             # Excluding data
-            self.buoyancy == other.buoyancy
-            and self.divinity == other.divinity
-            and self.martyrdom == other.martyrdom
-            and self.moxie == other.moxie
-            and self.musclitude == other.musclitude
-            and self.patheticism == other.patheticism
-            and self.thwackability == other.thwackability
-            and self.tragicness == other.tragicness
-            and self.ruthlessness == other.ruthlessness
-            and self.overpowerment == other.overpowerment
-            and self.unthwackability == other.unthwackability
-            and self.shakespearianism == other.shakespearianism
-            and self.suppression == other.suppression
-            and self.coldness == other.coldness
-            and self.baseThirst == other.baseThirst
-            and self.continuation == other.continuation
-            and self.ground_friction == other.ground_friction
-            and self.indulgence == other.indulgence
-            and self.laserlikeness == other.laserlikeness
-            and self.anticapitalism == other.anticapitalism
-            and self.chasiness == other.chasiness
-            and self.omniscience == other.omniscience
-            and self.tenaciousness == other.tenaciousness
-            and self.watchfulness == other.watchfulness
-            and self.pressurization == other.pressurization
-            and self.cinnamon == other.cinnamon
-            and self.blood == other.blood
-            and
+            tuple(getattr(self, attr) for attr in STAT_ATTRS),
+            self.blood,
             # Excluding consecutive hits
-            self.bat == other.bat
-            and self.soul == other.soul
-            and
+            self.bat,
+            self.soul,
             # Excluding eDensity
-            self.items == other.items
-            and self.season_mod_sources == other.season_mod_sources
-            and self.peanut_allergy == other.peanut_allergy
+            [item.digest_fields() for item in self.items],
+            sorted(self.season_mod_sources.items()),
+            self.peanut_allergy,
         )
 
     @staticmethod
@@ -1072,7 +1300,197 @@ class PlayerData(TeamOrPlayerMods):
 
 PlayerData.null = PlayerData.make_null()
 
-DataObject = Union[PlayerData, TeamData, StadiumData]
+
+class CompactPlayerData(ContentDigestMixin, ModsMixin):
+    """
+    Lighter-weight stand-in for PlayerData, for when there are a lot of players in memory.
+    Stats are kept in float64 arrays in stat_indices order (raw, and with items applied),
+    only the raw chron fields Resim actually reads are kept, and the stat attributes
+    formulas.py uses are properties over the array.
+    """
+
+    object_type: ClassVar[str] = "player"
+    null: ClassVar["CompactPlayerData"]
+    # the only things Resim reads out of the raw chron data other than the stats
+    RETAINED_DATA_KEYS: ClassVar[tuple] = (
+        "hittingRating",
+        "pitchingRating",
+        "baserunningRating",
+        "defenseRating",
+        "evolution",
+    )
+
+    __slots__ = (
+        "id",
+        "last_update_time",
+        "raw_name",
+        "unscattered_name",
+        "data",
+        "raw_stats",
+        "stats",
+        "blood",
+        "consecutive_hits",
+        "bat",
+        "soul",
+        "eDensity",
+        "items",
+        "season_mod_sources",
+        "permanent_mod_sources",
+        "peanut_allergy",
+        "mods",
+        "_mods_by_type",
+        "_raw_mods",
+        "_mod_masks",
+        "_mod_mask",
+        "_digest",
+    )
+
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+        self._init_mod_masks()
+
+    @classmethod
+    def from_chron(cls, data: Dict[str, Any], last_update_time: str, prev_player_data: Optional["CompactPlayerData"]):
+        data_state = data.get("state", {})
+        items = [ItemData.from_dict(item) for item in data.get("items") or []]
+        # cinnamon is None for some old players, PlayerData turns that into 0 too
+        raw_stats = array("d", (data[stat] or 0 if stat == "cinnamon" else data[stat] for stat in stat_indices))
+        player_data = cls(
+            id=data["id"],
+            last_update_time=last_update_time,
+            raw_name=data["name"],
+            unscattered_name=data_state.get("unscatteredName"),
+            data={key: data[key] for key in cls.RETAINED_DATA_KEYS if key in data},
+            raw_stats=raw_stats,
+            stats=cls._stats_with_items(raw_stats, items),
+            items=items,
+            blood=data.get("blood") or None,
+            consecutive_hits=data.get("consecutiveHits") or 0,
+            bat=data.get("bat") or None,
+            soul=data.get("soul") or 0,
+            eDensity=data.get("eDensity") or 0,
+            season_mod_sources=data_state.get("seasModSources", {}),
+            permanent_mod_sources=data_state.get("permModSources", {}),
+            peanut_allergy=data.get("peanutAllergy"),
+            **cls.mods_init_args(data),
+        )
+
+        if prev_player_data is not None:
+            if prev_player_data.is_cache_equivalent(player_data):
+                player_data.last_update_time = prev_player_data.last_update_time
+
+        return player_data
+
+    @staticmethod
+    def _stats_with_items(raw_stats: array, items: List[ItemData]) -> array:
+        # same order of operations as PlayerData._get_stats_with_items, so the results are bit-identical
+        stats = array("d", raw_stats)
+        for item in items:
+            for stat, value in item.stats.items():
+                if stat in ["patheticism", "tragicness", "buoyancy"]:
+                    stats[STAT_INDEX[stat]] -= value
+                elif stat not in ["buoyancy", "cinnamon", "pressurization"]:
+                    stats[STAT_INDEX[stat]] += value
+        return stats
+
+    def update_stats(self):
+        self.stats = self._stats_with_items(self.raw_stats, self.items)
+
+    def stats_with_items(self) -> Dict[str, float]:
+        return dict(zip(stat_indices, self.stats))
+
+    def raw_stat(self, stat: str) -> float:
+        return self.raw_stats[STAT_INDEX[stat]]
+
+    def set_raw_stat(self, stat: str, value: float):
+        self.raw_stats[STAT_INDEX[stat]] = value
+        ENTITY_CHANGES[0] += 1
+
+    @property
+    def name(self):
+        return self.unscattered_name or self.raw_name
+
+    def vibes(self, day) -> float:
+        if self.has_mod(Mod.SCATTERED):
+            return 0
+        return self.raw_vibes(day)
+
+    def raw_vibes(self, day) -> float:
+        # must use pre-item buoyancy
+        frequency = 6 + round(10 * self.raw_stats[STAT_INDEX["buoyancy"]])
+        sin_phase = SIN_PHASE_ROWS[frequency][day]
+
+        pressurization = self.pressurization
+        cinnamon = self.cinnamon or 0
+        return 0.5 * ((sin_phase - 1) * pressurization + (sin_phase + 1) * cinnamon)
+
+    def multiplied(self, stat: str, multiplier: float) -> float:
+        index = STAT_ATTR_INDEX[stat]
+        raw_stat = self.raw_stats[index]
+        item_stat = self.stats[index] - raw_stat
+        return raw_stat * multiplier + item_stat
+
+    def undefined(self) -> bool:
+        return self.has_mod(Mod.SCATTERED) and self.has_mod(Mod.UNDEFINED)
+
+    def _digest_fields(self) -> tuple:
+        # same fields as PlayerData._digest_fields
+        return (
+            self.id,
+            self.raw_name,
+            self.unscattered_name,
+            tuple(self.stats),
+            self.blood,
+            self.bat,
+            self.soul,
+            [item.digest_fields() for item in self.items],
+            sorted(self.season_mod_sources.items()),
+            self.peanut_allergy,
+        )
+
+    def to_player_data(self) -> PlayerData:
+        data = dict(self.data)
+        data.update(zip(stat_indices, self.raw_stats))
+        return PlayerData(
+            id=self.id,
+            last_update_time=self.last_update_time,
+            raw_name=self.raw_name,
+            unscattered_name=self.unscattered_name,
+            data=data,
+            items=self.items,
+            blood=self.blood,
+            consecutive_hits=self.consecutive_hits,
+            bat=self.bat,
+            soul=self.soul,
+            eDensity=self.eDensity,
+            season_mod_sources=self.season_mod_sources,
+            permanent_mod_sources=self.permanent_mod_sources,
+            peanut_allergy=self.peanut_allergy,
+            mods=self.mods,
+            _mods_by_type=self._mods_by_type,
+            _raw_mods=self._raw_mods,
+            **{_stat_attr(stat): value for stat, value in zip(stat_indices, self.stats)},
+        )
+
+    # saved objects are always written in the PlayerData format so the notebooks can load them either way
+    def to_dict(self, encode_json=False) -> Dict[str, Any]:
+        return self.to_player_data().to_dict(encode_json=encode_json)
+
+    def to_json(self, **kwargs) -> str:
+        return self.to_player_data().to_json(**kwargs)
+
+
+def _stat_property(index: int) -> property:
+    return property(lambda self: self.stats[index])
+
+
+for _stat, _index in STAT_ATTR_INDEX.items():
+    setattr(CompactPlayerData, _stat, _stat_property(_index))
+
+CompactPlayerData.null = CompactPlayerData.from_chron(PlayerData.null.data, PlayerData.null.last_update_time, None)
+
+DataObject = Union[PlayerData, CompactPlayerData, TeamData, StadiumData]
 
 CHRONICLER_URI = "https://api.sibr.dev/chronicler"
 
@@ -1086,15 +1504,21 @@ class NullUpdate(collections.defaultdict):
     def __bool__(self):
         return False
 
+    def __reduce__(self):
+        # defaultdict's would pass the default factory to __init__ (resim checkpoints pickle these)
+        return NullUpdate, (dict(self),)
+
 
 class GameData:
-    def __init__(self):
+    def __init__(self, compact_players: bool = False):
+        self.player_cls = CompactPlayerData if compact_players else PlayerData
         self.teams = {}
         self.players = {}
         self.stadiums = {}
         self.plays = {}
         self.games = {}
         self.sim = None
+        self.load_stats = collections.Counter()
 
     def fetch_sim(self, timestamp, delta_secs: float = 0):
         timestamp = offset_timestamp(timestamp, delta_secs)
@@ -1107,39 +1531,51 @@ class GameData:
 
     def fetch_teams(self, timestamp, delta_secs: float = 0):
         timestamp = offset_timestamp(timestamp, delta_secs)
-        key = f"teams_at_{timestamp}"
-        resp = get_cached(
-            key,
+        self.teams = self._fetch_entities(
+            f"teams_at_{timestamp}",
             f"{CHRONICLER_URI}/v2/entities?type=team&at={timestamp}&count=1000",
+            TeamData,
+            self.teams,
         )
-        self.teams = {
-            e["entityId"]: TeamData.from_chron(e["data"], e["validFrom"], self.teams.get(e["entityId"]))
-            for e in resp["items"]
-        }
 
     def fetch_players(self, timestamp, delta_secs: float = 0):
         timestamp = offset_timestamp(timestamp, delta_secs)
-        key = f"players_at_{timestamp}"
-        resp = get_cached(
-            key,
+        self.players = self._fetch_entities(
+            f"players_at_{timestamp}",
             f"{CHRONICLER_URI}/v2/entities?type=player&at={timestamp}&count=2000",
+            self.player_cls,
+            self.players,
         )
-        self.players = {
-            e["entityId"]: PlayerData.from_chron(e["data"], e["validFrom"], self.players.get(e["entityId"]))
-            for e in resp["items"]
-        }
 
     def fetch_stadiums(self, timestamp, delta_secs: float = 0):
         timestamp = offset_timestamp(timestamp, delta_secs)
-        key = f"stadiums_at_{timestamp}"
-        resp = get_cached(
-            key,
+        self.stadiums = self._fetch_entities(
+            f"stadiums_at_{timestamp}",
             f"{CHRONICLER_URI}/v2/entities?type=stadium&at={timestamp}&count=1000",
+            StadiumData,
+            self.stadiums,
         )
-        self.stadiums = {
-            e["entityId"]: StadiumData.from_chron(e["data"], e["validFrom"], self.stadiums.get(e["entityId"]))
-            for e in resp["items"]
-        }
+
+    def _fetch_entities(self, key, url, cls, prev_entities):
+        def build(resp):
+            entities = {e["entityId"]: cls.from_chron(e["data"], e["validFrom"], None) for e in resp["items"]}
+            for entity in entities.values():
+                entity.digest  # so it's stored in the pickle
+            return entities
+
+        start_time = time.perf_counter()
+        entities, hit = get_cached_parsed(key, url, build, cls.__name__)
+        elapsed = time.perf_counter() - start_time
+        self.load_stats["hits" if hit else "misses"] += 1
+        self.load_stats["hit_secs" if hit else "miss_secs"] += elapsed
+
+        # the cached objects are built without a previous version, so carry the
+        # last update time over here exactly like from_chron would have
+        for entity_id, entity in entities.items():
+            prev = prev_entities.get(entity_id)
+            if prev is not None and prev.is_cache_equivalent(entity):
+                entity.last_update_time = prev.last_update_time
+        return entities
 
     def fetch_player_after(self, player_id, timestamp):
         key = f"player_{player_id}_after_{timestamp}"
@@ -1148,7 +1584,7 @@ class GameData:
             f"{CHRONICLER_URI}/v2/versions?type=player&id={player_id}&after={timestamp}&count=1&order=asc",
         )
         for item in resp["items"]:
-            self.players[item["entityId"]] = PlayerData.from_chron(
+            self.players[item["entityId"]] = self.player_cls.from_chron(
                 item["data"], item["validFrom"], self.players.get(item["entityId"])
             )
 
@@ -1229,7 +1665,7 @@ class GameData:
         return player_id in self.players
 
     def get_player(self, player_id) -> PlayerData:
-        return self.players.get(player_id, PlayerData.null) if player_id else PlayerData.null
+        return self.players.get(player_id, self.player_cls.null) if player_id else self.player_cls.null
 
     def get_team(self, team_id) -> TeamData:
         return self.teams[team_id] if team_id else TeamData.null
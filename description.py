@@ -0,0 +1,64 @@
+import re
+from functools import cached_property
+from typing import Optional
+
+TRICK_ONE_SCORE = re.compile(r"They do a .*? \(([0-9]+)\)")
+TRICK_TWO_SCORE = re.compile(r"They(?: land|'re tagged out doing) a .*? \(([0-9]+)\)")
+ITEM_NAME = re.compile(r"(?:gained|The Winner gets) (.+?)( and ditched| and dropped|\.?$)")
+
+
+class EventDescription:
+    """
+    Things pulled out of an event description that more than one roll (or more than one player) needs.
+    Each one is worked out the first time it's used and then kept for the rest of the event.
+
+    Plain phrase checks stay as `"..." in self.desc` - str.__contains__ is faster than anything we
+    could do in python for the handful that get checked on a given event.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+
+    @cached_property
+    def item_broken(self) -> bool:
+        # checked for every player that rolls item damage
+        return " broke!" in self.text or " were damaged" in self.text or " was damaged" in self.text
+
+    @cached_property
+    def fielder_text(self) -> str:
+        # cut off extra parts with potential name collisions
+        text = self.text.split("out to ")[1]
+        if "advances on the sacrifice" in text or "tags up and scores!" in text:
+            text = text.rsplit(". ", 1)[0]  # damn you kaj statter jr.
+        return text
+
+    @cached_property
+    def _item_match(self) -> Optional[re.Match]:
+        return ITEM_NAME.search(self.text)
+
+    @cached_property
+    def item_name(self) -> str:
+        return self._item_match.group(1) if self._item_match else ""
+
+    @cached_property
+    def item_disposal(self) -> str:
+        # " and ditched" / " and dropped" when the player had to get rid of an item to make room, otherwise ""
+        return self._item_match.group(2) if self._item_match else ""
+
+    @cached_property
+    def elsewhere_days(self) -> Optional[int]:
+        if "days" not in self.text:
+            return None
+        return int(self.text.split("after ")[1].split(" days")[0])
+
+    @cached_property
+    def trick_one_score(self) -> int:
+        return int(TRICK_ONE_SCORE.search(self.text).group(1))
+
+    @cached_property
+    def trick_two_score(self) -> int:
+        return int(TRICK_TWO_SCORE.search(self.text).group(1))
+
+    @cached_property
+    def riff(self) -> str:
+        return self.text.split("\U0001f3b5")[1]
@@ -0,0 +1,298 @@
+import io
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import traceback
+import zipfile
+from collections import deque
+from contextlib import contextmanager
+from multiprocessing.managers import BaseManager
+from queue import Queue
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from object_store import OBJECT_STORE_FILE, ObjectStore
+
+DEFAULT_PORT = 50077
+# a worker that hasn't been heard from in this long is presumed dead, and its tasks go back in the queue
+LEASE_SECS = 120
+HEARTBEAT_SECS = 15
+MAX_ATTEMPTS = 3
+# get_task's answer when nothing is pending but tasks are still running, and could still be requeued
+WAIT = "wait"
+
+# shared with the worker, not output
+STAGING_LINKS = ["cache"]
+# the sqlite files that only exist while the store is open
+SKIPPED_SUFFIXES = ("-wal", "-shm", ".partial")
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    host, _, port = address.rpartition(":")
+    return host or "localhost", int(port) if port else DEFAULT_PORT
+
+
+class _CoordinatorManager(BaseManager):
+    pass
+
+
+class Coordinator:
+    """
+    Hands out tasks to workers on other machines (or processes) and takes their output back.
+    Lives in the run.py --serve process; workers call it over a BaseManager connection.
+    """
+
+    def __init__(self, tasks: List[Any], inputs: List[Dict[str, bytes]], log: Callable[[str], None] = print):
+        self.lock = threading.Lock()
+        self.tasks = tasks
+        # files each task needs that the worker might not have (the checkpoint it starts from), by relative path
+        self.inputs = inputs
+        self.log = log
+        self.pending = deque(range(len(tasks)))
+        # task id -> (worker, when it was last heard from)
+        self.leases: Dict[int, Tuple[str, float]] = {}
+        self.attempts = [0] * len(tasks)
+        self.results: Dict[int, Any] = {}
+        # tasks whose output one worker's copy is writing, so no other copy gets to
+        self.unpacking = set()
+        self.workers = set()
+        self.error: Optional[str] = None
+        # progress events from the workers, as (ProgressEventType, data) like the pool's PROGRESS_QUEUE
+        self.events = Queue()
+
+    def get_task(self, worker: str):
+        with self.lock:
+            self.workers.add(worker)
+            self._requeue_expired()
+            if self.error is not None or len(self.results) == len(self.tasks):
+                return None
+            # a requeued task can still be finished by the worker that lost it
+            while self.pending and self._is_done(self.pending[0]):
+                self.pending.popleft()
+            if not self.pending:
+                return WAIT
+            task_id = self.pending.popleft()
+            self.attempts[task_id] += 1
+            self.leases[task_id] = (worker, time.monotonic())
+            return task_id, self.tasks[task_id], self.inputs[task_id]
+
+    def heartbeat(self, worker: str):
+        with self.lock:
+            now = time.monotonic()
+            for task_id, (lease_worker, _) in self.leases.items():
+                if lease_worker == worker:
+                    self.leases[task_id] = (worker, now)
+
+    def progress(self, worker: str, event):
+        self.heartbeat(worker)
+        self.events.put(event)
+
+    def task_done(self, worker: str, task_id: int, result, archive: bytes):
+        with self.lock:
+            self.leases.pop(task_id, None)
+            if self._is_done(task_id):
+                # it was requeued, and the other copy finished first
+                return
+            self.unpacking.add(task_id)
+        try:
+            unpack_outputs(archive)
+        except Exception:
+            with self.lock:
+                self.unpacking.discard(task_id)
+                self.log(f"Couldn't unpack the output of task {task_id} from {worker}:\n{traceback.format_exc()}")
+                self._retry(task_id)
+            return
+        with self.lock:
+            self.unpacking.discard(task_id)
+            self.results[task_id] = result
+
+    def task_failed(self, worker: str, task_id: int, error: str):
+        with self.lock:
+            self.leases.pop(task_id, None)
+            if self._is_done(task_id):
+                return
+            self.log(f"Task {task_id} failed on {worker}:\n{error}")
+            self._retry(task_id)
+
+    def _is_done(self, task_id: int) -> bool:
+        return task_id in self.results or task_id in self.unpacking
+
+    def _retry(self, task_id: int):
+        if self.attempts[task_id] >= MAX_ATTEMPTS:
+            self.error = f"Task {task_id} failed {self.attempts[task_id]} times, giving up"
+        else:
+            self.pending.appendleft(task_id)
+
+    def _requeue_expired(self):
+        now = time.monotonic()
+        for task_id, (worker, last_heard) in list(self.leases.items()):
+            if now - last_heard > LEASE_SECS:
+                del self.leases[task_id]
+                self.log(f"Lost {worker} while it was running task {task_id}, requeueing it")
+                self._retry(task_id)
+
+    def finished(self) -> bool:
+        """
+        Whether every task is done. Raises if one ran out of attempts
+        """
+        with self.lock:
+            self._requeue_expired()
+            if self.error is not None:
+                raise RuntimeError(self.error)
+            return len(self.results) == len(self.tasks)
+
+    def status(self) -> Tuple[int, int, int]:
+        with self.lock:
+            return len(self.pending), len(self.leases), len(self.results)
+
+
+@contextmanager
+def serve(coordinator: Coordinator, address: Tuple[str, int], authkey: bytes):
+    _CoordinatorManager.register(
+        "coordinator",
+        callable=lambda: coordinator,
+        exposed=["get_task", "heartbeat", "progress", "task_done", "task_failed"],
+    )
+    server = _CoordinatorManager(address=address, authkey=authkey).get_server()
+    # serve_forever() replaces this when it starts, it's here in case the run is over before then
+    server.stop_event = threading.Event()
+    thread = threading.Thread(target=server.serve_forever, name="coordinator", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        server.stop_event.set()
+
+
+def pack_outputs(directory: str, skip: set) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+        for root, dirs, files in os.walk(directory):
+            dirs[:] = [d for d in dirs if os.path.relpath(os.path.join(root, d), directory) not in skip]
+            for filename in files:
+                path = os.path.relpath(os.path.join(root, filename), directory).replace(os.sep, "/")
+                if path not in skip and not filename.endswith(SKIPPED_SUFFIXES):
+                    archive.write(os.path.join(root, filename), path)
+    return buffer.getvalue()
+
+
+def unpack_outputs(archive: bytes, store_path: str = OBJECT_STORE_FILE):
+    """
+    Puts a task's output files where a local run would have written them. Its objects get added to the store
+    """
+    with zipfile.ZipFile(io.BytesIO(archive)) as files:
+        for path in files.namelist():
+            if os.path.isabs(path) or ".." in path.split("/"):
+                raise ValueError(f"Worker sent back a file outside the run directory: {path}")
+            if path == OBJECT_STORE_FILE:
+                with tempfile.TemporaryDirectory() as tmp:
+                    store_file = files.extract(path, tmp)
+                    store = ObjectStore(store_path)
+                    store.merge_from(store_file)
+                    store.close()
+                continue
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with files.open(path) as src, open(f"{path}.partial", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(f"{path}.partial", path)
+
+
+def run_in_staging_dir(fn: Callable[[], Any], inputs: Dict[str, bytes], dirs: List[str]) -> Tuple[Any, bytes]:
+    """
+    Runs fn in an empty directory (sharing this one's cache) and returns its result and everything it wrote, zipped.
+    That way the output can be sent back whole, and a failed task leaves nothing behind.
+    """
+    home = os.getcwd()
+    staging = tempfile.mkdtemp(prefix="resim-task-")
+    try:
+        for link in STAGING_LINKS:
+            os.makedirs(os.path.join(home, link), exist_ok=True)
+            os.symlink(os.path.join(home, link), os.path.join(staging, link))
+        for path, data in inputs.items():
+            os.makedirs(os.path.join(staging, os.path.dirname(path)), exist_ok=True)
+            with open(os.path.join(staging, path), "wb") as f:
+                f.write(data)
+        for directory in dirs:
+            os.makedirs(os.path.join(staging, directory), exist_ok=True)
+
+        os.chdir(staging)
+        try:
+            result = fn()
+        finally:
+            os.chdir(home)
+        return result, pack_outputs(staging, set(STAGING_LINKS) | set(inputs))
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+class ProgressForwarder:
+    """
+    Stands in for run.py's PROGRESS_QUEUE on a worker, sending the events to the coordinator instead
+    """
+
+    def __init__(self, coordinator, worker: str):
+        self.coordinator = coordinator
+        self.worker = worker
+
+    def put(self, event):
+        self.coordinator.progress(self.worker, event)
+
+
+def connect(address: Tuple[str, int], authkey: bytes, timeout: float = 60):
+    _CoordinatorManager.register("coordinator")
+    manager = _CoordinatorManager(address=address, authkey=authkey)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            manager.connect()
+            return manager.coordinator()
+        except ConnectionError:
+            # the coordinator might not be up yet
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(1)
+
+
+def run_worker(address: Tuple[str, int], authkey: bytes, run_task: Callable[[Any, Dict[str, bytes], Any], Tuple]):
+    """
+    Runs tasks from the coordinator until it runs out. run_task(task, inputs, progress_queue) returns the task's
+    result and its zipped output.
+    """
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    coordinator = connect(address, authkey)
+    progress = ProgressForwarder(coordinator, worker)
+
+    stop = threading.Event()
+
+    def heartbeat():
+        # proxies use a separate connection on each thread, so this doesn't get in the way of the task
+        while not stop.wait(HEARTBEAT_SECS):
+            try:
+                coordinator.heartbeat(worker)
+            except (EOFError, ConnectionError):
+                return
+
+    threading.Thread(target=heartbeat, name="heartbeat", daemon=True).start()
+    try:
+        while True:
+            try:
+                task = coordinator.get_task(worker)
+            except (EOFError, ConnectionError):
+                # the coordinator finished and shut down
+                return
+            if task is None:
+                return
+            if task == WAIT:
+                time.sleep(1)
+                continue
+            task_id, task, inputs = task
+            try:
+                result, archive = run_task(task, inputs, progress)
+            except Exception:
+                coordinator.task_failed(worker, task_id, traceback.format_exc())
+            else:
+                coordinator.task_done(worker, task_id, result, archive)
+    finally:
+        stop.set()
@@ -1,6 +1,7 @@
 import dataclasses
 import json
 from resim import LoggedRoll, Resim
+from roll_log import MemoryRollLog
 from io import StringIO
 
 # from multiprocessing import Pool
@@ -74,7 +75,7 @@ def main():
         out_file = StringIO()
 
         stub_rng = StubRng()
-        resim = Resim(stub_rng, out_file, run_name=None, raise_on_errors=False)
+        resim = Resim(stub_rng, out_file, run_name=None, raise_on_errors=False, roll_log=MemoryRollLog())
         resim.run(start_timestamp, end_timestamp, None)
         roll_log = resim.roll_log
         print(f"got {len(roll_log)} rolls")
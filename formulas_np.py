@@ -0,0 +1,831 @@
+"""
+The formulas from formulas.py over whole columns at once: every argument that's one object there is a *Columns of
+arrays here, one value per row, and every function returns an array of what the scalar version would have returned
+for each row. Made for the notebooks, which used to call the scalar versions row by row.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Dict, Sequence, Union
+
+import numpy as np
+
+from data import STAT_ATTRS, Mod, PlayerData, StadiumData, TeamData, Weather, iter_mask, mod_bit, stat_indices
+from formulas import (
+    CONTACT_BALL_COEFFICIENTS,
+    CONTACT_STRIKE_COEFFICIENTS,
+    FOUL_COEFFICIENTS,
+    MULTIPLIER_MODS,
+    STRIKE_COEFFICIENTS,
+    StatRelevantData,
+)
+from sin_values import SIN_PHASES
+
+# the mods the formulas look at, each given one bit of the *Columns mods, in the order entities list them in.
+# a full mod mask doesn't fit in an int64
+COLUMN_MODS = list(iter_mask(MULTIPLIER_MODS | mod_bit(Mod.SCATTERED)))
+COLUMN_MOD_BITS = {mod: 1 << i for i, mod in enumerate(COLUMN_MODS)}
+
+
+def column_mods(mod_mask: int) -> int:
+    """
+    Cuts an entity's mod mask down to the COLUMN_MODS bits
+    """
+    return sum(bit for mod, bit in COLUMN_MOD_BITS.items() if mod_mask & mod_bit(mod))
+
+
+def _take(value, rows):
+    if isinstance(value, np.ndarray):
+        return value[rows] if value.ndim else value
+    if isinstance(value, dict):
+        return {k: _take(v, rows) for k, v in value.items()}
+    if isinstance(value, _Columns):
+        return value.take(rows)
+    return value
+
+
+class _Columns:
+    def take(self, rows):
+        return type(self)(**{f.name: _take(getattr(self, f.name), rows) for f in fields(self)})
+
+
+def _by_object(objects: Sequence, build) -> Dict[str, np.ndarray]:
+    """
+    Calls build once for each distinct object and spreads what it returns over the rows
+    """
+    ids = np.array([id(obj) for obj in objects], dtype=np.int64)
+    _, first_rows, inverse = np.unique(ids, return_index=True, return_inverse=True)
+    values = [build(objects[i]) for i in first_rows]
+    return {key: np.array([value[key] for value in values])[inverse] for key in values[0]} if values else {}
+
+
+@dataclass
+class PlayerColumns(_Columns):
+    mods: np.ndarray
+    # pre-item stats, and stats with items, by attribute name
+    raw_stats: Dict[str, np.ndarray]
+    stats: Dict[str, np.ndarray]
+    has_night_vision_goggles: np.ndarray
+
+    @classmethod
+    def from_objects(cls, players: Sequence[PlayerData]) -> "PlayerColumns":
+        def build(player: PlayerData):
+            values = {
+                "mods": column_mods(player._mod_mask),
+                "has_night_vision_goggles": player.bat == "NIGHT_VISION_GOGGLES",
+            }
+            for stat, attr in zip(stat_indices, STAT_ATTRS):
+                # cinnamon can be None
+                values["raw." + attr] = player.raw_stat(stat) or 0
+                values[attr] = getattr(player, attr) or 0
+            return values
+
+        columns = _by_object(players, build)
+        return cls(
+            columns["mods"],
+            {attr: columns["raw." + attr] for attr in STAT_ATTRS},
+            {attr: columns[attr] for attr in STAT_ATTRS},
+            columns["has_night_vision_goggles"],
+        )
+
+    def has_mod(self, mod: Mod) -> np.ndarray:
+        return (self.mods & COLUMN_MOD_BITS[mod]) != 0
+
+    def multiplied(self, stat: str, multiplier: np.ndarray) -> np.ndarray:
+        raw_stat = self.raw_stats[stat]
+        item_stat = self.stats[stat] - raw_stat
+        return raw_stat * multiplier + item_stat
+
+
+@dataclass
+class TeamColumns(_Columns):
+    mods: np.ndarray
+    roster_size: np.ndarray
+
+    @classmethod
+    def from_objects(cls, teams: Sequence[TeamData]) -> "TeamColumns":
+        columns = _by_object(
+            teams,
+            lambda team: {
+                "mods": column_mods(team._mod_mask),
+                "roster_size": len(team.lineup) + len(team.rotation),
+            },
+        )
+        return cls(columns["mods"], columns["roster_size"])
+
+    def has_mod(self, mod: Mod) -> np.ndarray:
+        return (self.mods & COLUMN_MOD_BITS[mod]) != 0
+
+
+STADIUM_ATTRS = [
+    "viscosity",
+    "elongation",
+    "filthiness",
+    "obtuseness",
+    "forwardness",
+    "grandiosity",
+    "ominousness",
+    "fortification",
+    "inconvenience",
+    "hype",
+]
+
+
+@dataclass
+class StadiumColumns(_Columns):
+    viscosity: np.ndarray
+    elongation: np.ndarray
+    filthiness: np.ndarray
+    obtuseness: np.ndarray
+    forwardness: np.ndarray
+    grandiosity: np.ndarray
+    ominousness: np.ndarray
+    fortification: np.ndarray
+    inconvenience: np.ndarray
+    hype: np.ndarray
+    mod_count: np.ndarray
+
+    @classmethod
+    def from_objects(cls, stadiums: Sequence[StadiumData]) -> "StadiumColumns":
+        columns = _by_object(
+            stadiums,
+            lambda stadium: {
+                **{attr: getattr(stadium, attr) for attr in STADIUM_ATTRS},
+                "mod_count": len(stadium.mods),
+            },
+        )
+        return cls(**columns)
+
+
+@dataclass
+class MetaColumns(_Columns):
+    # Weather values
+    weather: np.ndarray
+    season: np.ndarray
+    day: np.ndarray
+    runner_count: np.ndarray
+    top_of_inning: np.ndarray
+    is_maximum_blaseball: np.ndarray
+    batter_at_bats: np.ndarray
+
+    @classmethod
+    def from_objects(cls, metas: Sequence[StatRelevantData]) -> "MetaColumns":
+        return cls(
+            np.array([int(meta.weather) for meta in metas], dtype=np.int64),
+            np.array([meta.season for meta in metas], dtype=np.int64),
+            np.array([meta.day for meta in metas], dtype=np.int64),
+            np.array([meta.runner_count for meta in metas], dtype=np.int64),
+            np.array([meta.top_of_inning for meta in metas], dtype=bool),
+            np.array([meta.is_maximum_blaseball for meta in metas], dtype=bool),
+            np.array([meta.batter_at_bats for meta in metas], dtype=np.int64),
+        )
+
+
+def _min(a, b):
+    # python's min: a unless b is smaller, so a nan a stays nan and a nan b is ignored
+    return np.where(b < a, b, a)
+
+
+def _max(a, b):
+    return np.where(b > a, b, a)
+
+
+def _pow(base: np.ndarray, exponent: float) -> np.ndarray:
+    # numpy's vectorized pow can be an ulp off from python's, so this goes through python's for each row.
+    # negative bases (complex in python) come out nan, the formulas don't use those
+    return np.array([x**exponent if x >= 0 else np.nan for x in np.asarray(base, dtype=np.float64).tolist()])
+
+
+def _by_season(kernel, meta: MetaColumns, *args) -> np.ndarray:
+    """
+    Runs kernel(season, *args) on the rows of each season, with args cut down to those rows
+    """
+    seasons = np.unique(meta.season)
+    if len(seasons) == 1:
+        return np.asarray(kernel(int(seasons[0]), *args), dtype=np.float64)
+    out = np.empty(len(meta.season))
+    for season in seasons:
+        rows = np.flatnonzero(meta.season == season)
+        out[rows] = kernel(int(season), *(_take(arg, rows) for arg in args))
+    return out
+
+
+def get_vibes(player: PlayerColumns, meta: MetaColumns) -> np.ndarray:
+    # must use pre-item buoyancy
+    frequency = 6 + np.rint(10 * player.raw_stats["buoyancy"]).astype(np.int64)
+    sin_phase = SIN_PHASES.lookup(frequency, meta.day)
+    pressurization = player.stats["pressurization"]
+    cinnamon = player.stats["cinnamon"]
+    vibes = 0.5 * ((sin_phase - 1) * pressurization + (sin_phase + 1) * cinnamon)
+    return np.where(player.has_mod(Mod.SCATTERED), 0, vibes)
+
+
+def get_multiplier(
+    player: PlayerColumns,
+    team: TeamColumns,
+    position: str,
+    attr: str,
+    meta: MetaColumns,
+    stadium: StadiumColumns,
+) -> np.ndarray:
+    return _by_season(_multiplier, meta, player, team, position, attr, meta, stadium)
+
+
+def _multiplier(
+    season: int,
+    player: PlayerColumns,
+    team: TeamColumns,
+    position: str,
+    attr: str,
+    meta: MetaColumns,
+    stadium: StadiumColumns,
+):
+    # formulas.get_multiplier one mod at a time, in the same order, so every row adds up the same floats
+    growth_excluded = ["patheticism", "thwackability", "buoyancy", "ruthlessness"] if season < 15 else []
+    on_fire_thwack = 4 if season >= 13 else 3
+    on_fire_moxie = 2 if season >= 13 else 1
+
+    weather = meta.weather
+    top = meta.top_of_inning
+    multiplier = np.ones(len(meta.day))
+    # rows that hit one of the mods that return right away
+    returned = np.zeros(len(meta.day), dtype=bool)
+
+    for mods in (player.mods, team.mods):
+        for mod, bit in COLUMN_MOD_BITS.items():
+            has = ((mods & bit) != 0) & ~returned
+            if mod == Mod.SCATTERED or not has.any():
+                continue
+
+            if mod == Mod.LATE_TO_PARTY:
+                cond, value = has & (meta.day == 72) & ~team.has_mod(Mod.OVERPERFORMING), multiplier + 0.2
+            elif mod == Mod.OVERPERFORMING:
+                cond, value = has, multiplier + 0.2
+            elif mod == Mod.UNDERPERFORMING:
+                cond, value = has, multiplier - 0.2
+            elif mod == Mod.GROWTH:
+                cond = has if attr not in growth_excluded else False
+                value = multiplier + _min(0.05, 0.05 * (meta.day / 99))
+            elif mod == Mod.HIGH_PRESSURE:
+                cond, value = has & (weather == Weather.FLOODING) & (meta.runner_count > 0), multiplier + 0.25
+            elif mod == Mod.TRAVELING:
+                has = has & ~player.has_mod(Mod.TRAVELING)
+                if attr not in ["patheticism", "thwackability", "ruthlessness", "buoyancy"]:
+                    if position == "batter":
+                        multiplier = np.where(has & top, multiplier + 0.05, multiplier)
+                    elif position == "pitcher":
+                        multiplier = np.where(has & ~top, multiplier + 0.05, multiplier)
+                cond, value = (has & ~top if position == "fielder" else False), multiplier + 0.05
+            elif mod == Mod.SINKING_SHIP:
+                cond, value = has, multiplier + (14 - team.roster_size) * 0.01
+            elif mod == Mod.AFFINITY_FOR_CROWS:
+                cond = has & (weather == Weather.BIRDS) if position != "fielder" else False
+                if attr in ["buoyancy", "omniscience"]:
+                    cond = False
+                value = multiplier + 0.5
+            elif mod == Mod.CHUNKY:
+                cond = has & (weather == Weather.PEANUTS)
+                if attr in ["musclitude", "divinity"]:
+                    value = multiplier + 1.0
+                elif attr in ["ground_friction", "groundFriction"]:
+                    value = multiplier + 0.5
+                else:
+                    cond = False
+            elif mod == Mod.SMOOTH:
+                cond = has & (weather == Weather.PEANUTS)
+                boosts = {"musclitude": 0.15, "continuation": 0.50, "ground_friction": 0.50, "groundFriction": 0.50}
+                if attr == "laserlikeness":
+                    value = multiplier + 0.80
+                elif attr in boosts:
+                    value = multiplier + boosts[attr]
+                else:
+                    cond = False
+            elif mod == Mod.ON_FIRE:
+                cond = has
+                if attr == "thwackability":
+                    value = multiplier + on_fire_thwack
+                elif attr == "moxie":
+                    value = multiplier + on_fire_moxie
+                else:
+                    cond = False
+            elif mod == Mod.MINIMALIST:
+                cond, value = has & meta.is_maximum_blaseball, multiplier - 0.75
+            elif mod == Mod.MAXIMALIST:
+                cond, value = has & meta.is_maximum_blaseball, multiplier + 2.50
+            elif mod == Mod.SLOW_BUILD:
+                cond, value = (has if position == "batter" else False), multiplier + meta.batter_at_bats * 0.01
+            elif mod == Mod.SHELLED:
+                if position == "fielder":
+                    multiplier = np.where(has, 0, multiplier)
+                    returned |= has
+                continue
+            elif mod == Mod.GUARDED:
+                cond, value = has, multiplier + 0.2 * stadium.fortification
+            elif mod == Mod.OUTDOORSY:
+                cond, value = has, multiplier + 0.2 * stadium.grandiosity
+            elif mod == Mod.GAUDY:
+                cond, value = has, multiplier + 0.02 * stadium.mod_count
+            elif mod == Mod.CLUTTERED:
+                cond, value = has, multiplier + 0.2 * stadium.filthiness
+            elif mod == Mod.NIGHT_VISION:
+                cond, value = has & (weather == Weather.ECLIPSE), multiplier + 0.5
+            elif mod == Mod.MINIMIZED:
+                multiplier = np.where(has, 0.00001, multiplier)
+                returned |= has
+                continue
+            elif mod == Mod.GREEN_LIGHT:
+                multiplier = np.where(has & (weather == Weather.POLARITY_PLUS), multiplier + 0.5, multiplier)
+                cond, value = has & (weather == Weather.POLARITY_MINUS), multiplier - 0.5
+            else:
+                continue
+            multiplier = np.where(cond, value, multiplier)
+
+    if attr == "thwackability":
+        goggles = ~returned & player.has_night_vision_goggles & (weather == Weather.ECLIPSE)
+        multiplier = np.where(goggles, multiplier + 0.5, multiplier)
+    return multiplier
+
+
+def _strike_threshold(
+    season: int,
+    batter: PlayerColumns,
+    batting_team: TeamColumns,
+    pitcher: PlayerColumns,
+    pitching_team: TeamColumns,
+    stadium: StadiumColumns,
+    meta: MetaColumns,
+    is_flinching: np.ndarray,
+):
+    constant, ruth_factor, fwd_factor, musc_factor, mox_factor, abs_factor, roll_cap = STRIKE_COEFFICIENTS[season]
+
+    vibes = get_vibes(pitcher, meta)
+    ruth = pitcher.multiplied(
+        "ruthlessness", _multiplier(season, pitcher, pitching_team, "pitcher", "ruthlessness", meta, stadium)
+    )
+    musc = batter.multiplied(
+        "musclitude", _multiplier(season, batter, batting_team, "batter", "musclitude", meta, stadium)
+    )
+    fwd = stadium.forwardness
+    flinch_constant = np.where(is_flinching, constant + 0.2, constant)
+
+    if season < 18:
+        threshold = flinch_constant + ruth_factor * (ruth * (1 + 0.2 * vibes)) + fwd_factor * fwd + musc_factor * musc
+        return _min(threshold, roll_cap)
+
+    cold = pitcher.multiplied(
+        "coldness", _multiplier(season, pitcher, pitching_team, "pitcher", "coldness", meta, stadium)
+    )
+    mox = batter.multiplied("moxie", _multiplier(season, batter, batting_team, "batter", "moxie", meta, stadium))
+
+    batter_hype = np.where(~meta.top_of_inning, stadium.hype, 0)
+    pitcher_hype = np.where(meta.top_of_inning, stadium.hype, 0)
+    hypediff = pitcher_hype - batter_hype
+
+    if season == 18:
+        ruth_cold_hypediff = (10 * ruth + 1 * cold) / 11 + 0.2 * hypediff
+    else:
+        ruth_cold_hypediff = (20 * ruth + 3 * cold + 3 * hypediff) / 23
+    threshold = (
+        np.where(fwd < 0.5, flinch_constant, flinch_constant + 0.05)
+        + ruth_factor * ruth_cold_hypediff * (1 + 0.2 * vibes)
+        + np.where(fwd < 0.5, fwd_factor * fwd, (fwd_factor - 0.1) * fwd)
+        + musc_factor * musc
+        + mox_factor * mox
+        + abs_factor * np.abs(musc - mox)
+    )
+    return _min(threshold, roll_cap)
+
+
+def _swing_strike_threshold(
+    season: int,
+    batter: PlayerColumns,
+    batting_team: TeamColumns,
+    pitcher: PlayerColumns,
+    pitching_team: TeamColumns,
+    stadium: StadiumColumns,
+    meta: MetaColumns,
+):
+    batter_vibes = get_vibes(batter, meta)
+    pitcher_vibes = get_vibes(pitcher, meta)
+
+    hype = stadium.hype * np.where(meta.top_of_inning, 1, -1)
+    batter_hype = -hype * (1 + 0.2 * batter_vibes)
+    pitcher_hype = hype * (1 + 0.2 * pitcher_vibes)
+
+    def batting(stat):
+        return batter.multiplied(stat, _multiplier(season, batter, batting_team, "batter", stat, meta, stadium))
+
+    div = batting("divinity") * (1 + 0.2 * batter_vibes)
+    musc = batting("musclitude") * (1 + 0.2 * batter_vibes)
+    thwack = batting("thwackability") * (1 + 0.2 * batter_vibes)
+    path = batter.multiplied(
+        "patheticism", 1 / _multiplier(season, batter, batting_team, "batter", "patheticism", meta, stadium)
+    )
+    invpath = (1 - path) * (1 + 0.2 * batter_vibes)
+
+    ruth = pitcher.multiplied(
+        "ruthlessness", _multiplier(season, pitcher, pitching_team, "pitcher", "ruthlessness", meta, stadium)
+    ) * (1 + 0.2 * pitcher_vibes)
+
+    visc = stadium.viscosity
+
+    combined_batting = (div + musc + invpath + thwack) / 4
+    if season < 18:
+        return 0.7 + 0.35 * combined_batting - 0.4 * ruth + 0.2 * (visc - 0.5)
+    elif season == 18:
+        return (
+            0.6 + 0.35 * (combined_batting + 0.2 * batter_hype) - 0.2 * (ruth + 0.2 * pitcher_hype) + 0.2 * (visc - 0.5)
+        )
+    return 0.6 + 0.35 * combined_batting + 0.04 * batter_hype - 0.2 * ruth - 0.03125 * pitcher_hype + 0.2 * (visc - 0.5)
+
+
+def _swing_ball_threshold(
+    season: int,
+    batter: PlayerColumns,
+    batting_team: TeamColumns,
+    pitcher: PlayerColumns,
+    pitching_team: TeamColumns,
+    stadium: StadiumColumns,
+    meta: MetaColumns,
+):
+    batter_vibes = get_vibes(batter, meta)
+    pitcher_vibes = get_vibes(pitcher, meta)
+
+    moxie = batter.multiplied("moxie", _multiplier(season, batter, batting_team, "batter", "moxie", meta, stadium)) * (
+        1 + 0.2 * batter_vibes
+    )
+    path = batter.multiplied(
+        "patheticism", 1 / _multiplier(season, batter, batting_team, "batter", "patheticism", meta, stadium)
+    )
+    ruth = pitcher.multiplied(
+        "ruthlessness", _multiplier(season, pitcher, pitching_team, "pitcher", "ruthlessness", meta, stadium)
+    ) * (1 + 0.2 * pitcher_vibes)
+    visc = stadium.viscosity
+
+    if season < 18:
+        combined = (12 * ruth - 5 * moxie + 5 * path + 4 * visc) / 20
+    else:
+        combined = 0.375 * _pow(ruth, 0.25) + 0.2 * visc - 0.25 * moxie + 0.25 * path
+    threshold = _max(_min(_pow(combined, 1.5), 0.95), 0.1)
+    return np.where(combined < 0, np.nan, threshold)
+
+
+def _contact_strike_threshold(
+    season: int,
+    batter: PlayerColumns,
+    batting_team: TeamColumns,
+    pitcher: PlayerColumns,
+    pitching_team: TeamColumns,
+    stadium: StadiumColumns,
+    meta: MetaColumns,
+):
+    constant, batting_factor, cap = CONTACT_STRIKE_COEFFICIENTS[season]
+    batter_vibes = get_vibes(batter, meta)
+    pitcher_vibes = get_vibes(pitcher, meta)
+
+    def batting(stat):
+        return batter.multiplied(stat, _multiplier(season, batter, batting_team, "batter", stat, meta, stadium))
+
+    div = batting("divinity")
+    musc = batting("musclitude")
+    thwack = batting("thwackability")
+    path = batter.multiplied(
+        "patheticism", 1 / _multiplier(season, batter, batting_team, "batter", "patheticism", meta, stadium)
+    )
+    combined_batting = (div + musc + thwack - path) / 2 * (1 + 0.2 * batter_vibes)
+
+    ruth = pitcher.multiplied(
+        "ruthlessness", _multiplier(season, pitcher, pitching_team, "pitcher", "ruthlessness", meta, stadium)
+    ) * (1 + 0.2 * pitcher_vibes)
+
+    fort = stadium.fortification - 0.5
+    visc = stadium.viscosity - 0.5
+    fwd = stadium.forwardness - 0.5
+    ballpark_sum = (fort + 3 * visc - 6 * fwd) / 10
+
+    threshold = constant - 0.08 * ruth + 0.16 * ballpark_sum + batting_factor * _pow(combined_batting, 1.2)
+    return np.where(combined_batting < 0, np.nan, _min(cap, threshold))
+
+
+def _contact_ball_threshold(
+    season: int,
+    batter: PlayerColumns,
+    batting_team: TeamColumns,
+    pitcher: PlayerColumns,
+    pitching_team: TeamColumns,
+    stadium: StadiumColumns,
+    meta: MetaColumns,
+):
+    constant, path_factor, cap = CONTACT_BALL_COEFFICIENTS[season]
+    batter_vibes = get_vibes(batter, meta)
+    pitcher_vibes = get_vibes(pitcher, meta)
+
+    path = batter.multiplied(
+        "patheticism", 1 / _multiplier(season, batter, batting_team, "batter", "patheticism", meta, stadium)
+    )
+    invpath = _max((1 - path) * (1 + 0.2 * batter_vibes), 0)
+
+    ruth = pitcher.multiplied(
+        "ruthlessness", _multiplier(season, pitcher, pitching_team, "pitcher", "ruthlessness", meta, stadium)
+    ) * (1 + 0.2 * pitcher_vibes)
+
+    fort = stadium.fortification - 0.5
+    visc = stadium.viscosity - 0.5
+    fwd = stadium.forwardness - 0.5
+    ballpark_sum = (fort + 3 * visc - 6 * fwd) / 10
+
+    threshold = constant - 0.1 * ruth + path_factor * _pow(invpath, 1.5) + 0.14 * ballpark_sum
+    return _min(cap, threshold)
+
+
+def _foul_threshold(
+    season: int,
+    batter: PlayerColumns,
+    batting_team: TeamColumns,
+    stadium: StadiumColumns,
+    meta: MetaColumns,
+):
+    hypediff_factor = FOUL_COEFFICIENTS[season]
+    vibes = get_vibes(batter, meta)
+    fwd = stadium.forwardness
+    obt = stadium.obtuseness
+
+    def batting(stat):
+        return batter.multiplied(stat, _multiplier(season, batter, batting_team, "batter", stat, meta, stadium))
+
+    musc = batting("musclitude") * (1 + 0.2 * vibes)
+    thwack = batting("thwackability") * (1 + 0.2 * vibes)
+    div = batting("divinity") * (1 + 0.2 * vibes)
+    batter_sum = (musc + thwack + div) / 3
+
+    batter_hype = np.where(~meta.top_of_inning, stadium.hype, 0)
+    pitcher_hype = np.where(meta.top_of_inning, stadium.hype, 0)
+    hypediff = (batter_hype - pitcher_hype) * (1 + 0.2 * vibes)
+
+    return 0.25 + 0.1 * fwd - 0.1 * obt + 0.1 * batter_sum + hypediff_factor * hypediff
+
+
+def _hr_threshold(
+    season: int,
+    batter: PlayerColumns,
+    batting_team: TeamColumns,
+    pitcher: PlayerColumns,
+    pitching_team: TeamColumns,
+    stadium: StadiumColumns,
+    meta: MetaColumns,
+):
+    batter_vibes = get_vibes(batter, meta)
+    pitcher_vibes = get_vibes(pitcher, meta)
+
+    div = batter.multiplied(
+        "divinity", _multiplier(season, batter, batting_team, "batter", "divinity", meta, stadium)
+    ) * (1 + 0.2 * batter_vibes)
+    opw = pitcher.multiplied(
+        "overpowerment", _multiplier(season, pitcher, pitching_team, "pitcher", "overpowerment", meta, stadium)
+    ) * (1 + 0.2 * pitcher_vibes)
+    supp = pitcher.multiplied(
+        "suppression", _multiplier(season, pitcher, pitching_team, "pitcher", "suppression", meta, stadium)
+    ) * (1 + 0.2 * pitcher_vibes)
+
+    grand = stadium.grandiosity - 0.5
+    fort = stadium.fortification - 0.5
+    visc = stadium.viscosity - 0.5
+    om = stadium.ominousness - 0.5
+    fwd = stadium.forwardness - 0.5
+    ballpark_sum = 0.4 * grand + 0.2 * fort + 0.08 * visc + 0.08 * om - 0.24 * fwd
+
+    opw_supp = (10 * opw + supp) / 11
+    return 0.12 + 0.16 * div - 0.08 * opw_supp - 0.18 * ballpark_sum
+
+
+def _fly_or_ground_threshold(
+    season: int,
+    batter: PlayerColumns,
+    batting_team: TeamColumns,
+    pitcher: PlayerColumns,
+    pitching_team: TeamColumns,
+    stadium: StadiumColumns,
+    meta: MetaColumns,
+):
+    buoy = batter.multiplied(
+        "buoyancy", 1 / _multiplier(season, batter, batting_team, "batter", "buoyancy", meta, stadium)
+    )
+    # the batter with the pitching team, see formulas.get_fly_or_ground_threshold
+    supp = batter.multiplied(
+        "suppression", _multiplier(season, batter, pitching_team, "pitcher", "suppression", meta, stadium)
+    )
+    omi = stadium.ominousness - 0.5
+    hype = stadium.hype * np.where(meta.top_of_inning, 1, -1)
+
+    threshold = 0.18 + 0.3 * (buoy + 0.2 * hype) - 0.16 * (supp + 0.2 * hype) - 0.1 * omi
+    return _max(threshold, 0.01)
+
+
+def _fielding_stats(season, batter, batting_team, pitcher, pitching_team, fielder, stadium, meta, stats):
+    batter_stat, pitcher_stat, fielder_stat = stats
+    batter_vibes = get_vibes(batter, meta)
+    pitcher_vibes = get_vibes(pitcher, meta)
+    fielder_vibes = get_vibes(fielder, meta)
+    return (
+        batter.multiplied(batter_stat, _multiplier(season, batter, batting_team, "batter", batter_stat, meta, stadium)),
+        batter_vibes,
+        pitcher.multiplied(
+            pitcher_stat, _multiplier(season, pitcher, pitching_team, "pitcher", pitcher_stat, meta, stadium)
+        ),
+        pitcher_vibes,
+        fielder.multiplied(
+            fielder_stat, _multiplier(season, fielder, pitching_team, "fielder", fielder_stat, meta, stadium)
+        ),
+        fielder_vibes,
+    )
+
+
+def _out_threshold(
+    season: int,
+    batter: PlayerColumns,
+    batting_team: TeamColumns,
+    pitcher: PlayerColumns,
+    pitching_team: TeamColumns,
+    fielder: PlayerColumns,
+    stadium: StadiumColumns,
+    meta: MetaColumns,
+):
+    thwack, batter_vibes, unthwack, pitcher_vibes, omni, fielder_vibes = _fielding_stats(
+        season,
+        batter,
+        batting_team,
+        pitcher,
+        pitching_team,
+        fielder,
+        stadium,
+        meta,
+        ("thwackability", "unthwackability", "omniscience"),
+    )
+    batter_thwack = thwack * (1 + 0.2 * batter_vibes)
+    pitcher_unthwack = unthwack * (1 + 0.2 * pitcher_vibes)
+    fielder_omni = omni * (1 + 0.2 * fielder_vibes)
+
+    grand = stadium.grandiosity - 0.5
+    omi = stadium.ominousness - 0.5
+    incon = stadium.inconvenience - 0.5
+    visc = stadium.viscosity - 0.5
+    fwd = stadium.forwardness - 0.5
+    obt = stadium.obtuseness - 0.5
+
+    if season in [11, 12]:
+        return (
+            0.315
+            + 0.1 * batter_thwack
+            - 0.08 * pitcher_unthwack
+            - 0.07 * fielder_omni
+            + 0.0145 * grand
+            + 0.0085 * omi
+            - 0.011 * incon
+            - 0.005 * visc
+            + 0.01 * fwd
+        )
+    elif season == 13:
+        return (
+            0.3115
+            + 0.1 * batter_thwack
+            - 0.08 * pitcher_unthwack
+            - 0.065 * fielder_omni
+            + 0.011 * grand
+            + 0.008 * obt
+            - 0.0033 * omi
+            - 0.002 * incon
+            - 0.0033 * visc
+            + 0.01 * fwd
+        )
+    bp_sum = (55 * grand + 51 * fwd + 40 * obt - 17 * visc - 17 * omi - 10 * incon) / 100
+    return 0.311 + 0.1 * batter_thwack - 0.08 * pitcher_unthwack - 0.064 * fielder_omni + 0.02 * bp_sum
+
+
+def _double_threshold(
+    season: int,
+    batter: PlayerColumns,
+    batting_team: TeamColumns,
+    pitcher: PlayerColumns,
+    pitching_team: TeamColumns,
+    fielder: PlayerColumns,
+    stadium: StadiumColumns,
+    meta: MetaColumns,
+):
+    constant, chase_factor = {11: (0.17, 0.1), 12: (0.17, 0.1), 13: (0.165, 0.09)}.get(season, (0.16, 0.08))
+    musc, batter_vibes, opw, pitcher_vibes, chase, fielder_vibes = _fielding_stats(
+        season,
+        batter,
+        batting_team,
+        pitcher,
+        pitching_team,
+        fielder,
+        stadium,
+        meta,
+        ("musclitude", "overpowerment", "chasiness"),
+    )
+    batter_musc = musc * (1 + 0.2 * batter_vibes)
+    pitcher_opw = opw * (1 + 0.2 * pitcher_vibes)
+    fielder_chase = chase * (1 + 0.2 * fielder_vibes)
+
+    fwd = stadium.forwardness - 0.5
+    elong = stadium.elongation - 0.5
+    visc = stadium.viscosity - 0.5
+    omi = stadium.ominousness - 0.5
+    ballpark_sum = 0.027 * fwd - 0.015 * elong - 0.01 * omi - 0.008 * visc
+
+    return constant + 0.2 * batter_musc - 0.04 * pitcher_opw - chase_factor * fielder_chase + ballpark_sum
+
+
+def _triple_threshold(
+    season: int,
+    batter: PlayerColumns,
+    batting_team: TeamColumns,
+    pitcher: PlayerColumns,
+    pitching_team: TeamColumns,
+    fielder: PlayerColumns,
+    stadium: StadiumColumns,
+    meta: MetaColumns,
+):
+    gf, batter_vibes, opw, pitcher_vibes, chase, fielder_vibes = _fielding_stats(
+        season,
+        batter,
+        batting_team,
+        pitcher,
+        pitching_team,
+        fielder,
+        stadium,
+        meta,
+        ("ground_friction", "overpowerment", "chasiness"),
+    )
+    hype = stadium.hype * np.where(meta.top_of_inning, 1, -1)
+    batter_gf = (gf - 0.2 * hype) * (1 + 0.2 * batter_vibes)
+    pitcher_opw = (opw + 0.2 * hype) * (1 + 0.2 * pitcher_vibes)
+    fielder_chase = (chase + 0.2 * hype) * (1 + 0.2 * fielder_vibes)
+
+    fwd = stadium.forwardness - 0.5
+    grand = stadium.grandiosity - 0.5
+    obt = stadium.obtuseness - 0.5
+    visc = stadium.viscosity - 0.5
+    omi = stadium.ominousness - 0.5
+    ballpark_sum = (3 * fwd + 5 * grand + 5 * obt - visc - omi) / 15
+
+    if season in [11, 12]:
+        return 0.05 + 0.2 * batter_gf - 0.04 * pitcher_opw - 0.06 * fielder_chase + 0.1 * ballpark_sum
+    elif season in [13, 14, 15, 16, 17]:
+        return 0.045 + 0.2 * batter_gf - 0.04 * pitcher_opw - 0.05 * fielder_chase + 0.1 * ballpark_sum
+    opw_pow = _pow(pitcher_opw, 1.5)
+    threshold = 0.042 + 0.2 * batter_gf - 0.056 * opw_pow - 0.05 * fielder_chase + 0.1 * ballpark_sum
+    return np.where(pitcher_opw < 0, np.nan, threshold)
+
+
+def get_strike_threshold(
+    batter: PlayerColumns,
+    batting_team: TeamColumns,
+    pitcher: PlayerColumns,
+    pitching_team: TeamColumns,
+    stadium: StadiumColumns,
+    meta: MetaColumns,
+    is_flinching: Union[bool, np.ndarray],
+) -> np.ndarray:
+    return _by_season(
+        _strike_threshold, meta, batter, batting_team, pitcher, pitching_team, stadium, meta, np.asarray(is_flinching)
+    )
+
+
+def get_swing_strike_threshold(batter, batting_team, pitcher, pitching_team, stadium, meta) -> np.ndarray:
+    return _by_season(_swing_strike_threshold, meta, batter, batting_team, pitcher, pitching_team, stadium, meta)
+
+
+def get_swing_ball_threshold(batter, batting_team, pitcher, pitching_team, stadium, meta) -> np.ndarray:
+    return _by_season(_swing_ball_threshold, meta, batter, batting_team, pitcher, pitching_team, stadium, meta)
+
+
+def get_contact_strike_threshold(batter, batting_team, pitcher, pitching_team, stadium, meta) -> np.ndarray:
+    return _by_season(_contact_strike_threshold, meta, batter, batting_team, pitcher, pitching_team, stadium, meta)
+
+
+def get_contact_ball_threshold(batter, batting_team, pitcher, pitching_team, stadium, meta) -> np.ndarray:
+    return _by_season(_contact_ball_threshold, meta, batter, batting_team, pitcher, pitching_team, stadium, meta)
+
+
+def get_foul_threshold(batter, batting_team, stadium, meta) -> np.ndarray:
+    return _by_season(_foul_threshold, meta, batter, batting_team, stadium, meta)
+
+
+def get_hr_threshold(batter, batting_team, pitcher, pitching_team, stadium, meta) -> np.ndarray:
+    return _by_season(_hr_threshold, meta, batter, batting_team, pitcher, pitching_team, stadium, meta)
+
+
+def get_fly_or_ground_threshold(batter, batting_team, pitcher, pitching_team, stadium, meta) -> np.ndarray:
+    return _by_season(_fly_or_ground_threshold, meta, batter, batting_team, pitcher, pitching_team, stadium, meta)
+
+
+def get_out_threshold(batter, batting_team, pitcher, pitching_team, fielder, stadium, meta) -> np.ndarray:
+    return _by_season(_out_threshold, meta, batter, batting_team, pitcher, pitching_team, fielder, stadium, meta)
+
+
+def get_double_threshold(batter, batting_team, pitcher, pitching_team, fielder, stadium, meta) -> np.ndarray:
+    return _by_season(_double_threshold, meta, batter, batting_team, pitcher, pitching_team, fielder, stadium, meta)
+
+
+def get_triple_threshold(batter, batting_team, pitcher, pitching_team, fielder, stadium, meta) -> np.ndarray:
+    return _by_season(_triple_threshold, meta, batter, batting_team, pitcher, pitching_team, fielder, stadium, meta)
@@ -0,0 +1,92 @@
+import hashlib
+import json
+import os
+from dataclasses import asdict
+from typing import Any, Dict, Optional
+
+from data import get_feed_meta
+
+MANIFEST_DIR = "manifests"
+
+# everything that decides what a fragment's output looks like
+SOURCE_FILES = [
+    "resim.py",
+    "formulas.py",
+    "item_gen.py",
+    "data.py",
+    "rng.py",
+    "corrections.py",
+    "corrections.json",
+    "description.py",
+    "tracing.py",
+    "output.py",
+    "columnar.py",
+    "object_store.py",
+    "roll_stream.py",
+    "roll_log.py",
+    "sin_values.py",
+    "sin_values.bin",
+]
+
+
+def _source_hash() -> str:
+    digest = hashlib.sha1()
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for filename in SOURCE_FILES:
+        digest.update(filename.encode())
+        with open(os.path.join(directory, filename), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+SOURCE_HASH = _source_hash()
+
+
+def manifest_path(run_name: str) -> str:
+    return os.path.join(MANIFEST_DIR, run_name.replace(":", "_") + ".json")
+
+
+def make_manifest(fragment, options) -> Dict[str, Any]:
+    """
+    What a fragment's output was made from: the fragment itself, its feed, the sim's source and the run's options.
+    """
+    _, _, _, _, start_time, end_time = fragment
+    feed = get_feed_meta(start_time, end_time)
+    return {
+        "fragment": json.loads(json.dumps(fragment)),
+        "feed": {key: feed[key] for key in ("count", "last_timestamp", "size")},
+        "source": SOURCE_HASH,
+        # enums and paths as their str(), which is all that matters for comparing. Writing checkpoints doesn't change
+        # the output
+        "options": json.loads(
+            json.dumps({k: v for k, v in asdict(options).items() if k != "checkpoints"}, default=str)
+        ),
+    }
+
+
+def read_manifest(run_name: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(manifest_path(run_name), "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def write_manifest(run_name: str, manifest: Dict[str, Any]):
+    path = manifest_path(run_name)
+    os.makedirs(MANIFEST_DIR, exist_ok=True)
+    with open(f"{path}.partial", "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(f"{path}.partial", path)
+
+
+def is_up_to_date(run_name: str, manifest: Dict[str, Any]) -> bool:
+    return read_manifest(run_name) == manifest
+
+
+def invalidate(run_name: str):
+    # before a fragment's output gets rewritten, so a crash halfway through doesn't leave it looking up to date
+    try:
+        os.remove(manifest_path(run_name))
+    except FileNotFoundError:
+        pass
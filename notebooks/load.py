@@ -12,7 +12,10 @@ import sys
 sys.path.append("../")
 
 import formulas  # noqa: E402
-from data import PlayerData, TeamData, StadiumData, DataObject, Weather  # noqa: E402
+import formulas_np  # noqa: E402
+from data import PlayerData, TeamData, StadiumData, DataObject, Mod, Weather, stat_indices  # noqa: E402
+from object_store import OBJECT_STORE_FILE, ObjectStore  # noqa: E402
+from columnar import COLUMNAR_DIR, ColumnKind, SEASON_FILE_PREFIX, read_columns  # noqa: E402
 from sin_values import SIN_PHASES  # noqa: E402
 
 DataObjectMap = Dict[str, DataObject]
@@ -38,6 +41,7 @@ STAT_RELEVANT_DATA_KEYS = [
     "is_maximum_blaseball",
     "batter_at_bats",
 ]
+STADIUM_ATTRS = formulas_np.STADIUM_ATTRS + ["mysticism"]
 
 
 def braced_glob(path):
@@ -48,60 +52,35 @@ def braced_glob(path):
     return paths
 
 
-def _get_player_attribute(attr_key: str, use_items: Union[bool, str], use_broken_items: bool):
-    def player_attribute_extractor(player: PlayerData):
-        attr = player.data.get(attr_key) or 0  # for cinnamon
-        if use_items:
-            for item in player.items:
-                if use_broken_items or item.health != 0:
-                    item_attr = item.stats.get(attr_key) or 0
-                    if use_items == "negative":
-                        attr -= item_attr
-                    else:
-                        attr += item_attr
-
-        return attr
-
-    return player_attribute_extractor
-
-
-def _get_stadium_attribute(attr_key: str):
-    def stadium_attribute_extractor(stadium: StadiumData):
-        return getattr(stadium, attr_key)
-
-    return stadium_attribute_extractor
-
-
-def _get_vibes(row):
-    player, day = row
-    if player.has_mod("SCATTERED"):
-        return 0
-
-    # must be pre-item
-    buoy = _get_player_attribute("buoyancy", False, False)(player)
-    press = _get_player_attribute("pressurization", False, False)(player)
-    cinn = _get_player_attribute("cinnamon", False, False)(player)
-
-    frequency = 6 + round(10 * buoy)
-
-    # Pull from pre-computed sin values
-    sin_phase = SIN_PHASES[frequency][day]
-    # Original formula:
-    # sin_phase = math.sin(math.pi * ((2 / frequency) * day + 0.5))
-
-    return 0.5 * ((sin_phase - 1) * press + (sin_phase + 1) * cinn)
-
-
 def _get_mods(item: Union[PlayerData, TeamData]):
     return ";".join(item.mods)
 
 
-def _get_multiplier(position, attr):
-    def multiplier_extractor(row):
-        player, team, meta, stadium = row
-        return formulas.get_multiplier(player, team, position, attr, meta, stadium)
+def _player_row(player: PlayerData) -> dict:
+    row = {
+        "name": player.name,
+        "mods": _get_mods(player),
+        "mod_mask": formulas_np.column_mods(player._mod_mask),
+        "night_vision_goggles": player.bat == "NIGHT_VISION_GOGGLES",
+    }
+    for stat in stat_indices:
+        row["raw_" + stat] = player.data.get(stat) or 0  # for cinnamon
+        row["unbroken_" + stat] = sum(item.stats.get(stat) or 0 for item in player.items if item.health != 0)
+        row["broken_" + stat] = sum(item.stats.get(stat) or 0 for item in player.items if item.health == 0)
+    return row
+
+
+def _team_row(team: TeamData) -> dict:
+    return {
+        "name": team.nickname,
+        "mods": _get_mods(team),
+        "mod_mask": formulas_np.column_mods(team._mod_mask),
+        "roster_size": len(team.lineup) + len(team.rotation),
+    }
+
 
-    return multiplier_extractor
+def _stadium_row(stadium: StadiumData) -> dict:
+    return {attr: getattr(stadium, attr) for attr in STADIUM_ATTRS} | {"mod_count": len(stadium.mods)}
 
 
 def _get_stat_relevant_data(row):
@@ -150,29 +129,200 @@ NULL_OBJECTS = (
 )
 
 
-def _load_objects(df: pd.DataFrame, object_key: str) -> DataObjectMap:
-    filenames = df[object_key + "_file"].dropna().unique()
-    object_map: DataObjectMap = {}
-    for i, filename in enumerate(filenames):
-        with open("../" + filename, "r") as f:
-            obj = json.load(f)
-        if obj["type"] == "player":
-            object_map[filename] = PlayerData.from_json(obj["data"])
-        elif obj["type"] == "team":
-            object_map[filename] = TeamData.from_json(obj["data"])
-        elif obj["type"] == "stadium":
-            object_map[filename] = StadiumData.from_json(obj["data"])
-        else:
-            raise ValueError(f"Cannot load object of unknown type '{obj['type']}'")
+OBJECT_CLASSES = {"player": PlayerData, "team": TeamData, "stadium": StadiumData}
+OBJECT_TYPES = {k: "player" for k in PLAYER_OBJECTS} | {k: "team" for k in TEAM_OBJECTS} | {"stadium": "stadium"}
+OBJECT_ROWS = {"player": _player_row, "team": _team_row, "stadium": _stadium_row}
+
+# what rows with no object (nan digest) point at in the tables
+NULL_KEY = "null"
+# every object loaded so far, by type and then digest (or file, for old csvs). digests are content hashes so these are
+# good for any dataframe, and an object only gets decoded the first time a data() call needs it
+OBJECTS: Dict[str, DataObjectMap] = {object_type: {} for object_type in OBJECT_CLASSES}
+# one row for each of those objects, with its stats, item stats and mods as plain numbers, by object type
+OBJECT_TABLES: Dict[str, pd.DataFrame] = {}
+
+
+def _object_from_json(object_type: str, data: str) -> DataObject:
+    if object_type not in OBJECT_CLASSES:
+        raise ValueError(f"Cannot load object of unknown type '{object_type}'")
+    return OBJECT_CLASSES[object_type].from_json(data)
+
+
+def _load_objects(df: pd.DataFrame, object_key: str, store: ObjectStore):
+    """
+    Decodes the objects in object_key's column that haven't been loaded yet, and adds them to their type's table
+    """
+    object_type = OBJECT_TYPES[object_key]
+    keys = df[_object_column(df, object_key)].dropna().unique()
+    new_keys = [key for key in keys if key not in OBJECTS[object_type]]
+    objects: DataObjectMap = {}
+    if object_key + "_digest" in df.columns:
+        found = store.get_many(new_keys)
+        for digest in new_keys:
+            if digest not in found:
+                raise ValueError(f"Object {digest} is missing from the object store")
+            objects[digest] = _object_from_json(*found[digest])
+    else:
+        # csvs from before the object store, that still point at object_data/<run>/*.json
+        for filename in new_keys:
+            with open("../" + filename, "r") as f:
+                obj = json.load(f)
+            objects[filename] = _object_from_json(obj["type"], obj["data"])
+
+    if object_type not in OBJECT_TABLES:
+        objects[NULL_KEY] = NULL_OBJECTS[object_key]
+    if not objects:
+        return
+    OBJECTS[object_type].update(objects)
+    rows = pd.DataFrame.from_records([OBJECT_ROWS[object_type](obj) for obj in objects.values()], index=list(objects))
+    OBJECT_TABLES[object_type] = pd.concat([OBJECT_TABLES[object_type], rows]) if object_type in OBJECT_TABLES else rows
+
+
+def _object_keys(df: pd.DataFrame, object_key: str) -> pd.Series:
+    keys = df[_object_column(df, object_key)].astype("category")
+    if NULL_KEY not in keys.cat.categories:
+        keys = keys.cat.add_categories([NULL_KEY])
+    return keys.fillna(NULL_KEY)
+
+
+def _object_values(df: pd.DataFrame, object_key: str, column: str) -> np.ndarray:
+    """
+    One of the object table's columns, for each row of df. Looked up once per distinct object, then spread over
+    the rows by category code
+    """
+    keys = df[object_key + "_key"].astype("category")
+    table = OBJECT_TABLES[OBJECT_TYPES[object_key]]
+    values = table[column].reindex(keys.cat.categories).to_numpy()
+    return values[keys.cat.codes.to_numpy()]
+
+
+def _player_stat(df: pd.DataFrame, player_key: str, kind: str, attr_key: str) -> np.ndarray:
+    # kind is raw, unbroken or broken. attributes that aren't stats come out 0, same as ones a player doesn't have
+    if kind + "_" + attr_key not in OBJECT_TABLES["player"].columns:
+        return np.zeros(len(df))
+    return _object_values(df, player_key, kind + "_" + attr_key).astype(np.float64)
+
+
+def _object_column_values(df: pd.DataFrame, object_key: str) -> np.ndarray:
+    keys = df[object_key + "_key"].astype("category")
+    objects = np.empty(len(keys.cat.categories), dtype=object)
+    objects[:] = [OBJECTS[OBJECT_TYPES[object_key]][key] for key in keys.cat.categories]
+    return objects[keys.cat.codes.to_numpy()]
+
+
+def _meta_columns(df: pd.DataFrame) -> formulas_np.MetaColumns:
+    weather = df["weather"]
+    if not pd.api.types.is_numeric_dtype(weather):
+        # csvs that have the enum's name
+        weather = weather.astype(str).str.replace("Weather.", "", regex=False).map({w.name: int(w) for w in Weather})
+    return formulas_np.MetaColumns(
+        weather=weather.to_numpy(dtype=np.int64),
+        season=df["season"].to_numpy(dtype=np.int64),
+        day=df["day"].to_numpy(dtype=np.int64),
+        runner_count=df["runner_count"].to_numpy(dtype=np.int64),
+        top_of_inning=df["top_of_inning"].to_numpy(dtype=bool, na_value=False),
+        is_maximum_blaseball=df["is_maximum_blaseball"].to_numpy(dtype=bool, na_value=False),
+        batter_at_bats=df["batter_at_bats"].to_numpy(dtype=np.int64),
+    )
+
+
+def _vibes(df: pd.DataFrame, player_key: str) -> np.ndarray:
+    # must be pre-item
+    buoy = _object_values(df, player_key, "raw_buoyancy").astype(np.float64)
+    press = _object_values(df, player_key, "raw_pressurization").astype(np.float64)
+    cinn = _object_values(df, player_key, "raw_cinnamon").astype(np.float64)
+
+    frequency = 6 + np.rint(10 * buoy).astype(np.int64)
+
+    # Pull from pre-computed sin values
+    sin_phase = SIN_PHASES.lookup(frequency, df["day"].to_numpy(dtype=np.int64))
+    # Original formula:
+    # sin_phase = math.sin(math.pi * ((2 / frequency) * day + 0.5))
+
+    vibes = 0.5 * ((sin_phase - 1) * press + (sin_phase + 1) * cinn)
+    mods = _object_values(df, player_key, "mod_mask").astype(np.int64)
+    scattered = (mods & formulas_np.COLUMN_MOD_BITS[Mod.SCATTERED]) != 0
+    return np.where(scattered, 0, vibes)
+
+
+def _multiplier(df: pd.DataFrame, object_key: str, team_key: str, position: str, attr_key: str) -> np.ndarray:
+    player = formulas_np.PlayerColumns(
+        mods=_object_values(df, object_key, "mod_mask").astype(np.int64),
+        raw_stats={},
+        stats={},
+        has_night_vision_goggles=_object_values(df, object_key, "night_vision_goggles").astype(bool),
+    )
+    team = formulas_np.TeamColumns(
+        mods=_object_values(df, team_key, "mod_mask").astype(np.int64),
+        roster_size=_object_values(df, team_key, "roster_size").astype(np.int64),
+    )
+    stadium = formulas_np.StadiumColumns(
+        **{
+            attr: _object_values(df, "stadium", attr).astype(np.float64)
+            for attr in formulas_np.STADIUM_ATTRS + ["mod_count"]
+        }
+    )
+    return formulas_np.get_multiplier(player, team, position, attr_key, _meta_columns(df), stadium)
+
+
+def _object_column(df: pd.DataFrame, object_key: str) -> str:
+    if object_key + "_digest" in df.columns:
+        return object_key + "_digest"
+    return object_key + "_file"
+
 
-    object_map[np.nan] = NULL_OBJECTS[object_key]
-    object_map[pd.NA] = NULL_OBJECTS[object_key]
+def _read_csvs(roll_type: str, season_str: str) -> pd.DataFrame:
+    all_files = braced_glob(f"../roll_data/s{season_str}*-{roll_type}.csv")
 
-    return object_map
+    df = pd.concat(
+        (
+            pd.read_csv(
+                f,
+                dtype={
+                    "stadium_id": "string",
+                    "is_strike": "boolean",
+                    "stadium_file": "string",
+                    "stadium_digest": "string",
+                },
+            )
+            for f in all_files
+        ),
+        ignore_index=True,
+    )
+    return df
+
+
+def _read_columnar(roll_type: str, season_str: str) -> Union[None, pd.DataFrame]:
+    # compacted season files, and per-fragment files that haven't been compacted yet
+    season_glob = season_str or "*"
+    all_files = braced_glob(f"../{COLUMNAR_DIR}/{roll_type}/{SEASON_FILE_PREFIX}{season_glob}.*") + braced_glob(
+        f"../{COLUMNAR_DIR}/{roll_type}/s{season_glob}-*"
+    )
+    all_files = [f for f in all_files if not f.endswith(".partial")]
+    if not all_files:
+        return None
+
+    frames = []
+    for f in all_files:
+        columns, kinds = read_columns(f)
+        frame = pd.DataFrame(columns)
+        for name, kind in kinds.items():
+            if kind == ColumnKind.CATEGORY:
+                frame[name] = frame[name].astype("category")
+            elif kind == ColumnKind.BOOL:
+                frame[name] = frame[name].astype("boolean")
+            elif kind == ColumnKind.INT_LIST:
+                # the notebooks compare these against strings like "[0, 2]", same as the csvs have
+                frame[name] = frame[name].apply(str)
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
 
 
 def data(
-    roll_type: str, season: Union[None, int, list[int]], roles: Iterable[str] = ("pitcher", "batter")
+    roll_type: str,
+    season: Union[None, int, list[int]],
+    roles: Iterable[str] = ("pitcher", "batter"),
+    objects: bool = False,
 ) -> pd.DataFrame:
     """
     Loads a dataframe with all the roll data for a particular type of roll
@@ -181,6 +331,8 @@ def data(
         seasons respectively
     :param roles: Which player roles to load. Valid values of this are listed in PLAYER_OBJECTS. Defaults to loading
         pitcher and batter
+    :param objects: Also add a *_object column with the PlayerData/TeamData/StadiumData of each row, and a
+        stat_relevant_data column, for calling formulas.py directly. player_attribute doesn't need them
     :return: A populated dataframe
     """
 
@@ -190,26 +342,34 @@ def data(
         season_str = str(season)
     else:
         season_str = "{" + ",".join(str(s) for s in season) + "}"
-    all_files = braced_glob(f"../roll_data/s{season_str}*-{roll_type}.csv")
 
-    df = pd.concat(
-        (pd.read_csv(f, dtype={"stadium_id": "string", "is_strike": "boolean", "stadium_file": "string"}) for f in all_files), ignore_index=True
-    )
-    
-    df["stat_relevant_data"] = df[STAT_RELEVANT_DATA_KEYS].apply(_get_stat_relevant_data, axis=1)
-    for object_key in itertools.chain(roles, TEAM_OBJECTS, OTHER_OBJECTS):
-        objects = _load_objects(df, object_key)
-        df[object_key + "_object"] = df[object_key + "_file"].apply(lambda k: objects[k])
-    # df.drop(f"{label}_file" for label in OBJECTS)
+    df = _read_columnar(roll_type, season_str)
+    if df is None:
+        df = _read_csvs(roll_type, season_str)
+
     for player_key in roles:
         if player_key not in PLAYER_OBJECTS:
             raise ValueError(f"Unknown player key '{player_key}'")
-        df[player_key + "_vibes"] = df[[player_key + "_object", "day"]].apply(_get_vibes, axis=1)
-        df[player_key + "_mods"] = df[player_key + "_object"].apply(_get_mods)
-        df[player_key + "_name"] = df[player_key + "_object"].apply(lambda obj: obj.name)
+
+    store = ObjectStore("../" + OBJECT_STORE_FILE, read_only=True)
+    for object_key in itertools.chain(roles, TEAM_OBJECTS, OTHER_OBJECTS):
+        _load_objects(df, object_key, store)
+        df[object_key + "_key"] = _object_keys(df, object_key)
+        if objects:
+            df[object_key + "_object"] = _object_column_values(df, object_key)
+    store.close()
+
+    if objects:
+        meta = _meta_columns(df)
+        rows = zip(*(getattr(meta, key).tolist() for key in STAT_RELEVANT_DATA_KEYS))
+        df["stat_relevant_data"] = [_get_stat_relevant_data(row) for row in rows]
+    for player_key in roles:
+        df[player_key + "_vibes"] = _vibes(df, player_key)
+        df[player_key + "_mods"] = _object_values(df, player_key, "mods")
+        df[player_key + "_name"] = _object_values(df, player_key, "name")
     for team_key in TEAM_OBJECTS:
-        df[team_key + "_mods"] = df[team_key + "_object"].apply(_get_mods)
-        df[team_key + "_name"] = df[team_key + "_object"].apply(lambda obj: obj.nickname)
+        df[team_key + "_mods"] = _object_values(df, team_key, "mods")
+        df[team_key + "_name"] = _object_values(df, team_key, "name")
 
     return df
 
@@ -238,56 +398,48 @@ def player_attribute(
             'Valid values: True, False, "negative"'
         )
 
-    attr = df[object_key + "_object"].apply(_get_player_attribute(attr_key, items, True))
-    attr_without_broken_items = df[object_key + "_object"].apply(_get_player_attribute(attr_key, items, False))
-    attr_raw = df[object_key + "_object"].apply(_get_player_attribute(attr_key, False, False))
-
-    attr_broken_items = attr - attr_without_broken_items
-    attr_unbroken_items = (attr - attr_raw) - attr_broken_items
+    attr_raw = _player_stat(df, object_key, "raw", attr_key)
+    if items:
+        sign = -1 if items == "negative" else 1
+        attr_unbroken_items = sign * _player_stat(df, object_key, "unbroken", attr_key)
+        attr_broken_items = sign * _player_stat(df, object_key, "broken", attr_key)
+    else:
+        attr_unbroken_items = attr_broken_items = 0
+    attr = attr_raw + attr_unbroken_items + attr_broken_items
 
     if mods:
         if mods == "negative":
-            cols = [
-                object_key + "_object",
-                _team_for_object(object_key) + "_object",
-                "stat_relevant_data",
-                "stadium_object",
-            ]
-            multiplier = df[cols].apply(_get_multiplier(object_key, attr_key), axis=1)
+            multiplier = _multiplier(df, object_key, _team_for_object(object_key), object_key, attr_key)
 
             attr = attr_raw / multiplier
         else:
             # todo: hardcoding this sucks but i can't think of a cleaner way to express this. it's real bad
             if attr_key != "suppression":
-                cols = [
-                    object_key + "_object",
-                    override_mod_team or _team_for_object(object_key) + "_object",
-                    "stat_relevant_data",
-                    "stadium_object",
-                ]
-                multiplier = df[cols].apply(_get_multiplier(override_mod_team or object_key, attr_key), axis=1)
+                team_key = override_mod_team.removesuffix("_object") if override_mod_team else None
+                multiplier = _multiplier(
+                    df, object_key, team_key or _team_for_object(object_key), override_mod_team or object_key, attr_key
+                )
             else:
-                cols = [object_key + "_object", "pitching_team" + "_object", "stat_relevant_data", "stadium_object"]
-                multiplier = df[cols].apply(_get_multiplier("pitcher", attr_key), axis=1)
+                multiplier = _multiplier(df, object_key, "pitching_team", "pitcher", attr_key)
 
             attr = attr_raw * multiplier
 
     if items:
-        attr += attr_unbroken_items  # *multiplier
+        attr = attr + attr_unbroken_items  # *multiplier
     if broken_items:
-        attr += attr_broken_items  # *multiplier
+        attr = attr + attr_broken_items  # *multiplier
 
-    hype = df["pitching_team_hype"] - df["batting_team_hype"]
-    attr += hype * hype_coef
+    hype = (df["pitching_team_hype"] - df["batting_team_hype"]).to_numpy(dtype=np.float64)
+    attr = attr + hype * hype_coef
 
     if invert:
         attr = 1 - attr
 
     if vibes:
-        vibe = df[object_key + "_vibes"]
+        vibe = df[object_key + "_vibes"].to_numpy(dtype=np.float64)
         attr = attr * (1 + 0.2 * vibe)
 
-    return attr
+    return pd.Series(attr, index=df.index)
 
 
 def player_attribute_group(
@@ -343,7 +495,7 @@ def player_attribute_group(
 
 
 def stadium_attribute(df: pd.DataFrame, attr_key: str, *, center: bool = True):
-    return df["stadium_object"].apply(_get_stadium_attribute(attr_key)) - 0.5 * center
+    return pd.Series(_object_values(df, "stadium", attr_key).astype(np.float64) - 0.5 * center, index=df.index)
 
 
 def stadium_attribute_all(df: pd.DataFrame, *, center: bool = True):
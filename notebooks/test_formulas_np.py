@@ -0,0 +1,88 @@
+import sys
+
+import numpy as np
+
+import load
+
+import formulas  # noqa: E402
+import formulas_np  # noqa: E402
+
+# threshold -> the roll data it gets checked on
+ROLL_TYPES = {
+    "strike": "strikes",
+    "swing_strike": "swing-on-strike",
+    "swing_ball": "swing-on-ball",
+    "contact_strike": "contact",
+    "contact_ball": "contact",
+    "foul": "fouls",
+    "hr": "hr",
+    "fly_or_ground": "fly",
+    "out": "out",
+    "double": "doubles",
+    "triple": "triples",
+}
+WITH_FIELDER = ["out", "double", "triple"]
+# in the order _args takes them
+OBJECT_KEYS = ["batter", "batting_team", "pitcher", "pitching_team", "fielder", "stadium"]
+
+
+def _args(threshold: str, batter, batting_team, pitcher, pitching_team, fielder, stadium, meta):
+    if threshold == "strike":
+        return batter, batting_team, pitcher, pitching_team, stadium, meta, False
+    if threshold == "foul":
+        return batter, batting_team, stadium, meta
+    if threshold in WITH_FIELDER:
+        return batter, batting_team, pitcher, pitching_team, fielder, stadium, meta
+    return batter, batting_team, pitcher, pitching_team, stadium, meta
+
+
+def _scalar(threshold: str, df):
+    fn = getattr(formulas, f"get_{threshold}_threshold")
+    values = []
+    for objects in zip(*(df[key + "_object"] for key in OBJECT_KEYS), df["stat_relevant_data"]):
+        try:
+            value = fn(*_args(threshold, *objects))
+        except (ZeroDivisionError, TypeError):
+            # a multiplier of 0, or a negative number to a fractional power
+            value = None
+        values.append(np.nan if value is None or isinstance(value, complex) else value)
+    return np.array(values, dtype=np.float64)
+
+
+def _vectorized(threshold: str, df):
+    columns = {}
+    for key in OBJECT_KEYS:
+        objects = df[key + "_object"].tolist()
+        if key in load.TEAM_OBJECTS:
+            columns[key] = formulas_np.TeamColumns.from_objects(objects)
+        elif key == "stadium":
+            columns[key] = formulas_np.StadiumColumns.from_objects(objects)
+        else:
+            columns[key] = formulas_np.PlayerColumns.from_objects(objects)
+    meta = formulas_np.MetaColumns.from_objects(df["stat_relevant_data"].tolist())
+    fn = getattr(formulas_np, f"get_{threshold}_threshold")
+    return fn(*_args(threshold, *(columns[key] for key in OBJECT_KEYS), meta))
+
+
+def _test(season: int):
+    """
+    Checks that formulas_np gives exactly what formulas does for every row of a season's roll data
+    """
+    failed = False
+    for threshold, roll_type in ROLL_TYPES.items():
+        roles = ("pitcher", "batter", "fielder") if threshold in WITH_FIELDER else ("pitcher", "batter")
+        df = load.data(roll_type, season=season, roles=roles, objects=True)
+        if "fielder_object" not in df:
+            df["fielder_object"] = load.NULL_OBJECTS["fielder"]
+
+        scalar = _scalar(threshold, df)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vectorized = _vectorized(threshold, df)
+        same = (scalar == vectorized) | (np.isnan(scalar) & np.isnan(vectorized))
+        print(f"{threshold:<16} {roll_type:<16} {len(df):>8} rows {np.count_nonzero(~same):>6} different")
+        failed |= not same.all()
+    return failed
+
+
+if __name__ == "__main__":
+    exit(1 if _test(int(sys.argv[1]) if len(sys.argv) > 1 else 18) else 0)
@@ -0,0 +1,132 @@
+import hashlib
+import json
+import os
+import sqlite3
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+OBJECT_STORE_FILE = "object_data/objects.sqlite"
+
+# digests are written to every csv row, 8 bytes keeps them short and is plenty for a few million objects
+DIGEST_SIZE = 8
+
+# objects are inserted in batches of this many
+STORE_BATCH_SIZE = 256
+
+
+def canonical_json(data: str) -> str:
+    """
+    Mods are sets, so to_json writes them in whatever order the set iterates in. That changes between
+    processes (string hashing is randomized) and even after a pickle round trip, so sort them before
+    anything gets hashed - otherwise two fragments saving the same player wouldn't share it.
+    """
+    obj = json.loads(data)
+    if "mods" in obj:
+        obj["mods"] = sorted(obj["mods"])
+    if "_mods_by_type" in obj:
+        obj["_mods_by_type"] = {mod_type: sorted(mods) for mod_type, mods in obj["_mods_by_type"].items()}
+    return json.dumps(obj)
+
+
+def object_digest(object_type: str, data: str) -> str:
+    """
+    The compact id a csv row uses for a saved object. `data` is the object's canonical_json(), so the same
+    version of a player saved by two fragments gets the same digest and is only stored once.
+    """
+    return hashlib.blake2b(
+        object_type.encode("utf-8") + b"\0" + data.encode("utf-8"), digest_size=DIGEST_SIZE
+    ).hexdigest()
+
+
+class ObjectStore:
+    """
+    Append-only store for the objects (players, teams, stadiums) referenced by the roll csvs, keyed by digest.
+    One sqlite file is shared by every fragment of a dataset; concurrent writers just insert-or-ignore.
+
+    A connection can only be used by the thread that opened it, so this opens its connection the first time
+    it's used - for SaveCsv that's on the writer thread.
+    """
+
+    def __init__(self, path: str = OBJECT_STORE_FILE, read_only: bool = False):
+        self.path = path
+        self.read_only = read_only
+        self.connection: Optional[sqlite3.Connection] = None
+        self.pending: List[Tuple[str, str, bytes]] = []
+        # (object id, last update time) -> digest, for everything put() in this run
+        self.digests: Dict[Tuple[Optional[str], str], str] = {}
+
+    def connect(self) -> sqlite3.Connection:
+        if self.connection is not None:
+            return self.connection
+
+        if self.read_only:
+            self.connection = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            return self.connection
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # fragments running in parallel all write here, so wait for the lock instead of failing
+        self.connection = sqlite3.connect(self.path, timeout=600)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS objects (digest TEXT PRIMARY KEY, type TEXT NOT NULL, data BLOB NOT NULL)"
+        )
+        self.connection.commit()
+        return self.connection
+
+    def put(self, object_id: Optional[str], last_update_time: str, object_type: str, data: str) -> str:
+        digest = self.add(object_type, data)
+        self.digests[(object_id, last_update_time)] = digest
+        return digest
+
+    def add(self, object_type: str, data: str) -> str:
+        data = canonical_json(data)
+        digest = object_digest(object_type, data)
+        self.pending.append((digest, object_type, zlib.compress(data.encode("utf-8"))))
+        if len(self.pending) >= STORE_BATCH_SIZE:
+            self.flush()
+        return digest
+
+    def flush(self):
+        if not self.pending:
+            return
+        connection = self.connect()
+        with connection:
+            connection.executemany("INSERT OR IGNORE INTO objects VALUES (?, ?, ?)", self.pending)
+        self.pending = []
+
+    def get_many(self, digests: Iterable[str]) -> Dict[str, Tuple[str, str]]:
+        """
+        digest -> (object type, json data) for every digest that's in the store
+        """
+        connection = self.connect()
+        digests = list(digests)
+        found = {}
+        # stay under sqlite's limit on query parameters
+        for start in range(0, len(digests), 500):
+            chunk = digests[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for digest, object_type, data in connection.execute(
+                f"SELECT digest, type, data FROM objects WHERE digest IN ({placeholders})", chunk
+            ):
+                found[digest] = (object_type, zlib.decompress(data).decode("utf-8"))
+        return found
+
+    def merge_from(self, path: str):
+        """
+        Adds every object from another store file, e.g. one a remote worker sent back
+        """
+        self.flush()
+        connection = self.connect()
+        connection.execute("ATTACH DATABASE ? AS other", (path,))
+        try:
+            with connection:
+                connection.execute("INSERT OR IGNORE INTO objects SELECT digest, type, data FROM other.objects")
+        finally:
+            connection.execute("DETACH DATABASE other")
+
+    def close(self):
+        self.flush()
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
@@ -1,22 +1,124 @@
-import json
 import os
-from csv import DictWriter
+import pickle
+import queue
+import threading
+from csv import DictWriter, writer as csv_writer
+from enum import Enum, unique
 from typing import Dict
 
 from data import DataObject
 from formulas import StatRelevantData
+from object_store import ObjectStore
+
+# columns of the roll csvs, before the *_digest columns for the saved objects
+ROW_FIELDS = [
+    "event_type",
+    "event_time",
+    "roll",
+    "passed",
+    "batting_team_hype",
+    "pitching_team_hype",
+    "game_id",
+    "play_count",
+    "ball_count",
+    "strike_count",
+    "out_count",
+    "home_score",
+    "away_score",
+    "inning",
+    "baserunner_count",
+    "baserunners",
+    "baserunners_next",
+    "is_strike",
+    "strike_roll",
+    "strike_threshold",
+    "fielder_roll",
+    "batter_consecutive_hits",
+    "weather",
+    "season",
+    "day",
+    "runner_count",
+    "top_of_inning",
+    "is_maximum_blaseball",
+    "batter_at_bats",
+]
+
+# kept as lists in the rows, the csv has them as str(list)
+LIST_FIELDS = [ROW_FIELDS.index("baserunners"), ROW_FIELDS.index("baserunners_next")]
+
+# rows are handed to the writer thread in batches of this many
+ROW_BATCH_SIZE = 256
+
+
+@unique
+class RollDataFormat(Enum):
+    CSV = "csv"
+    # typed columns, see columnar.py
+    COLUMNAR = "columnar"
+
+
+class CsvWriterThread(threading.Thread):
+    """
+    Does the file writing for SaveCsv (and serializing saved objects into the object store) off the simulation thread.
+    Work is queued as (function, args) and done in order; close() waits until all of it is written.
+    """
+
+    def __init__(self, max_queued: int = 1000):
+        super().__init__(name="csv-writer", daemon=True)
+        self.queue = queue.Queue(max_queued)
+        self.error = None
+        self.start()
+
+    def submit(self, fn, *args):
+        if self.error is not None:
+            raise self.error
+        self.queue.put((fn, args))
+
+    def run(self):
+        while True:
+            fn, args = self.queue.get()
+            if fn is None:
+                return
+            if self.error is not None:
+                # keep draining so submit() can't block forever, the error gets raised there or in close()
+                continue
+            try:
+                fn(*args)
+            except BaseException as e:
+                self.error = e
+
+    def close(self):
+        self.queue.put((None, ()))
+        self.join()
+        if self.error is not None:
+            raise self.error
+
+
+def save_object(store: ObjectStore, snapshot: bytes):
+    obj = pickle.loads(snapshot)
+    store.put(obj.id, obj.last_update_time, obj.object_type, obj.to_json())
 
 
 class SaveCsv:
-    def __init__(self, run_name: str, category_name: str, last_saved_update: Dict[str, str]):
-        self.object_dir = f"object_data/{run_name}"
-        os.makedirs(self.object_dir, exist_ok=True)
+    def __init__(
+        self,
+        run_name: str,
+        category_name: str,
+        last_saved_update: Dict[str, str],
+        writer: CsvWriterThread,
+        store: ObjectStore,
+    ):
         self.final_filename = f"roll_data/{run_name}-{category_name}.csv"
         self.partial_filename = f"{self.final_filename}.partial"
-        # Created when first row is written
+        # Created (on the writer thread) when the first row is written
         self.file = None
         self.csv = None
+        self.fieldnames = None
         self.last_saved_object = last_saved_update
+        self.writer = writer
+        # only touched on the writer thread
+        self.store = store
+        self.pending_rows = []
 
     def write(
         self,
@@ -34,68 +136,85 @@ class SaveCsv:
         event_time,
     ):
         # fmt: off
-        row = {
-            "event_type": event_type,
-            "event_time": event_time,
-            "roll": roll,
-            "passed": passed,
-            "batting_team_hype": save_objects['stadium'].hype if not update["topOfInning"] else 0,
-            "pitching_team_hype": save_objects['stadium'].hype if update["topOfInning"] else 0,
-            "game_id": update["id"],
-            "play_count": update["playCount"],
-            "ball_count": update["atBatBalls"],
-            "strike_count": update["atBatStrikes"],
-            "out_count": update["halfInningOuts"],
-            "home_score": update["homeScore"],
-            "away_score": update["awayScore"],
-            "inning": update["inning"],
-            "baserunner_count": update["baserunnerCount"],
-            "baserunners": str(update["basesOccupied"]),
-            "baserunners_next": str(baserunners_next),
-            "is_strike": is_strike,
-            "strike_roll": strike_roll,
-            "strike_threshold": strike_threshold,
-            "fielder_roll": fielder_roll,
-            "batter_consecutive_hits": save_objects['batter'].consecutive_hits,
-            "weather": meta.weather,
-            "season": meta.season,
-            "day": meta.day,
-            "runner_count": meta.runner_count,
-            "top_of_inning": meta.top_of_inning,
-            "is_maximum_blaseball": meta.is_maximum_blaseball,
-            "batter_at_bats": meta.batter_at_bats,
-        }
+        values = (
+            event_type,
+            event_time,
+            roll,
+            passed,
+            save_objects['stadium'].hype if not update["topOfInning"] else 0,
+            save_objects['stadium'].hype if update["topOfInning"] else 0,
+            update["id"],
+            update["playCount"],
+            update["atBatBalls"],
+            update["atBatStrikes"],
+            update["halfInningOuts"],
+            update["homeScore"],
+            update["awayScore"],
+            update["inning"],
+            update["baserunnerCount"],
+            list(update["basesOccupied"]),
+            list(baserunners_next) if baserunners_next is not None else None,
+            is_strike,
+            strike_roll,
+            strike_threshold,
+            fielder_roll,
+            save_objects['batter'].consecutive_hits,
+            meta.weather,
+            meta.season,
+            meta.day,
+            meta.runner_count,
+            meta.top_of_inning,
+            meta.is_maximum_blaseball,
+            meta.batter_at_bats,
+        )
         # fmt: on
 
+        objects = []
         for save_key, obj in save_objects.items():
             # S20 (1-based) spends a ridiculous amount of time repeatedly
             # converting NullPlayer to JSON without this check.
             # I think it's because of KLoNGs whose stats aren't available yet.
             if obj.id == None and obj.last_update_time == "1970-01-01T00:00:00.000Z":
                 continue
-            file_path = f"{self.object_dir}/{obj.id}-{obj.last_update_time}.json".replace(":", "_")
             if obj.id not in self.last_saved_object or self.last_saved_object[obj.id] != obj.last_update_time:
-                to_save = {
-                    "type": obj.object_type,
-                    "last_update_time": obj.last_update_time,
-                    # yes, there's JSON in the JSON. yo dawg
-                    "data": obj.to_json(),
-                }
-                with open(file_path, "w") as f:
-                    json.dump(to_save, f)
+                # the object keeps changing after this, so the writer gets a snapshot of it as it is now.
+                # pickling is much cheaper than to_json, which happens on the writer thread
+                snapshot = pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+                self.writer.submit(save_object, self.store, snapshot)
                 self.last_saved_object[obj.id] = obj.last_update_time
-            row[save_key + "_file"] = file_path
+            # the digest is only known once the writer has serialized it, so the row refers to it by version
+            objects.append((save_key + "_digest", (obj.id, obj.last_update_time)))
+
+        self.pending_rows.append((values, objects))
+        if len(self.pending_rows) >= ROW_BATCH_SIZE:
+            self.flush()
 
+    def flush(self):
+        if self.pending_rows:
+            self.writer.submit(self._write_rows, self.pending_rows)
+            self.pending_rows = []
+
+    def _write_rows(self, rows):
+        # runs on the writer thread
         if self.csv is None:
+            values, objects = rows[0]
+            self.fieldnames = ROW_FIELDS + [key for key, _ in objects]
             # for the first row we need this defined, otherwise areas where only some stadiums exist (~s13) will break
-            if "stadium_file" not in row:
-                row["stadium_file"] = None
+            if "stadium_digest" not in self.fieldnames:
+                self.fieldnames.append("stadium_digest")
 
             self.file = open(self.partial_filename, "w", newline="", encoding="utf-8")
-            self.csv = DictWriter(self.file, fieldnames=list(row.keys()), extrasaction="ignore")
-            self.csv.writeheader()
+            self.csv = csv_writer(self.file)
+            self.csv.writerow(self.fieldnames)
 
-        self.csv.writerow(row)
+        digests = self.store.digests
+        object_fields = self.fieldnames[len(ROW_FIELDS) :]
+        for values, objects in rows:
+            objects = dict(objects)
+            values = list(values)
+            for i in LIST_FIELDS:
+                values[i] = str(values[i])
+            self.csv.writerow(values + list(digests[objects[key]] if key in objects else "" for key in object_fields))
 
     def writeItem(
         self, element: str, roll: float, season: int, day: int, roll_type: str, category: str, prefix_index: int = -1
@@ -110,6 +229,10 @@ class SaveCsv:
             "prefix_index": prefix_index,
         }
 
+        self.writer.submit(self._write_item_row, row)
+
+    def _write_item_row(self, row):
+        # runs on the writer thread
         if self.csv is None:
             self.file = open(self.partial_filename, "w", newline="", encoding="utf-8")
             self.csv = DictWriter(self.file, fieldnames=list(row.keys()), extrasaction="ignore")
@@ -118,6 +241,13 @@ class SaveCsv:
         self.csv.writerow(row)
 
     def close(self):
+        self.flush()
+        self.writer.submit(self._close)
+
+    def _close(self):
+        # runs on the writer thread
+        # every object the csv refers to has to be in the store before the csv gets its real name
+        self.store.flush()
         if not self.file:
             return
         self.file.close()
@@ -1,7 +1,6 @@
-import json
+import copy
 import math
 import os
-import re
 import sys
 import itertools
 
@@ -19,26 +18,21 @@ from data import (
     get_feed_between,
     stat_indices,
 )
-from output import SaveCsv
+from object_store import ObjectStore
+from columnar import SaveColumnar
+from output import CsvWriterThread, RollDataFormat, SaveCsv
 from rng import Rng
 from dataclasses import dataclass
 from enum import Enum, unique
-from typing import List, Optional
-from formulas import (
-    get_contact_strike_threshold,
-    get_contact_ball_threshold,
-    get_hr_threshold,
-    get_strike_threshold,
-    get_foul_threshold,
-    StatRelevantData,
-    get_swing_ball_threshold,
-    get_swing_strike_threshold,
-    get_fly_or_ground_threshold,
-    get_out_threshold,
-    get_double_threshold,
-    get_triple_threshold,
-)
+from typing import Optional
+from formulas import SeasonFormulas, StatRelevantData, season_formulas
 from item_gen import ItemRollType, roll_item
+from tracing import LazyLabel, TraceCategory, TraceLevel, Tracer
+from roll_stream import RollStreamWriter
+from roll_log import RingRollLog, StreamedCsvLog
+from corrections import NO_CORRECTIONS, get_corrections
+from checkpoint import mark_complete, write_checkpoint
+from description import EventDescription
 
 
 @unique
@@ -83,19 +77,64 @@ class Csv(Enum):
     UPGRADE_OUT = "upgrade_out"
     SWEEP = "sweep"
 
+
 # todo: get rid of this crime, it breaks under multiprocessing anyway
 seen_odds = {}
 
+# Resim attributes that aren't simulation state - outputs and per-run settings. A resumed run sets these up itself
+CHECKPOINT_EXCLUDED = frozenset(
+    {
+        "out_file",
+        "tracer",
+        "trace_rolls",
+        "raise_on_errors",
+        "run_name",
+        "csvs",
+        "csv_writer",
+        "object_store",
+        "odds_log",
+        "roll_log",
+        "roll_log_event_id",
+        "stat_meta",
+        "stat_meta_fields",
+        "formulas",
+        "roll_log_index",
+        "roll_stream",
+        "checkpoint_dir",
+        "corrections_registry",
+        # set again for every event
+        "corrections",
+    }
+)
+
+
 class Resim:
-    def __init__(self, rng, out_file, run_name, raise_on_errors=True, csvs_to_log=[], stream_file_dir=None):
+    def __init__(
+        self,
+        rng,
+        out_file,
+        run_name,
+        raise_on_errors=True,
+        csvs_to_log=[],
+        stream_file_dir=None,
+        compact_players=False,
+        trace_level=TraceLevel.DEBUG,
+        trace_categories=None,
+        roll_log=None,
+        roll_format=RollDataFormat.CSV,
+        checkpoint_dir=None,
+    ):
         object_cache = {}
         self.rng = rng
         self.out_file = out_file
+        self.tracer = Tracer(out_file, trace_level, trace_categories)
+        # checked on every roll, so look it up once
+        self.trace_rolls = self.tracer.enabled(TraceCategory.ROLL)
         if stream_file_dir is None:
-            self.stream_file = None
+            self.roll_stream = None
         else:
-            self.stream_file = open(stream_file_dir / (run_name + ".ndjson"), "w")
-        self.data = GameData()
+            self.roll_stream = RollStreamWriter(stream_file_dir / run_name.replace(":", "_"))
+        self.data = GameData(compact_players)
         self.fetched_days = set()
         self.started_days = set()
         self.raise_on_errors = raise_on_errors
@@ -112,6 +151,8 @@ class Resim:
         self.outs = 0
         self.max_outs = 3
         self.game_id = None
+        self.corrections_registry = get_corrections()
+        self.corrections = NO_CORRECTIONS
         self.play = None
         self.weather = Weather.VOID
         self.batter = self.data.get_player(None)
@@ -125,24 +166,53 @@ class Resim:
         self.event = None
         self.prev_event = None
 
-        self.run_name = run_name.replace(":", "_")
+        self.run_name = run_name.replace(":", "_") if run_name else None
 
         if run_name:
             os.makedirs("roll_data", exist_ok=True)
             run_name = run_name.replace(":", "_")
             csvs_to_log = csvs_to_log or list(Csv)
-            self.csvs = {csv: SaveCsv(run_name, csv.value, object_cache) for csv in Csv if csv in csvs_to_log}
+            self.csv_writer = CsvWriterThread()
+            self.object_store = ObjectStore()
+            save_class = SaveColumnar if roll_format == RollDataFormat.COLUMNAR else SaveCsv
+            self.csvs = {
+                csv: save_class(run_name, csv.value, object_cache, self.csv_writer, self.object_store)
+                for csv in Csv
+                if csv in csvs_to_log
+            }
         else:
+            self.csv_writer = None
+            self.object_store = None
             self.csvs = {}
-        self.roll_log: List[LoggedRoll] = []
-        self.odds_log: List[OddsLog] = []
+        # None, or one of the sinks from roll_log.py
+        self.roll_log = roll_log
+        self.roll_log_event_id = None
+        # what get_stat_meta last returned, and what it was made from
+        self.stat_meta = None
+        self.stat_meta_fields = None
+        # the formulas for the season of the current event, made the first time the season is seen
+        self.formulas: Optional[SeasonFormulas] = None
+        self.roll_log_index = 0
+        self.odds_log = StreamedCsvLog(f"roll_data/odds_{self.run_name}.csv") if run_name else None
+        # write a checkpoint here before every game day, if set
+        self.checkpoint_dir = checkpoint_dir
 
     def print(self, *args, **kwargs):
-        if self.out_file is None:
+        if not self.tracer.enabled(TraceCategory.MISC):
             return
         print(*args, **kwargs, file=self.out_file)
 
+    def trace(self, category: TraceCategory, message: str, *args, level: TraceLevel = TraceLevel.INFO):
+        # message is a str.format template, only filled in if the category is enabled
+        self.tracer.log(category, message, *args, level=level)
+
+    def tracing(self, category: TraceCategory, level: TraceLevel = TraceLevel.INFO) -> bool:
+        return self.tracer.enabled(category, level)
+
     def error(self, *args, **kwargs):
+        if isinstance(self.roll_log, RingRollLog):
+            # the rolls that led up to it
+            self.roll_log.dump()
         if not self.out_file:
             return
         if self.out_file != sys.stdout:
@@ -154,103 +224,41 @@ class Resim:
 
     def handle(self, event):
         self.setup_data(event)
-
-        # hardcoding a fix for a data error - jands don't get the overperforming mod from earlbirds
-        # in chron until after the game ends, but we need it earlier
-        if self.game_id == "8577919c-4288-4404-bde2-694f5e7a38d1":
-            jands = self.data.get_team("a37f9158-7f82-46bc-908c-c9e2dda7c33b")
-            if not jands.has_mod(Mod.OVERPERFORMING):
-                jands.add_mod(Mod.OVERPERFORMING, ModType.PERMANENT)
-                jands.last_update_time = self.event["created"]
-
-        # another workaround for bad data
-        if self.game_id == "c608b5db-29ad-4216-a703-8f0627057523":
-            caleb_novak = self.data.get_player("0eddd056-9d72-4804-bd60-53144b785d5c")
-            if caleb_novak.has_mod(Mod.ELSEWHERE):
-                caleb_novak.remove_mod(Mod.ELSEWHERE, ModType.PERMANENT)
-                caleb_novak.last_update_time = self.event["created"]
-
-        # missed a "happy to be home" event 45 secs before the fragment starts
-        if self.game_id == "ee0066a5-8408-4270-a5d8-8e66abf55d03":
-            vela = self.data.get_player("4ca52626-58cd-449d-88bb-f6d631588640")
-            if not vela.has_mod(Mod.OVERPERFORMING):
-                vela.add_mod(Mod.OVERPERFORMING, ModType.PERMANENT)
-                vela.remove_mod(Mod.UNDERPERFORMING, ModType.PERMANENT)
-
-        # sometimes we start a fragment in the middle of a game and we wanna make sure we have the proper blood type
-        a_blood_type_overrides = {
-            "0aa57b7d-d78f-4090-8f0e-9273c285e698": Mod.PSYCHIC,
-            "d2e75d15-0348-4a2b-88ad-5a9205173494": Mod.PSYCHIC,
-            "bb5ad5c8-22b7-41a4-83f9-47b8ed8825b2": Mod.LOVE,
-            "61ac8e12-0c98-4d21-b827-eac77c0b407f": Mod.ACIDIC,
-            "d18f5735-17f2-40ed-949c-6ccfb69828be": Mod.FIERY,
-            "ff050ef3-c532-42bb-8c74-551a31784142": Mod.FIERY,
-            "55b8be59-93ac-4756-8f24-7a0ba0e0499f": Mod.AA,
-            "5007d0ef-2404-490f-97d7-69b98b08979a": Mod.PSYCHIC,
-            "2a7247fb-62cd-4f84-9f4e-77a1949bc1fb": Mod.BASE_INSTINCTS,
-            "bbd0c719-b6f9-45ae-946e-0d674d3811a9": Mod.H20,
-            "fe105cf7-ff56-42c7-b918-0ee3ab394f58": Mod.ELECTRIC,
-            "48ad61f1-a231-4061-bb84-331ce891626a": Mod.ZERO,
-            "b0a8c4c3-eeca-49a7-bf47-771a614bb3f3": Mod.LOVE,
-            "a0e2ba91-16d5-4f39-9bc8-7ee35042fae0": Mod.AAA,
-        }
-        if self.game_id in a_blood_type_overrides:
-            blood_type = a_blood_type_overrides[self.game_id]
-            shoe_thieves = self.data.get_team("bfd38797-8404-4b38-8b82-341da28b1f83")
-            if not shoe_thieves.has_mod(blood_type):
-                shoe_thieves.add_mod(blood_type, ModType.GAME)
-                shoe_thieves.last_update_time = self.event["created"]
-
-        self.print()
-        if not self.update and self.play and self.play > 1:
-            self.print("!!! missing update data")
-        self.print(
-            "===== {} {}/{} {}".format(
+        # memoized formula values only last for the event
+        self.stat_meta = None
+        self.stat_meta_fields = None
+        if self.roll_stream is not None:
+            self.roll_stream.start_event(event["id"], event["created"])
+
+        # mods chron has wrong or missing for this game, see corrections.json
+        for fix in self.corrections.game_mods:
+            target = self.data.get_team(fix.team_id) if fix.team_id else self.data.get_player(fix.player_id)
+            if target.has_mod(fix.mod) != fix.present:
+                if fix.present:
+                    target.add_mod(fix.mod, fix.mod_type)
+                else:
+                    target.remove_mod(fix.mod, fix.mod_type)
+                for mod in fix.also_remove:
+                    target.remove_mod(mod, fix.mod_type)
+                if fix.touch:
+                    target.last_update_time = self.event["created"]
+
+        if self.tracing(TraceCategory.EVENT):
+            self.trace(TraceCategory.EVENT, "")
+            if not self.update and self.play and self.play > 1:
+                self.trace(TraceCategory.EVENT, "!!! missing update data")
+            self.trace(
+                TraceCategory.EVENT,
+                "===== {} {}/{} {}",
                 event["created"],
                 self.update["id"],
                 self.update["playCount"],
                 self.weather.name,
             )
-        )
-        self.print(f"===== {self.ty.value} {self.desc}")
-        self.print(f"===== rng pos: {self.rng.get_state_str()}")
-
-        event_adjustments = {
-            "2021-03-01T20:22:00.461Z": -1,  # fix for missing data
-            "2021-03-01T21:00:16.006Z": -1,  # fix for missing data
-            "2021-03-02T12:24:43.753Z": 1,  # fix for missing data
-            "2021-03-02T13:25:06.682Z": -1,  # fix for missing data
-            "2021-03-02T14:00:15.843Z": 1,
-            "2021-04-05T15:23:26.102Z": 1,
-            "2021-04-12T15:19:56.073Z": -2,
-            "2021-04-12T15:22:50.866Z": 1, # there's a low roll on the item damage here
-            "2021-05-13T15:00:17.580Z": -1,
-            "2021-05-13T16:38:59.820Z": 387,  # skipping latesiesta
-            "2021-06-16T06:22:07.019Z": 1, # caused by Seeker returning from Elsewhere and immediately rolling Seeker for the other Elsewhere player
-
-            "2021-06-24T10:13:01.619Z": 4, # Caused by Advance & Item Damage handling. Two Siobhan's on base. Needs 3 more damage rolls. 2 rolls for Siobhan #1 scoring, and 1 roll for Siobhan #2 advancing bases.
-
-            "2021-07-26T17:36:38.281Z": 4, # maxi socks item gem broken
-            "2021-07-26T18:09:17.129Z": 2, # observed?
-            "2021-07-26T18:20:09.430Z": 1, # consumer attack item defend push?
-
-            # the roll in 2021-07-26T17:09:56.933Z really happens earlier, this event being delayed breaks some stuff
-            "2021-07-26T17:09:54.480Z": 1,
-            "2021-07-26T17:09:57.341Z": -1,
-            # "2021-07-22T09:18:04.585Z": 3, # no idea
-            "2021-07-23T08:27:00.305Z": 1, # grand slam weird? Amphitheater is only stadium with both balloon mods - Hot Air Balloon Pop Check?
-            "2021-07-23T09:11:48.567Z": 1, # grand slam weird? Amphitheater is only stadium with both balloon mods - Hot Air Balloon Pop Check?
-            "2021-07-23T10:19:55.173Z": 1, # grand slam weird? Amphitheater is only stadium with both balloon mods - Hot Air Balloon Pop Check?
-            "2021-07-22T10:07:23.346Z": -1, # no idea
-
-            "2021-07-23T14:22:51.364Z": -1, # there's a couple different places this can go, not sure where the problem is
-
-            "2021-07-19T18:11:34.836Z": 1, # ??
-            "2021-07-21T11:13:17.022Z": 3, # ??? i think this home run is actually fake somehow
-            "2021-07-21T21:08:45.629Z": 1, # elsewhere scattering?
-            "2021-07-23T22:07:38.888Z": 2, # fix for item gen problem
-        }
-        to_step = event_adjustments.get(self.event["created"])
+            self.trace(TraceCategory.EVENT, "===== {} {}", self.ty.value, self.desc)
+            self.trace(TraceCategory.EVENT, "===== rng pos: {}", self.rng.get_state_str())
+
+        to_step = self.corrections.rng_step
         if to_step is not None:
             self.rng.step(to_step)
             time = self.event["created"]
@@ -269,17 +277,24 @@ class Resim:
             # skipping elsewhere return
             return
 
-        if self.batter:
-            self.print(
-                f"- batter mods: {self.batter.print_mods()} + "
-                f"{self.batting_team.print_mods()} ({self.batter.name}) "
-            )
-        if self.pitcher:
-            self.print(
-                f"- pitcher mods: {self.pitcher.print_mods()} + "
-                f"{self.pitching_team.print_mods()} ({self.pitcher.name})"
-            )
-        self.print(f"- stadium mods: {self.stadium.print_mods()} ({self.stadium.nickname})")
+        if self.tracing(TraceCategory.MODS):
+            if self.batter:
+                self.trace(
+                    TraceCategory.MODS,
+                    "- batter mods: {} + {} ({}) ",
+                    self.batter.print_mods(),
+                    self.batting_team.print_mods(),
+                    self.batter.name,
+                )
+            if self.pitcher:
+                self.trace(
+                    TraceCategory.MODS,
+                    "- pitcher mods: {} + {} ({})",
+                    self.pitcher.print_mods(),
+                    self.pitching_team.print_mods(),
+                    self.pitcher.name,
+                )
+            self.trace(TraceCategory.MODS, "- stadium mods: {} ({})", self.stadium.print_mods(), self.stadium.nickname)
 
         if self.ty == EventType.STUCK:
             return
@@ -350,37 +365,11 @@ class Resim:
             return
 
         self.is_strike = None
-        if self.ty in [
-            EventType.WALK,
-            EventType.BALL,
-            EventType.MILD_PITCH,
-        ]:
-            self.handle_ball()
-
-        elif self.ty in [
-            EventType.FLY_OUT,
-            EventType.GROUND_OUT,
-        ]:
-            self.handle_out()
-
-        elif self.ty in [
-            EventType.STRIKEOUT,
-            EventType.STRIKE,
-        ]:
-            self.handle_strike()
-
-        elif self.ty in [EventType.HOME_RUN]:
-            self.handle_hr()
-
-        elif self.ty in [EventType.HIT]:
-            self.handle_base_hit()
-
-        elif self.ty in [EventType.FOUL_BALL]:
-            self.handle_foul()
-
+        handler = PITCH_HANDLERS.get(self.ty)
+        if handler is not None:
+            handler(self)
         else:
             self.print(f"!!! unknown type: {self.ty.value}")
-        pass
 
         self.handle_batter_reverb()
 
@@ -448,11 +437,7 @@ class Resim:
                 if self.season >= 15:
                     self.roll("reset items? idk?")
 
-                if self.event["created"] in [
-                    # these two are probably not the same reason
-                    "2021-04-13T01:06:52.165Z",
-                    "2021-04-13T01:28:04.005Z",
-                ]:
+                if "salmon_extra_roll" in self.corrections.flags:
                     self.roll("extra for some reason")
 
                 if (
@@ -499,8 +484,13 @@ class Resim:
             predicted_away_pitcher = [u["data"]["awayPitcher"] for u in raw_updates if u["data"]["awayPitcher"]][0]
             real_away_pitcher = [u["data"]["awayPitcher"] for u in raw_updates if u["data"]["awayPitcher"] and u["data"]["gameStart"]][0]
             
-            self.print(f"predicted home pitcher: {predicted_home_pitcher}, predicted away pitcher: {predicted_away_pitcher}")
-            self.print(f"real home pitcher: {real_home_pitcher}, real away pitcher: {real_away_pitcher}")
+            self.trace(
+                TraceCategory.ODDS,
+                "predicted home pitcher: {}, predicted away pitcher: {}",
+                predicted_home_pitcher,
+                predicted_away_pitcher,
+            )
+            self.trace(TraceCategory.ODDS, "real home pitcher: {}, real away pitcher: {}", real_home_pitcher, real_away_pitcher)
             mismatch = predicted_home_pitcher != real_home_pitcher or predicted_away_pitcher != real_away_pitcher
 
             if mismatch:
@@ -513,7 +503,7 @@ class Resim:
                 game = self.data.get_update(game_id, 5)
                 weather = Weather(game["weather"])
                 stadium = self.data.get_stadium(game['stadiumId'])
-                self.roll(f"postseason weather ({weather.name}) day {day}, upgrades: {stadium.weather}")
+                self.roll(LazyLabel("postseason weather ({}) day {}, upgrades: {}", weather.name, day, stadium.weather))
 
                 self.calc_next_game_odds(game_id, use_early_data=False)
 
@@ -553,15 +543,24 @@ class Resim:
         home_odds = game_data['homeOdds']
         away_odds = game_data['awayOdds']
 
-        self.print("===")
+        self.trace(TraceCategory.ODDS, "===")
 
         fuzz_roll = self.roll("odds fuzzing")
         delta = (0.03+fuzz_roll*0.07)-0.05
 
-        self.print(f"=== matchup: s{game_data['season']+1}d{game_data['day']+1}, game {game_id}, {game_data['awayTeamNickname']}@{game_data['homeTeamNickname']}")
-        self.print(f"=== {game_data['awayPitcherName']} @ {game_data['homePitcherName']}")
-        self.print(f"home odds: {game_data['homeOdds']}")
-        self.print(f"away odds: {game_data['awayOdds']}")
+        if self.tracing(TraceCategory.ODDS):
+            self.trace(
+                TraceCategory.ODDS,
+                "=== matchup: s{}d{}, game {}, {}@{}",
+                game_data["season"] + 1,
+                game_data["day"] + 1,
+                game_id,
+                game_data["awayTeamNickname"],
+                game_data["homeTeamNickname"],
+            )
+            self.trace(TraceCategory.ODDS, "=== {} @ {}", game_data["awayPitcherName"], game_data["homePitcherName"])
+            self.trace(TraceCategory.ODDS, "home odds: {}", game_data["homeOdds"])
+            self.trace(TraceCategory.ODDS, "away odds: {}", game_data["awayOdds"])
 
         home_wins = standings["wins"].get(game_data["homeTeam"], 0)
         away_wins = standings["wins"].get(game_data["awayTeam"], 0)
@@ -607,10 +606,10 @@ class Resim:
         home_defense_stars = sum(defense_stars(self.data.get_player(batter_id)) for batter_id in home_team.lineup)
         away_defense_stars = sum(defense_stars(self.data.get_player(batter_id)) for batter_id in away_team.lineup)
 
-        self.print(f"home wins: {home_wins}, away wins: {away_wins}")
-        self.print(f"home bstars: {home_batting_stars}, away bstars: {away_batting_stars}")
-        self.print(f"home pstars: {home_pitching_stars}, away pstars: {away_pitching_stars}")
-        self.print(f"fuzz roll: {fuzz_roll} (delta: {delta})")
+        self.trace(TraceCategory.ODDS, "home wins: {}, away wins: {}", home_wins, away_wins)
+        self.trace(TraceCategory.ODDS, "home bstars: {}, away bstars: {}", home_batting_stars, away_batting_stars)
+        self.trace(TraceCategory.ODDS, "home pstars: {}, away pstars: {}", home_pitching_stars, away_pitching_stars)
+        self.trace(TraceCategory.ODDS, "fuzz roll: {} (delta: {})", fuzz_roll, delta)
 
         if abs(delta) < abs(home_odds-0.5) or delta > 0:
             # unambiguous
@@ -621,10 +620,10 @@ class Resim:
                 unfuzzed_home_odds = home_odds + delta
                 unfuzzed_away_odds = away_odds - delta
 
-            self.print(f"unambiguous unfuzzed home odds: {unfuzzed_home_odds}")
-            self.print(f"unambiguous unfuzzed away odds: {unfuzzed_away_odds}")
+            self.trace(TraceCategory.ODDS, "unambiguous unfuzzed home odds: {}", unfuzzed_home_odds)
+            self.trace(TraceCategory.ODDS, "unambiguous unfuzzed away odds: {}", unfuzzed_away_odds)
 
-            if not data_known_invalid:
+            if not data_known_invalid and self.odds_log is not None:
                 self.odds_log.append(OddsLog(
                     game_id=game_id,
                     season=game_data["season"],
@@ -662,7 +661,7 @@ class Resim:
             for odd in [unfuzzed_home_odds, unfuzzed_away_odds]:
                 rounded = str(odd)[:10]
                 if rounded in seen_odds:
-                    self.print(f"odds {rounded} already seen at: {seen_odds[rounded]}")
+                    self.trace(TraceCategory.ODDS, "odds {} already seen at: {}", rounded, seen_odds[rounded])
                     seen_odds[rounded].append(game_id)
                 else:
                     seen_odds[rounded] = [game_id]
@@ -671,12 +670,12 @@ class Resim:
             for sign in [-1, 1]:
                 unfuzzed_home_odds = home_odds + delta*sign
                 unfuzzed_away_odds = away_odds - delta*sign
-                self.print(f"*possible* unfuzzed home odds: {unfuzzed_home_odds}")
-                self.print(f"*possible* unfuzzed away odds: {unfuzzed_away_odds}")
+                self.trace(TraceCategory.ODDS, "*possible* unfuzzed home odds: {}", unfuzzed_home_odds)
+                self.trace(TraceCategory.ODDS, "*possible* unfuzzed away odds: {}", unfuzzed_away_odds)
                 for odd in [unfuzzed_home_odds, unfuzzed_away_odds]:
                     rounded = str(odd)[:10]
                     if rounded in seen_odds:
-                        self.print(f"odds {rounded} already seen at: {seen_odds[rounded]}")
+                        self.trace(TraceCategory.ODDS, "odds {} already seen at: {}", rounded, seen_odds[rounded])
                         seen_odds[rounded].append(game_id)
                     else:
                         seen_odds[rounded] = [game_id]
@@ -729,526 +728,401 @@ class Resim:
             self.print("away team mods:", self.away_team._raw_mods)
             self.roll("echo team mod")
 
-        if self.ty in [
-            EventType.HALF_INNING,
-            EventType.SUN_30,
-            EventType.HOLIDAY_INNING,
-            EventType.SALMON_SWIM,
-        ]:
-            self.handle_inning_start()
-            return True
+        handler = MISC_HANDLERS.get(self.ty)
+        if handler is not None:
+            return handler(self)
 
-        if self.ty in [
-            EventType.HOME_FIELD_ADVANTAGE,
-            EventType.BECOME_TRIPLE_THREAT,
-            EventType.SOLAR_PANELS_AWAIT,
-            EventType.SOLAR_PANELS_ACTIVATION,
-            EventType.EVENT_HORIZON_AWAITS,
-            EventType.EVENT_HORIZON_ACTIVATION,
-            EventType.HOMEBODY,
-            EventType.SUPERYUMMY,
-            EventType.PERK,
-            EventType.SHAME_DONOR,
-            EventType.PSYCHO_ACOUSTICS,
-            EventType.AMBITIOUS,
-            EventType.UNAMBITIOUS,
-            EventType.LATE_TO_THE_PARTY,
-            EventType.MIDDLING,
-            EventType.SHAMING_RUN,
-            EventType.EARLBIRD,
-            EventType.PRIZE_MATCH,
-            EventType.A_BLOOD_TYPE,
-            EventType.COASTING,
-            EventType.TEAM_RECEIVED_GIFT,
-            EventType.BLESSING_OR_GIFT_WON,
-            EventType.PLAYER_SOUL_INCREASED,
-        ]:
-            if self.ty == EventType.PRIZE_MATCH:
-                self.create_item(self.event, ItemRollType.PRIZE, self.prev_event)
-
-            if self.ty == EventType.BLESSING_OR_GIFT_WON:
-                if "aDense" in self.desc or "eDense" in self.desc:
-                    team_id = self.event["teamTags"][0]
-                    team = self.data.get_team(team_id)
-
-                    eligible_items = []
-                    for player_id in team.lineup + team.rotation + team.shadows:
-                        player = self.data.get_player(player_id)
-                        for item in player.items:
-                            if "aDense" in self.desc and "aDense" not in item.elements:
-                                eligible_items.append(item)
-                            if "eDense" in self.desc and "eDense" not in item.elements:
-                                eligible_items.append(item)
-                    self.print(f"eligible items: {len(eligible_items)}, 20% is {len(eligible_items)*0.2}, children: {len(self.event['metadata']['children'])}")
-
-            # skipping pregame messages
-            return True
-        if self.ty in [
-            EventType.OVER_UNDER,
-            EventType.UNDER_OVER,
-            EventType.UNDERSEA,
-            EventType.ADDED_MOD_FROM_OTHER_MOD,
-            EventType.REMOVED_MODIFICATION,
-            EventType.CHANGED_MODIFIER,
-            EventType.REMOVED_MULTIPLE_MODIFICATIONS_ECHO,
-            EventType.ADDED_MULTIPLE_MODIFICATIONS_ECHO,
-            EventType.LEAGUE_MODIFICATION_REMOVED,
-        ]:
-            # skipping mod added/removed
-            
-            # a blood type is here so we can query subevent
-            if self.ty == EventType.ADDED_MOD_FROM_OTHER_MOD:
-                if self.event["metadata"]["source"] == "A":
-                    added_mod = Mod(self.event["metadata"]["mod"])
-                    blood_mods = [Mod.AAA, Mod.AA, Mod.ACIDIC, Mod.BASE_INSTINCTS, Mod.ZERO, Mod.O_NO, Mod.H20, Mod.ELECTRIC, Mod.LOVE, Mod.FIERY, Mod.PSYCHIC, Mod.GROWTH]
-                    
-                    expected_index = blood_mods.index(added_mod)
-                    self.roll("a blood type", expected_index/len(blood_mods), (expected_index+1)/len(blood_mods))
+    def handle_skipped_event(self):
+        return True
 
-                if self.event["metadata"]["source"] == "PSYCHOACOUSTICS":
-                    added_mod = self.event["metadata"]["mod"]
-                    mod_pool = [str(m) for group in self.away_team._raw_mods for m in group]
-                    
-                    expected_index = mod_pool.index(added_mod)
-                    self.roll("which mod?", expected_index/len(mod_pool), (expected_index+1)/len(mod_pool))
-            return True
-        if self.ty in [
-            EventType.BLACK_HOLE,
-            EventType.BLACK_HOLE_BLACK_HOLE,
-            EventType.SUN2,
-            EventType.SUN_2_OUTCOME,
-            EventType.BLACK_HOLE_OUTCOME,
-            EventType.SUN_SUN_PRESSURE,
-        ]:
-            if self.ty == EventType.SUN2 and "catches some rays" in self.desc:
-                self.roll("sun dialed target")
-
-            if self.ty == EventType.BLACK_HOLE:
-                if "is compressed by gamma" in self.desc:
-                    self.roll("unholey target")
-
-            if self.ty == EventType.BLACK_HOLE_BLACK_HOLE:
-                # uhhhh what etc
-                self.roll("bhbh target?")
-                self.roll("bhbh target?")
-            # skipping sun 2 / black hole proc
-            return True
-        if self.ty in [
-            EventType.PLAYER_STAT_INCREASE,
-            EventType.PLAYER_STAT_DECREASE,
-            EventType.PLAYER_STAT_DECREASE_FROM_SUPERALLERGIC,
-        ]:
-            if "are Bottom Dwellers" in self.desc:
-                team = self.data.get_team(self.event["teamTags"][0])
-                # boost amounts are 0.04 * roll + 0.01, rolled in this order:
-                # Omniscience, Tenaciousness, Watchfulness, Anticapitalism, Chasiness,
-                # Shakespearianism, Suppression, Unthwackability, Coldness, Overpowerment, Ruthlessness,
-                # Base Thirst, Laserlikeness, Ground Friction, Continuation, Indulgence,
-                # Tragicness, Buoyancy, Thwackability, Moxie, Divinity, Musclitude, Patheticism, Martyrdom, Cinnamon
-                for player_id in team.lineup:
-                    for _ in range(25):
-                        self.roll("stat")
-                for player_id in team.rotation:
-                    for _ in range(25):
-                        self.roll("stat")
-
-            if "re-congealed differently" in self.desc:
-                for _ in range(25):
-                    self.roll("stat")
+    def handle_inning_start_event(self):
+        self.handle_inning_start()
+        return True
 
-            if "is Partying" in self.desc:
-                # we want to roll this only if this is a *holiday inning* party,
-                # and we currently have no nice way of seeing that
-                # we can check the date, but after_party is also a thing.
-                # and there's at least one occasion where a player has both, and we can't disambiguate
-                team = self.data.get_team(self.event["teamTags"][0])
-                if (
-                    not team.has_mod(Mod.PARTY_TIME) and not team.has_mod(Mod.AFTER_PARTY) and self.day < 27
-                ) or self.event["created"] in [
-                    "2021-05-17T21:21:21.303Z",
-                    "2021-05-17T21:22:11.076Z",
-                ]:
-                    # this is a holiday inning party (why 26?)
-                    for _ in range(26):
-                        self.roll("stat")
-
-            if "entered the Shadows" in self.desc:
-                # fax machine dunk
-                # boost amounts are 0.04 * roll + 0.01, rolled in this order:
-                # Shakespearianism, Suppression, Unthwackability, Coldness, Overpowerment, Ruthlessness, Tragicness,
-                # Buoyancy, Thwackability, Moxie, Divinity, Musclitude, Patheticism, Martyrdom,
-                # Base Thirst, Laserlikeness, Ground Friction, Continuation, Indulgence,
-                # Omniscience, Tenaciousness, Watchfulness, Anticapitalism, Chasiness, Cinnamon
+    def handle_pregame_message(self):
+        if self.ty == EventType.PRIZE_MATCH:
+            self.create_item(self.event, ItemRollType.PRIZE, self.prev_event)
+
+        if self.ty == EventType.BLESSING_OR_GIFT_WON:
+            if "aDense" in self.desc or "eDense" in self.desc:
+                team_id = self.event["teamTags"][0]
+                team = self.data.get_team(team_id)
+
+                eligible_items = []
+                for player_id in team.lineup + team.rotation + team.shadows:
+                    player = self.data.get_player(player_id)
+                    for item in player.items:
+                        if "aDense" in self.desc and "aDense" not in item.elements:
+                            eligible_items.append(item)
+                        if "eDense" in self.desc and "eDense" not in item.elements:
+                            eligible_items.append(item)
+                self.print(f"eligible items: {len(eligible_items)}, 20% is {len(eligible_items)*0.2}, children: {len(self.event['metadata']['children'])}")
+
+        # skipping pregame messages
+        return True
+
+    def handle_mod_change_message(self):
+        # skipping mod added/removed
+
+        # a blood type is here so we can query subevent
+        if self.ty == EventType.ADDED_MOD_FROM_OTHER_MOD:
+            if self.event["metadata"]["source"] == "A":
+                added_mod = Mod(self.event["metadata"]["mod"])
+                blood_mods = [Mod.AAA, Mod.AA, Mod.ACIDIC, Mod.BASE_INSTINCTS, Mod.ZERO, Mod.O_NO, Mod.H20, Mod.ELECTRIC, Mod.LOVE, Mod.FIERY, Mod.PSYCHIC, Mod.GROWTH]
+
+                expected_index = blood_mods.index(added_mod)
+                self.roll("a blood type", expected_index/len(blood_mods), (expected_index+1)/len(blood_mods))
+
+            if self.event["metadata"]["source"] == "PSYCHOACOUSTICS":
+                added_mod = self.event["metadata"]["mod"]
+                mod_pool = [str(m) for group in self.away_team._raw_mods for m in group]
+
+                expected_index = mod_pool.index(added_mod)
+                self.roll("which mod?", expected_index/len(mod_pool), (expected_index+1)/len(mod_pool))
+        return True
+
+    def handle_sun2_black_hole(self):
+        if self.ty == EventType.SUN2 and "catches some rays" in self.desc:
+            self.roll("sun dialed target")
+
+        if self.ty == EventType.BLACK_HOLE:
+            if "is compressed by gamma" in self.desc:
+                self.roll("unholey target")
+
+        if self.ty == EventType.BLACK_HOLE_BLACK_HOLE:
+            # uhhhh what etc
+            self.roll("bhbh target?")
+            self.roll("bhbh target?")
+        # skipping sun 2 / black hole proc
+        return True
 
+    def handle_stat_change(self):
+        if "are Bottom Dwellers" in self.desc:
+            team = self.data.get_team(self.event["teamTags"][0])
+            # boost amounts are 0.04 * roll + 0.01, rolled in this order:
+            # Omniscience, Tenaciousness, Watchfulness, Anticapitalism, Chasiness,
+            # Shakespearianism, Suppression, Unthwackability, Coldness, Overpowerment, Ruthlessness,
+            # Base Thirst, Laserlikeness, Ground Friction, Continuation, Indulgence,
+            # Tragicness, Buoyancy, Thwackability, Moxie, Divinity, Musclitude, Patheticism, Martyrdom, Cinnamon
+            for player_id in team.lineup:
                 for _ in range(25):
                     self.roll("stat")
-            if "clocked in" in self.desc:
+            for player_id in team.rotation:
                 for _ in range(25):
                     self.roll("stat")
 
-            # skip party/consumer stat change
-            return True
-        if self.ty in [
-            EventType.PLAYER_BORN_FROM_INCINERATION,
-            EventType.ENTER_HALL_OF_FLAME,
-            EventType.EXIT_HALL_OF_FLAME,
-            EventType.PLAYER_HATCHED,
-        ]:
-            # skipping incineration stuff
-            return True
-        if self.ty in [
-            EventType.PLAYER_REMOVED_FROM_TEAM,
-            EventType.MODIFICATION_CHANGE,
-        ]:
-            # skipping echo/static
-            return True
-        if self.ty == EventType.INCINERATION and "parent" in self.event["metadata"]:
-            # incin has two events and one's a subevent so ignore one of them
-            return True
-        if self.ty == EventType.PITCHER_CHANGE:
-            # s skipping pitcher change?
-            return True
-        if self.ty in [
-            EventType.REMOVED_MOD,
-            EventType.PLAYER_MOVE,
-            EventType.INVESTIGATION_PROGRESS,
-            EventType.ENTERING_CRIMESCENE,
-            EventType.WEATHER_EVENT,
-            EventType.RUNS_SCORED,
-            EventType.TUNNEL_FLED_ELSEWHERE,
-            EventType.TUNNEL_FOUND_NOTHING,
-            EventType.TRADE_FAILED,
-            EventType.TRADE_SUCCESS,
-            EventType.PLAYER_MOVE_FAILED_FORCE,
-        ]:
-            return True
+        if "re-congealed differently" in self.desc:
+            for _ in range(25):
+                self.roll("stat")
 
-        if self.ty == EventType.EXISTING_PLAYER_ADDED_TO_ILB:
-            if "pulled through the Rift" in self.desc:
-                # The Second Wyatt Masoning
-                # The rolls normally assigned to "Let's Go" happen before the Second Wyatt Masoning
-                if self.desc == "Wyatt Mason was pulled through the Rift.":
-                    self.started_days.add((13, 72))
+        if "is Partying" in self.desc:
+            # we want to roll this only if this is a *holiday inning* party,
+            # and we currently have no nice way of seeing that
+            # we can check the date, but after_party is also a thing.
+            # and there's at least one occasion where a player has both, and we can't disambiguate
+            team = self.data.get_team(self.event["teamTags"][0])
+            if (
+                not team.has_mod(Mod.PARTY_TIME) and not team.has_mod(Mod.AFTER_PARTY) and self.day < 27
+            ) or "holiday_inning_party" in self.corrections.flags:
+                # this is a holiday inning party (why 26?)
+                for _ in range(26):
+                    self.roll("stat")
 
-                    self.start_game_day(13, 72)
-                self.generate_player()
-            return True
-        if self.ty in [
-            EventType.PLAYER_ADDED_TO_TEAM,
-            EventType.BIG_DEAL,
-            EventType.WON_INTERNET_SERIES,
-            EventType.UNDEFINED_TYPE,
-        ]:
-            # skip postseason
-            return True
-        if self.ty == EventType.POSTSEASON_SPOT:
+        if "entered the Shadows" in self.desc:
+            # fax machine dunk
+            # boost amounts are 0.04 * roll + 0.01, rolled in this order:
+            # Shakespearianism, Suppression, Unthwackability, Coldness, Overpowerment, Ruthlessness, Tragicness,
+            # Buoyancy, Thwackability, Moxie, Divinity, Musclitude, Patheticism, Martyrdom,
+            # Base Thirst, Laserlikeness, Ground Friction, Continuation, Indulgence,
+            # Omniscience, Tenaciousness, Watchfulness, Anticapitalism, Chasiness, Cinnamon
+
+            for _ in range(25):
+                self.roll("stat")
+        if "clocked in" in self.desc:
+            for _ in range(25):
+                self.roll("stat")
+
+        # skip party/consumer stat change
+        return True
+
+    def handle_incineration(self):
+        # incin has two events and one's a subevent so ignore one of them
+        return "parent" in self.event["metadata"]
+
+    def handle_added_to_ilb(self):
+        if "pulled through the Rift" in self.desc:
+            # The Second Wyatt Masoning
+            # The rolls normally assigned to "Let's Go" happen before the Second Wyatt Masoning
+            if self.desc == "Wyatt Mason was pulled through the Rift.":
+                self.started_days.add((13, 72))
+
+                self.start_game_day(13, 72)
             self.generate_player()
-            return True
-        if self.ty in [
-            EventType.REVERB_ROTATION_SHUFFLE,
-            EventType.REVERB_FULL_SHUFFLE,
-            EventType.REVERB_LINEUP_SHUFFLE,
-        ]:
-            # skip reverb
-            self.data.fetch_teams(self.event["created"], 30)
-            return True
-        if self.ty == EventType.PLAYER_TRADED:
-            # skip feedback
-            return True
-        if self.ty in [EventType.INNING_END]:
-            # skipping inning outing
-            if self.update["inning"] == 2:
-                # so if this *is* a coffee 3s game the pitchers are definitely gonna have the mod
-                # even if we pulled too early to catch it getting added. so i'm cheating here who cares
+        return True
 
-                # it's also specifically permanent mods, not seasonal mods that may or may not be echoed/received
-                self.print(
-                    f"home pitcher mods: {self.home_pitcher.print_mods(ModType.PERMANENT)} "
-                    f"({self.home_pitcher.name})"
-                )
-                self.print(
-                    f"away pitcher mods: {self.away_pitcher.print_mods(ModType.PERMANENT)} "
-                    f"({self.away_pitcher.name})"
-                )
-                if self.home_pitcher.has_mod(Mod.TRIPLE_THREAT, ModType.PERMANENT) or self.weather == Weather.COFFEE_3S:
-                    self.roll("remove home pitcher triple threat")
-                if self.away_pitcher.has_mod(Mod.TRIPLE_THREAT, ModType.PERMANENT) or self.weather == Weather.COFFEE_3S:
-                    self.roll("remove away pitcher triple threat")
-            # todo: salmon
-            return True
+    def handle_postseason_spot(self):
+        self.generate_player()
+        return True
 
-        if self.ty in [
-            EventType.GAME_END,
-            EventType.ADDED_MOD,
-            EventType.REMOVED_MOD,
-            EventType.MOD_EXPIRES,
-            EventType.FINAL_STANDINGS,
-            EventType.TEAM_WAS_SHAMED,
-            EventType.TEAM_DID_SHAME,
-            EventType.ELIMINATED_FROM_POSTSEASON,
-            EventType.POSTSEASON_ADVANCE,
-            EventType.HYPE_BUILT,
-            EventType.PRACTICING_MODERATION,
-            EventType.WIN_COLLECTED_REGULAR,
-            EventType.WIN_COLLECTED_POSTSEASON,
-            EventType.GAME_OVER,
-            EventType.BALLOONS_INFLATED,
-            EventType.VOICEMAIL,
-        ]:
-            # skipping game end
+    def handle_reverb_shuffle(self):
+        # skip reverb
+        self.data.fetch_teams(self.event["created"], 30)
+        return True
 
-            if self.ty == EventType.GAME_END and self.weather.is_coffee():
-                # end of coffee game redaction
-                rosters = (
-                    self.home_team.lineup + self.home_team.rotation + self.away_team.lineup + self.away_team.rotation
-                )
-                for player_id in rosters:
-                    player = self.data.get_player(player_id)
-                    if player.has_mod(Mod.COFFEE_PERIL) and not player.has_mod(Mod.FORCE):
-                        self.roll(f"redaction ({player.name})")
+    def handle_inning_end(self):
+        # skipping inning outing
+        if self.update["inning"] == 2:
+            # so if this *is* a coffee 3s game the pitchers are definitely gonna have the mod
+            # even if we pulled too early to catch it getting added. so i'm cheating here who cares
 
-            return True
-        if self.ty == EventType.THIEVES_GUILD_PLAYER:
-            self.roll("thieves guild?")
-            self.roll("thieves guild?")
+            # it's also specifically permanent mods, not seasonal mods that may or may not be echoed/received
+            self.print(
+                f"home pitcher mods: {self.home_pitcher.print_mods(ModType.PERMANENT)} "
+                f"({self.home_pitcher.name})"
+            )
+            self.print(
+                f"away pitcher mods: {self.away_pitcher.print_mods(ModType.PERMANENT)} "
+                f"({self.away_pitcher.name})"
+            )
+            if self.home_pitcher.has_mod(Mod.TRIPLE_THREAT, ModType.PERMANENT) or self.weather == Weather.COFFEE_3S:
+                self.roll("remove home pitcher triple threat")
+            if self.away_pitcher.has_mod(Mod.TRIPLE_THREAT, ModType.PERMANENT) or self.weather == Weather.COFFEE_3S:
+                self.roll("remove away pitcher triple threat")
+        # todo: salmon
+        return True
 
-            if self.event["created"] in ["2021-07-19T18:38:17.282Z", "2021-07-22T12:24:29.719Z", "2021-07-22T21:24:03.118Z", "2021-07-23T03:26:25.413Z", "2021-07-20T14:31:06.765Z", "2021-07-21T10:27:28.256Z", "2021-07-21T11:34:52.841Z"]:
-                self.roll("thieves guild?")
-            else:
-                self.print(f"no extra thieves guild roll?")
+    def handle_game_end(self):
+        # skipping game end
 
-            return True
-        if self.ty == EventType.THIEVES_GUILD_ITEM:
-            self.roll("thieves guild?")
+        if self.ty == EventType.GAME_END and self.weather.is_coffee():
+            # end of coffee game redaction
+            rosters = (
+                self.home_team.lineup + self.home_team.rotation + self.away_team.lineup + self.away_team.rotation
+            )
+            for player_id in rosters:
+                player = self.data.get_player(player_id)
+                if player.has_mod(Mod.COFFEE_PERIL) and not player.has_mod(Mod.FORCE):
+                    self.roll(LazyLabel("redaction ({})", player.name))
+
+        return True
+
+    def handle_thieves_guild_player(self):
+        self.roll("thieves guild?")
+        self.roll("thieves guild?")
+
+        if "thieves_guild_extra_roll" in self.corrections.flags:
             self.roll("thieves guild?")
-            return True
-        if self.ty in [EventType.LETS_GO]:
-            # todo: figure out the real logic here, i'm sure there's some
-            # a lot of these seem to be end-of-week rolls, eg. super roamin procs
-            extra_start_rolls = {
-                (12, 27): 9,
-                (12, 99): 2,
-                (12, 113): 1,
-                (13, 99): 2,
-                (14, 3): 2,
-                (14, 27): 216, # earlsiesta reading
-                (15, 27): 220, # earlsiesta reading
-                (15, 57): 2,
-                (15, 99): 2,
-                (16, 27): 220, # earlsiesta reading
-                (16, 99): 2,
-                (16, 106): 1,
-                (17, 27): 218, # earlsiesta reading
-                # (17, 88): 1,
-                (17, 99): 2,
-                (18, 0): 1,
-                (18, 99): 2,
-                (19, 18): 13,
-                (19, 27): 229, # earlsiesta reading
-                (19, 36): 13,
-                (19, 45): 10,
-                (19, 54): 10,
-                (19, 63): 10,
-                (19, 81): 10,
-                (19, 108): 10,
-                (19, 113): 2,
-                (20, 9): 10,
-                (20, 63): 10,
-                (20, 108): 10,
-                (20, 112): 1,
-                (22, 9): 14,
-                (22, 18): 14,
-                (22, 36): 14,
-                (22, 45): 14,
-                (22, 63): 14,
-                (22, 72): 17569, # latesiesta (what the heck)
-                (22, 81): 14,
-                (22, 90): 14,
-                (22, 99): 14+4, # what's the extra 4? wild card picks?
-            }
+        else:
+            self.print(f"no extra thieves guild roll?")
 
-            game_id = self.event["gameTags"][0] # state not setup yet
+        return True
 
-            sd = (self.event['season'], self.event['day'])
-            self.print(f"game start: {sd} (zero-indexed)")  
-            if sd not in self.started_days:
-                self.started_days.add(sd)
+    def handle_thieves_guild_item(self):
+        self.roll("thieves guild?")
+        self.roll("thieves guild?")
+        return True
 
-                # todo: when does this go before, when does it go after?                
-                for _ in range(extra_start_rolls.get(sd, 0)):
-                    self.roll(f"align start {game_id} day {self.day}")
+    def handle_lets_go(self):
+        # todo: figure out the real logic here, i'm sure there's some
+        # a lot of these seem to be end-of-week rolls, eg. super roamin procs
+        extra_start_rolls = {
+            (12, 27): 9,
+            (12, 99): 2,
+            (12, 113): 1,
+            (13, 99): 2,
+            (14, 3): 2,
+            (14, 27): 216, # earlsiesta reading
+            (15, 27): 220, # earlsiesta reading
+            (15, 57): 2,
+            (15, 99): 2,
+            (16, 27): 220, # earlsiesta reading
+            (16, 99): 2,
+            (16, 106): 1,
+            (17, 27): 218, # earlsiesta reading
+            # (17, 88): 1,
+            (17, 99): 2,
+            (18, 0): 1,
+            (18, 99): 2,
+            (19, 18): 13,
+            (19, 27): 229, # earlsiesta reading
+            (19, 36): 13,
+            (19, 45): 10,
+            (19, 54): 10,
+            (19, 63): 10,
+            (19, 81): 10,
+            (19, 108): 10,
+            (19, 113): 2,
+            (20, 9): 10,
+            (20, 63): 10,
+            (20, 108): 10,
+            (20, 112): 1,
+            (22, 9): 14,
+            (22, 18): 14,
+            (22, 36): 14,
+            (22, 45): 14,
+            (22, 63): 14,
+            (22, 72): 17569, # latesiesta (what the heck)
+            (22, 81): 14,
+            (22, 90): 14,
+            (22, 99): 14+4, # what's the extra 4? wild card picks?
+        }
 
-                self.start_game_day(self.event['season'], self.event['day'])
+        game_id = self.event["gameTags"][0] # state not setup yet
 
+        sd = (self.event['season'], self.event['day'])
+        self.print(f"game start: {sd} (zero-indexed)")  
+        if sd not in self.started_days:
+            self.started_days.add(sd)
 
-            return True
-        if self.ty in [EventType.PLAY_BALL]:
-            # play ball (already handled above but we want to fetch a tiny tick later)
-            if self.event["day"] not in self.fetched_days:
-                self.fetched_days.add(self.event["day"])
+            # todo: when does this go before, when does it go after?                
+            for _ in range(extra_start_rolls.get(sd, 0)):
+                self.roll(LazyLabel("align start {} day {}", game_id, self.day))
 
-                timestamp = self.event["created"]
-                self.data.fetch_league_data(timestamp, 20)
+            self.start_game_day(self.event['season'], self.event['day'])
 
-            self.print(self.stadium.mods)
 
-            return True
-        if self.ty in [EventType.FLAG_PLANTED]:
-            for _ in range(11):
-                self.roll("flag planted")
-            return True
-        if self.ty in [EventType.RENOVATION_BUILT]:
-            if "% more " in self.desc or "% less " in self.desc:
-                self.roll("stat change")
-            return True
-        if self.ty in [EventType.LIGHT_SWITCH_TOGGLED]:
-            return True
-        if self.ty == EventType.ELEMENT_ADDED_TO_ITEM:
-            # self.print()
-            return True
-        if self.ty == EventType.TAROT_READING:
-            return True
-        if self.ty == EventType.LOVERS_LINEUP_OPTIMIZED:
-            return True
-        if self.ty in [EventType.EMERGENCY_ALERT, EventType.BIG_DEAL]:
-            if "NEW CHALLENGERS SURFACE" in self.desc:
-                # might be placing teams into divisions? divine favor? idk
-                self.roll("breach team stuff")
-                self.roll("breach team stuff")
-                self.roll("breach team stuff")
-                self.roll("breach team stuff")
-                self.roll("breach team stuff")
-                self.roll("breach team stuff")
-                self.roll("breach team stuff")
-                self.roll("breach team stuff")
-                self.roll("breach team stuff")
-                self.roll("breach team stuff")
-
-                for i in range(3):  # worms-mechs-georgias
-                    for j in range(9 + 5 + 11):  # lineup+rotation+shadows
-                        for k in range(2 + 26 + 6):  # name+stats+interview
-                            # todo: label this nicer, but these *do* line up as expected
-                            self.roll(f"breach team player gen (team {i} player {j})")
-
-                # i have no clue what this is but it makes day 73 line up.
-                for _ in range(339):
-                    self.roll("something else")
-            return True
-        if self.ty == EventType.TEAM_JOINED_LEAGUE:
-            return True
-        if self.ty == EventType.TEAM_INCINERATION_REPLACEMENT:
-            return True
-        if self.ty == EventType.TEAM_FORMED:
-            return True
-        if self.ty in [
-            EventType.ITEM_BREAKS,
-            EventType.ITEM_DAMAGE,
-            EventType.PLAYER_GAINED_ITEM,
-            EventType.PLAYER_LOST_ITEM,
-            EventType.BROKEN_ITEM_REPAIRED,
-            EventType.DAMAGED_ITEM_REPAIRED,
-            EventType.TUNNEL_STOLE_ITEM,
-        ]:
-            if self.ty == EventType.PLAYER_GAINED_ITEM and ("gained the Prized" in self.desc or "won the Prize Match!" in self.desc):
-                # prize match reward
-                self.roll("prize target")
+        return True
 
-            if self.ty == EventType.PLAYER_GAINED_ITEM and "The Community Chest Opens" in self.desc:
-                self.create_item(self.event, ItemRollType.CHEST, self.prev_event)
-            return True
-        if self.ty == EventType.PLAYER_SWAP:
-            return True
-        if self.ty in [EventType.PLAYER_HIDDEN_STAT_INCREASE, EventType.PLAYER_HIDDEN_STAT_DECREASE]:
-            return True
-        if self.ty == EventType.WEATHER_CHANGE:
-            return True
-        if self.ty == EventType.JAZZ:
-            self.print(f"(season {self.season+1} day {self.day+1}, game {self.game_id}, {self.away_team.nickname}@{self.home_team.nickname}, at {self.stadium.nickname})")
-            self.print(f"(ballpark weather: {self.stadium.weather})")
-            result_weather = self.data.get_update(self.game_id, self.play+3)["weather"]
+    def handle_play_ball(self):
+        # play ball (already handled above but we want to fetch a tiny tick later)
+        if self.event["day"] not in self.fetched_days:
+            self.fetched_days.add(self.event["day"])
 
-            if self.season == 23:
-                riff_pool = "bah boo bee bip ska ski sha shoo skoo da doo dah dee la bow bah bop wah do doh boh louie ooie ooo ah".split()
-            else:
-                riff_pool = "bah boo bee bip ska ski sha shoo da doo dah dee la bow bah bop wah do doh boh louie ooie ooo ah".split()
+            timestamp = self.event["created"]
+            self.data.fetch_league_data(timestamp, 20)
 
-            riff = self.desc.split("\U0001f3b5")[1]
-            riff_words = [r for r in riff.split() if r in riff_pool]
+        self.print(self.stadium.mods)
 
-            # todo: extract some kind of "scan for this roll pattern"
-            found_offset = None
-            for check_offset in range(25):
-                r2 = Rng(self.rng.state, self.rng.offset)
-                r2.step(check_offset)
-                
-                # i love flow control
-                count = 3 + int(r2.next() * 3)
-                if count != len(riff_words):
-                    continue
-                for word in riff_words:
-                    word_roll = r2.next()
-                    rolled_word = riff_pool[int(word_roll*len(riff_pool))]
-                    if word != rolled_word:
-                        break
-                else:
-                    found_offset = check_offset
-                    break
+        return True
 
-            if found_offset:
-                self.print(f"(found jazz riff at offset {found_offset})")
-                for _ in range(check_offset-1):
-                    self.roll("jazz extra?")
-                weather_roll = self.roll("jazz weather")
-                self.print(f"(weather index: {int(weather_roll*38)})")
-                self.roll("riff length", (len(riff_words)-3)/3, (len(riff_words)-3+1)/3)
-
-                # with open("jazz.json", "a") as f:
-                #     import json
-                #     f.write(json.dumps({"season": self.season, "day": self.day, "weather": result_weather, "roll": weather_roll, "upgrades": {k.value: v for k, v in self.stadium.weather.items()}}) + "\n")
-                
-                for word in riff_words:
-                    lo, hi = 0, 1
-                    if riff_pool.count(word) == 1:
-                        expected_idx = riff_pool.index(word)
-                        lo, hi = expected_idx/len(riff_pool), (expected_idx+1)/len(riff_pool)
-                    self.roll(F"riff word ({word})", lo, hi)
+    def handle_flag_planted(self):
+        for _ in range(11):
+            self.roll("flag planted")
+        return True
+
+    def handle_renovation_built(self):
+        if "% more " in self.desc or "% less " in self.desc:
+            self.roll("stat change")
+        return True
+
+    def handle_emergency_alert(self):
+        if "NEW CHALLENGERS SURFACE" in self.desc:
+            # might be placing teams into divisions? divine favor? idk
+            self.roll("breach team stuff")
+            self.roll("breach team stuff")
+            self.roll("breach team stuff")
+            self.roll("breach team stuff")
+            self.roll("breach team stuff")
+            self.roll("breach team stuff")
+            self.roll("breach team stuff")
+            self.roll("breach team stuff")
+            self.roll("breach team stuff")
+            self.roll("breach team stuff")
+
+            for i in range(3):  # worms-mechs-georgias
+                for j in range(9 + 5 + 11):  # lineup+rotation+shadows
+                    for k in range(2 + 26 + 6):  # name+stats+interview
+                        # todo: label this nicer, but these *do* line up as expected
+                        self.roll(LazyLabel("breach team player gen (team {} player {})", i, j))
+
+            # i have no clue what this is but it makes day 73 line up.
+            for _ in range(339):
+                self.roll("something else")
+        return True
+
+    def handle_item_change(self):
+        if self.ty == EventType.PLAYER_GAINED_ITEM and ("gained the Prized" in self.desc or "won the Prize Match!" in self.desc):
+            # prize match reward
+            self.roll("prize target")
+
+        if self.ty == EventType.PLAYER_GAINED_ITEM and "The Community Chest Opens" in self.desc:
+            self.create_item(self.event, ItemRollType.CHEST, self.prev_event)
+        return True
+
+    def handle_jazz(self):
+        self.print(f"(season {self.season+1} day {self.day+1}, game {self.game_id}, {self.away_team.nickname}@{self.home_team.nickname}, at {self.stadium.nickname})")
+        self.print(f"(ballpark weather: {self.stadium.weather})")
+        result_weather = self.data.get_update(self.game_id, self.play+3)["weather"]
+
+        if self.season == 23:
+            riff_pool = "bah boo bee bip ska ski sha shoo skoo da doo dah dee la bow bah bop wah do doh boh louie ooie ooo ah".split()
+        else:
+            riff_pool = "bah boo bee bip ska ski sha shoo da doo dah dee la bow bah bop wah do doh boh louie ooie ooo ah".split()
+
+        riff = self.description.riff
+        riff_words = [r for r in riff.split() if r in riff_pool]
+
+        # todo: extract some kind of "scan for this roll pattern"
+        found_offset = None
+        for check_offset in range(25):
+            r2 = Rng(self.rng.state, self.rng.offset)
+            r2.step(check_offset)
+
+            # i love flow control
+            count = 3 + int(r2.next() * 3)
+            if count != len(riff_words):
+                continue
+            for word in riff_words:
+                word_roll = r2.next()
+                rolled_word = riff_pool[int(word_roll*len(riff_pool))]
+                if word != rolled_word:
+                    break
             else:
-                self.error(f"could not find jazz riff")
+                found_offset = check_offset
+                break
 
-            return True
-        if self.ty == EventType.COMMUNITY_CHEST_GAME_EVENT:
-            # It looks like before season 18 there are 12 rolls after all of the items are created
-            # regardless of the number of COMMUNITY_CHEST_GAME_EVENTs,
-            # except the one at 2021-04-20T21:43:13.835Z, which has 0.
-            # After that, it's apparently 1 per event.
-            chests = {
-                "2021-04-22T06:15:48.986Z": 12,
-                "2021-04-23T14:06:46.795Z": 12,
-            }
+        if found_offset:
+            self.print(f"(found jazz riff at offset {found_offset})")
+            for _ in range(check_offset-1):
+                self.roll("jazz extra?")
+            weather_roll = self.roll("jazz weather")
+            self.print(f"(weather index: {int(weather_roll*38)})")
+            self.roll("riff length", (len(riff_words)-3)/3, (len(riff_words)-3+1)/3)
+
+            # with open("jazz.json", "a") as f:
+            #     import json
+            #     f.write(json.dumps({"season": self.season, "day": self.day, "weather": result_weather, "roll": weather_roll, "upgrades": {k.value: v for k, v in self.stadium.weather.items()}}) + "\n")
+
+            for word in riff_words:
+                lo, hi = 0, 1
+                if riff_pool.count(word) == 1:
+                    expected_idx = riff_pool.index(word)
+                    lo, hi = expected_idx/len(riff_pool), (expected_idx+1)/len(riff_pool)
+                self.roll(F"riff word ({word})", lo, hi)
+        else:
+            self.error(f"could not find jazz riff")
 
-            time = self.event["created"]
-            to_step = chests.get(time)
-            if to_step:
-                self.print(f"!!! stepping {to_step} @ {time} for Community Chest")
-                self.rng.step(to_step)
-            elif self.season >= 17:
-                self.roll("?????")
-
-            # todo: properly handle the item changes
-            if self.event["created"] == "2021-05-11T16:05:03.662Z":
-                steph_weeks = self.data.get_player("18f45a1b-76eb-4b59-a275-c64cf62afce0")
-                steph_weeks.add_mod(Mod.CAREFUL, ModType.ITEM)
-                steph_weeks.last_update_time = self.event["created"]
-
-            if self.event["created"] == "2021-05-18T13:07:33.068Z":
-                aldon_cashmoney_ii = self.data.get_player("194a78fd-3aa7-4356-8ba0-b9fdcbc0ea85")
-                aldon_cashmoney_ii.add_mod(Mod.CAREFUL, ModType.ITEM)
-                aldon_cashmoney_ii.last_update_time = self.event["created"]
-            return True
-        if self.ty == EventType.BALLPARK_MOD_RATIFIED:
-            return True
-        if self.ty == EventType.RELOAD_PROC:
-            return True
+        return True
+
+    def handle_community_chest(self):
+        # It looks like before season 18 there are 12 rolls after all of the items are created
+        # regardless of the number of COMMUNITY_CHEST_GAME_EVENTs,
+        # except the one at 2021-04-20T21:43:13.835Z, which has 0.
+        # After that, it's apparently 1 per event.
+        chests = {
+            "2021-04-22T06:15:48.986Z": 12,
+            "2021-04-23T14:06:46.795Z": 12,
+        }
+
+        time = self.event["created"]
+        to_step = chests.get(time)
+        if to_step:
+            self.print(f"!!! stepping {to_step} @ {time} for Community Chest")
+            self.rng.step(to_step)
+        elif self.season >= 17:
+            self.roll("?????")
+
+        # todo: properly handle the item changes
+        if self.event["created"] == "2021-05-11T16:05:03.662Z":
+            steph_weeks = self.data.get_player("18f45a1b-76eb-4b59-a275-c64cf62afce0")
+            steph_weeks.add_mod(Mod.CAREFUL, ModType.ITEM)
+            steph_weeks.last_update_time = self.event["created"]
+
+        if self.event["created"] == "2021-05-18T13:07:33.068Z":
+            aldon_cashmoney_ii = self.data.get_player("194a78fd-3aa7-4356-8ba0-b9fdcbc0ea85")
+            aldon_cashmoney_ii.add_mod(Mod.CAREFUL, ModType.ITEM)
+            aldon_cashmoney_ii.last_update_time = self.event["created"]
+        return True
         
     def handle_trader(self):
         # idk where to put this
@@ -1460,7 +1334,7 @@ class Resim:
             self.log_roll(Csv.MODPROC, "NoMild", mild_roll, False)
 
     def roll_hr(self, is_hr):
-        threshold = get_hr_threshold(
+        threshold = self.formulas.hr_threshold(
             self.batter, self.batting_team, self.pitcher, self.pitching_team, self.stadium, self.get_stat_meta()
         )
 
@@ -1499,11 +1373,11 @@ class Resim:
         roll = self.roll("swing")
 
         if self.is_strike:
-            threshold = get_swing_strike_threshold(
+            threshold = self.formulas.swing_strike_threshold(
                 self.batter, self.batting_team, self.pitcher, self.pitching_team, self.stadium, self.get_stat_meta()
             )
         else:
-            threshold = get_swing_ball_threshold(
+            threshold = self.formulas.swing_ball_threshold(
                 self.batter, self.batting_team, self.pitcher, self.pitching_team, self.stadium, self.get_stat_meta()
             )
 
@@ -1525,7 +1399,7 @@ class Resim:
 
     def roll_contact(self, did_contact: bool):
         if self.is_strike:
-            threshold = get_contact_strike_threshold(
+            threshold = self.formulas.contact_strike_threshold(
                 self.batter, self.batting_team, self.pitcher, self.pitching_team, self.stadium, self.get_stat_meta()
             )
 
@@ -1537,7 +1411,7 @@ class Resim:
                 self.roll("undefined (contact on strike)")            
 
         else:
-            threshold = get_contact_ball_threshold(
+            threshold = self.formulas.contact_ball_threshold(
                 self.batter, self.batting_team, self.pitcher, self.pitching_team, self.stadium, self.get_stat_meta()
             )
 
@@ -1590,7 +1464,7 @@ class Resim:
 
             swing_roll = self.roll_swing(did_swing)
             if swing_roll < 0.05:
-                ball_threshold = get_swing_ball_threshold(
+                ball_threshold = self.formulas.swing_ball_threshold(
                     self.batter, self.batting_team, self.pitcher, self.pitching_team, self.stadium, self.get_stat_meta()
                 )
 
@@ -1783,7 +1657,7 @@ class Resim:
 
     def roll_out(self, was_out):
         out_fielder_roll, out_fielder = self.roll_fielder(check_name=False)
-        out_threshold = get_out_threshold(
+        out_threshold = self.formulas.out_threshold(
             self.batter,
             self.batting_team,
             self.pitcher,
@@ -1801,7 +1675,7 @@ class Resim:
 
 
         # high roll = out, low roll = not out
-        out_roll = self.roll(f"out (to {out_fielder.name})", threshold=out_threshold, passed=not was_out)
+        out_roll = self.roll(LazyLabel("out (to {})", out_fielder.name), threshold=out_threshold, passed=not was_out)
 
         if was_out:
             self.log_roll(
@@ -1842,7 +1716,7 @@ class Resim:
 
         is_fc_dp = "into a double play!" in self.desc or "reaches on fielder's choice" in self.desc
 
-        fly_threshold = get_fly_or_ground_threshold(
+        fly_threshold = self.formulas.fly_or_ground_threshold(
             self.batter, self.batting_team, self.pitcher, self.pitching_team, self.stadium, self.get_stat_meta()
         )
 
@@ -1948,11 +1822,8 @@ class Resim:
         eligible_fielders = []
         fielder_idx = None
         desc = ""
-        # cut off extra parts with potential name collisions
         if check_name:
-            desc = self.desc.split("out to ")[1]
-            if "advances on the sacrifice" in desc or "tags up and scores!" in desc:
-                desc = desc.rsplit(". ", 1)[0]  # damn you kaj statter jr.
+            desc = self.description.fielder_text
 
         for fielder_id in self.pitching_team.lineup:
             fielder = self.data.get_player(fielder_id)
@@ -1982,15 +1853,16 @@ class Resim:
                     f"{self.rng.get_state_str()}"
                 )
 
-            matching = []
-            r2 = Rng(self.rng.state, self.rng.offset)
-            check_range = 50
-            r2.step(-check_range)
-            for i in range(check_range * 2):
-                val = r2.next()
-                if int(val * len(eligible_fielders)) == fielder_idx:
-                    matching.append(i - check_range + 1)
-            self.print(f"(matching offsets: {matching})")
+            if self.tracing(TraceCategory.ROLL, TraceLevel.DEBUG):
+                matching = []
+                r2 = Rng(self.rng.state, self.rng.offset)
+                check_range = 50
+                r2.step(-check_range)
+                for i in range(check_range * 2):
+                    val = r2.next()
+                    if int(val * len(eligible_fielders)) == fielder_idx:
+                        matching.append(i - check_range + 1)
+                self.trace(TraceCategory.ROLL, "(matching offsets: {})", matching, level=TraceLevel.DEBUG)
         elif check_name:
             if "fielder's choice" not in self.desc and "double play" not in self.desc:
                 self.print("!!! could not find fielder (name wrong?)")
@@ -2011,12 +1883,12 @@ class Resim:
             new_runner_base = self.next_update["basesOccupied"][new_runner_idx]
             return new_runner_base != base
 
-        self.print(
-            "OUT {} {} -> {}".format(
-                self.ty.value,
-                self.update["basesOccupied"],
-                self.next_update["basesOccupied"],
-            )
+        self.trace(
+            TraceCategory.MISC,
+            "OUT {} {} -> {}",
+            self.ty.value,
+            self.update["basesOccupied"],
+            self.next_update["basesOccupied"],
         )
 
         if self.ty == EventType.FLY_OUT:
@@ -2038,7 +1910,7 @@ class Resim:
                 roll_outcome = did_advance(base, runner_id)
 
                 if is_next_free:
-                    adv_roll = self.roll(f"adv? {base}/{runner.name} ({roll_outcome})")
+                    adv_roll = self.roll(LazyLabel("adv? {}/{} ({})", base, runner.name, roll_outcome))
                     self.log_roll(
                         Csv.FLYOUT, f"advance_{base}", adv_roll, roll_outcome, fielder=fielder, relevant_runner=runner
                     )
@@ -2159,14 +2031,14 @@ class Resim:
                 runner = self.data.get_player(runner_id)
 
                 was_forced = base < forced_bases
-                if self.event["created"] in ["2021-05-12T13:20:27.312Z", "2021-05-17T19:19:27.034Z"]:
+                if "duplicate_runner_advances" in self.corrections.flags:
                     # did_advance gets confused because the same runner is on two bases.
                     roll_outcome = True
                 else:
                     roll_outcome = did_advance(base, runner_id) if not was_forced else None
 
                 # needs... fielder tenaciousness and runner indulgence?
-                adv_roll = self.roll(f"adv? {base}/{runner.name} ({roll_outcome})")
+                adv_roll = self.roll(LazyLabel("adv? {}/{} ({})", base, runner.name, roll_outcome))
                 if self.batter.undefined() and base == base_before_home: # sac?
                     # self.roll("undefined (advance batter)")
                     pass
@@ -2215,7 +2087,7 @@ class Resim:
             # work around missing data in next_update
             if self.event["created"] == "2021-04-14T15:11:04.159Z":
                 roll_outcome = False
-            roll = self.roll(f"adv ({base}, {roll_outcome}")
+            roll = self.roll(LazyLabel("adv ({}, {}", base, roll_outcome))
             runner = self.data.get_player(runner_id)
 
             if runner.undefined():
@@ -2294,33 +2166,19 @@ class Resim:
 
             self.roll_foul(False)
 
-            # if this is a REAL home run, and not an UPGRADED home run, add here
-            # (will only be applicable when formula guesses wrong)
-            fakeout_overrides = [
-                "2021-06-26T16:26:38.648Z",
-                "2021-06-21T19:25:24.958Z",
-                "2021-06-21T18:05:12.440Z",
-                "2021-06-24T01:00:44.658Z",
-                "2021-06-24T11:01:45.168Z",
-                "2021-07-22T04:30:17.323Z",
-                "2021-07-22T04:30:58.532Z",
-                "2021-07-22T05:13:12.739Z",
-                "2021-07-22T05:14:53.149Z",
-                "2021-07-22T05:22:34.266Z",
-                "2021-07-22T07:22:09.275Z",
-                "2021-07-28T10:09:47.050Z",
-                "2021-07-22T23:15:19.145Z",
-                "2021-07-23T02:01:52.146Z",
-                "2021-07-23T04:14:53.537Z",
-            ]
-
             out_roll, out_threshold = self.roll_out(False)
 
             # assuming this can never be >0.04
             predicted_upgrade_roll = self.get_predicted_upgrade_roll()
 
-            if self.season >= 20 and out_roll > out_threshold and self.event["created"] not in fakeout_overrides and predicted_upgrade_roll < 0.04:
-                fly_threshold = get_fly_or_ground_threshold(
+            # a REAL home run, not an UPGRADED one, is flagged when the formula guesses wrong
+            if (
+                self.season >= 20
+                and out_roll > out_threshold
+                and "real_home_run" not in self.corrections.flags
+                and predicted_upgrade_roll < 0.04
+            ):
+                fly_threshold = self.formulas.fly_or_ground_threshold(
                     self.batter, self.batting_team, self.pitcher, self.pitching_team, self.stadium, self.get_stat_meta()
                 )
 
@@ -2453,85 +2311,15 @@ class Resim:
         if self.batter.undefined():
             self.print("UNDEFINED BASE HIT")
 
-        # if this is a REAL hit, and not an UPGRADED hit, add here
-        # (will only be applicable when formula guesses wrong)
-        # i think these can only be singles, too, so might need to skip the double/triple checks
-        fakeout_override = [
-            "2021-06-25T22:15:33.133Z",
-            "2021-06-26T20:19:15.403Z",
-            "2021-06-26T17:02:37.346Z",
-            "2021-06-26T17:08:22.349Z",
-            "2021-06-25T23:07:27.894Z",
-            "2021-06-25T23:20:26.239Z", # nandy messes with this one
-            "2021-06-21T18:15:43.297Z",
-            "2021-06-21T18:31:21.376Z",
-            "2021-06-21T19:07:43.405Z",
-            "2021-06-21T17:24:40.494Z",
-            "2021-06-21T20:19:22.784Z",
-            "2021-06-21T22:36:07.964Z",
-            "2021-06-21T23:22:37.547Z",
-            "2021-06-22T00:08:40.094Z",
-            "2021-06-23T22:22:31.785Z",
-            "2021-06-23T23:11:56.372Z",
-            "2021-06-23T23:33:42.272Z",
-            "2021-06-24T01:10:31.261Z",
-            "2021-06-24T02:13:40.364Z",
-            "2021-06-24T03:05:20.852Z",
-            "2021-06-24T04:04:15.335Z",
-            "2021-06-24T04:20:18.197Z",
-            "2021-06-24T04:23:15.438Z",
-            "2021-06-24T04:29:20.787Z",
-            "2021-06-24T05:05:50.921Z",
-            "2021-06-24T12:10:52.501Z",
-            "2021-06-29T05:11:15.911Z",
-            "2021-06-29T05:17:16.187Z",
-            "2021-06-29T06:20:31.478Z",
-            "2021-06-29T07:13:11.048Z",
-            "2021-06-29T08:09:20.717Z",
-            "2021-06-29T08:14:11.799Z",
-            "2021-07-22T03:16:12.216Z",
-            "2021-07-22T03:17:37.595Z",
-            "2021-07-22T04:05:28.163Z",
-            "2021-07-22T05:04:25.970Z",
-            "2021-07-22T05:08:31.085Z",
-            "2021-07-22T06:07:32.321Z",
-            "2021-07-22T06:13:08.081Z",
-            "2021-07-22T06:16:15.006Z",
-            "2021-07-22T07:19:01.756Z",
-            "2021-07-22T07:19:08.939Z",
-            "2021-07-22T07:22:54.380Z",
-            "2021-07-22T07:23:08.516Z",
-            "2021-07-30T12:19:39.626Z",
-            "2021-07-28T10:00:51.442Z",
-            "2021-07-28T10:03:16.709Z",
-            "2021-07-28T10:04:32.487Z",
-            "2021-07-28T10:20:46.023Z",
-            "2021-07-28T10:21:55.166Z",
-            "2021-07-28T10:25:05.937Z",
-        ]
-
-        fakeout_opposite_overrides = [
-            # these ones are ACTUALLY fake
-            "2021-06-21T20:06:14.133Z",
-            "2021-06-23T22:13:01.358Z",
-            "2021-06-24T03:05:50.319Z",
-            "2021-06-24T05:09:20.868Z",
-            "2021-07-28T09:24:31.243Z",
-            "2021-07-23T04:09:42.750Z",
-            "2021-07-22T09:18:04.254Z",
-            "2021-07-20T07:02:43.599Z",
-            "2021-07-20T05:04:09.215Z",
-        ]
-
         # cheating a little to predict the future etc
         # we're assuming this can never roll >0.04 and still pass, as a heuristic to avoid too many manual overrides
         predicted_upgrade_roll = self.get_predicted_upgrade_roll()
 
         is_fake_single = False
-        if self.season >= 20 and "a Single" in self.desc and predicted_upgrade_roll < 0.04 and (out_roll > out_threshold and self.event["created"] not in fakeout_override) or (self.event["created"] in fakeout_opposite_overrides):
+        if self.season >= 20 and "a Single" in self.desc and predicted_upgrade_roll < 0.04 and (out_roll > out_threshold and "real_hit" not in self.corrections.flags) or ("fake_hit" in self.corrections.flags):
             is_fake_single = True
             
-            fly_threshold = get_fly_or_ground_threshold(
+            fly_threshold = self.formulas.fly_or_ground_threshold(
                 self.batter, self.batting_team, self.pitcher, self.pitching_team, self.stadium, self.get_stat_meta()
             )
 
@@ -2559,7 +2347,7 @@ class Resim:
 
         fielder_roll, fielder = self.roll_fielder(check_name=False)
 
-        double_threshold = get_double_threshold(
+        double_threshold = self.formulas.double_threshold(
             self.batter,
             self.batting_team,
             self.pitcher,
@@ -2568,7 +2356,7 @@ class Resim:
             self.stadium,
             self.get_stat_meta(),
         )
-        triple_threshold = get_triple_threshold(
+        triple_threshold = self.formulas.triple_threshold(
             self.batter,
             self.batting_team,
             self.pitcher,
@@ -2596,9 +2384,9 @@ class Resim:
             # self.roll("undefined (triple?)")
 
         double_passed = {1: False, 2: True, 3: None, 4: None}[hit_bases]
-        double_roll = self.roll(f"double (to {fielder.name})", threshold=double_threshold, passed=double_passed)
+        double_roll = self.roll(LazyLabel("double (to {})", fielder.name), threshold=double_threshold, passed=double_passed)
         triple_passed = hit_bases == 3 if hit_bases < 4 else None
-        triple_roll = self.roll(f"triple (to {fielder.name})", threshold=triple_threshold, passed=triple_passed)
+        triple_roll = self.roll(LazyLabel("triple (to {})", fielder.name), threshold=triple_threshold, passed=triple_passed)
 
         quadruple_roll = None
         if self.stadium.has_mod(Mod.EXTRA_BASE):
@@ -2672,7 +2460,7 @@ class Resim:
             else self.next_update["homeTeamBatterCount"]
         )
         batter_at_bats = batter_count // len(self.batting_team.lineup)  # todo: +1?
-        return StatRelevantData(
+        fields = (
             self.weather,
             self.season,
             self.day,
@@ -2681,6 +2469,12 @@ class Resim:
             is_maximum_blaseball,
             batter_at_bats,
         )
+        # the same object for as long as nothing in it changes, so the multipliers and vibes its FormulaContext
+        # has memoized get reused by every roll of the event
+        if fields != self.stat_meta_fields:
+            self.stat_meta = StatRelevantData(*fields)
+            self.stat_meta_fields = fields
+        return self.stat_meta
 
     def roll_foul(self, known_outcome: bool):
         is_0_no_eligible = self.batting_team.has_mod(Mod.O_NO) and self.strikes == 2 and self.balls == 0
@@ -2688,7 +2482,7 @@ class Resim:
             known_outcome = None
 
         meta = self.get_stat_meta()
-        threshold = get_foul_threshold(self.batter, self.batting_team, self.stadium, meta)
+        threshold = self.formulas.foul_threshold(self.batter, self.batting_team, self.stadium, meta)
 
         if self.batter.undefined():
             # musc/thwack/div
@@ -2834,7 +2628,7 @@ class Resim:
             player = self.data.get_player(player_id)
 
             if player.has_mod(Mod.MARKED) and player_id != self.batter.id and not rolled_unstable and not player.has_mod(Mod.ELSEWHERE):
-                self.roll(f"unstable {player.name}")
+                self.roll(LazyLabel("unstable {}", player.name))
                 rolled_unstable = True
 
                 if self.ty == EventType.INCINERATION:
@@ -2846,7 +2640,7 @@ class Resim:
                     self.roll("extra instability stuff??")
                     return True
             if player.has_mod(Mod.FIRE_EATER) and not player.has_mod(Mod.ELSEWHERE):
-                self.roll(f"fire eater ({player.name})")
+                self.roll(LazyLabel("fire eater ({})", player.name))
 
                 if self.ty == EventType.INCINERATION_BLOCKED:
                     # fire eater proc - target roll maybe?
@@ -2855,129 +2649,145 @@ class Resim:
                 break
 
     def handle_weather(self):
-        if self.weather == Weather.SUN_2:
-            pass
+        return WEATHER_HANDLERS.get(self.weather, Resim.handle_weather_not_implemented)(self)
 
-        elif self.weather in [Weather.ECLIPSE, Weather.SUPERNOVA_ECLIPSE]:
-            # this block needs a big refactor, we can probably make the unstable checks generic
-            threshold = self.get_eclipse_threshold()
-            rolled_unstable = False
-            eclipse_roll = self.roll("eclipse")
+    def handle_weather_none(self):
+        pass
 
-            if self.batter.has_mod(Mod.MARKED):
-                self.roll(f"unstable {self.batter.name}")
-                rolled_unstable = True
-            if self.pitcher.has_mod(Mod.MARKED):
-                self.roll(f"unstable {self.pitcher.name}")
-                rolled_unstable = True
+    def handle_weather_eclipse(self):
+        # this block needs a big refactor, we can probably make the unstable checks generic
+        threshold = self.get_eclipse_threshold()
+        rolled_unstable = False
+        eclipse_roll = self.roll("eclipse")
 
-            target = None
-            if self.event["playerTags"]:
-                target = self.data.get_player(self.event["playerTags"][0])
+        if self.batter.has_mod(Mod.MARKED):
+            self.roll(LazyLabel("unstable {}", self.batter.name))
+            rolled_unstable = True
+        if self.pitcher.has_mod(Mod.MARKED):
+            self.roll(LazyLabel("unstable {}", self.pitcher.name))
+            rolled_unstable = True
 
-            # this really needs a refactor, helga and jon's instability incins need to proc in the sub function (and they do)
-            if self.ty == EventType.INCINERATION and "Kansas City Breath Mints" not in self.desc and self.event["created"] not in ["2021-07-22T06:03:17.918Z", "2021-07-22T06:06:08.970Z", "2021-07-23T10:04:54.389Z", "2021-05-14T11:21:35.835Z"]:
-                if "A Debt was collected" not in self.desc:
-                    self.log_roll(Csv.WEATHERPROC, "Burn", eclipse_roll, True)
+        target = None
+        if self.event["playerTags"]:
+            target = self.data.get_player(self.event["playerTags"][0])
 
-                    self.roll("target")
+        # this really needs a refactor, helga and jon's instability incins need to proc in the sub function (and they do)
+        if (
+            self.ty == EventType.INCINERATION
+            and "Kansas City Breath Mints" not in self.desc
+            and "incineration_without_burn" not in self.corrections.flags
+        ):
+            if "A Debt was collected" not in self.desc:
+                self.log_roll(Csv.WEATHERPROC, "Burn", eclipse_roll, True)
 
-                    if self.season >= 15:
-                        self.roll("extra target?")
-                else:
-                    self.roll("instability target?")
-                    self.roll("instability target?")
+                self.roll("target")
 
-                self.generate_player()
+                if self.season >= 15:
+                    self.roll("extra target?")
+            else:
+                self.roll("instability target?")
+                self.roll("instability target?")
 
-                # there are def two extra rolls earlier and two extra down here, but i don't know what they would be
-                if "A Debt was collected" in self.desc:
-                    self.roll("extra instability stuff??")
-                    self.roll("extra instability stuff??")
+            self.generate_player()
 
-                if "An Ambush." in self.desc:
-                    self.roll("ambush target")
+            # there are def two extra rolls earlier and two extra down here, but i don't know what they would be
+            if "A Debt was collected" in self.desc:
+                self.roll("extra instability stuff??")
+                self.roll("extra instability stuff??")
 
-                return True
+            if "An Ambush." in self.desc:
+                self.roll("ambush target")
 
-            else:
-                self.log_roll(Csv.WEATHERPROC, "NoBurn", eclipse_roll, False)
+            return True
 
-            if eclipse_roll < threshold:
-                # blocked "natural" incineration due to fireproof
-                # self.print(f"!!! too low eclipse roll ({eclipse_roll} < {threshold})")
+        else:
+            self.log_roll(Csv.WEATHERPROC, "NoBurn", eclipse_roll, False)
 
-                if self.ty == EventType.INCINERATION_BLOCKED and (self.pitching_team.has_mod(Mod.FIREPROOF) or target.has_mod(Mod.FIREPROOF)):
-                    self.roll("target")
-                    return True
-                
-            if self.handle_fire_eater(rolled_unstable):
-                return True
-            
-            if self.weather == Weather.SUPERNOVA_ECLIPSE:
-                self.roll("supernova eclipse (team incin)")
-                if self.ty == EventType.INCINERATION:
-                    # riv
-                    if "Kansas City Breath Mints" in self.desc:
-                        for _ in range(8):
-                            self.roll("where are the paws, joel?")
-
-                        self.data.fetch_league_data(self.event["created"], 10)
-                        # correction for fetch league data
-                        self.data.fetch_player_after("df4da81a-917b-434f-b309-f00423ee4967", self.event["created"])
-                    return True
+        if eclipse_roll < threshold:
+            # blocked "natural" incineration due to fireproof
+            # self.print(f"!!! too low eclipse roll ({eclipse_roll} < {threshold})")
 
+            if self.ty == EventType.INCINERATION_BLOCKED and (self.pitching_team.has_mod(Mod.FIREPROOF) or target.has_mod(Mod.FIREPROOF)):
+                self.roll("target")
+                return True
 
-        elif self.weather == Weather.GLITTER:
-            # this is handled inside the ballpark proc block(?????)
-            pass
+        if self.handle_fire_eater(rolled_unstable):
+            return True
 
-        elif self.weather == Weather.BLOODDRAIN:
-            blood_roll = self.roll("blooddrain")
-            drain_threshold = 0.00065 - 0.001 * self.stadium.fortification
-            if self.ty != EventType.BLOODDRAIN and blood_roll < drain_threshold:
-                self.print("NoDrain?")
-            if self.ty == EventType.BLOODDRAIN:
-                self.log_roll(
-                    Csv.WEATHERPROC,
-                    "Drain",
-                    blood_roll,
-                    True,
-                )
-            else:
-                self.log_roll(
-                    Csv.WEATHERPROC,
-                    "NoDrain",
-                    blood_roll,
-                    False,
-                )
+        if self.weather == Weather.SUPERNOVA_ECLIPSE:
+            self.roll("supernova eclipse (team incin)")
+            if self.ty == EventType.INCINERATION:
+                # riv
+                if "Kansas City Breath Mints" in self.desc:
+                    for _ in range(8):
+                        self.roll("where are the paws, joel?")
+
+                    self.data.fetch_league_data(self.event["created"], 10)
+                    # correction for fetch league data
+                    self.data.fetch_player_after("df4da81a-917b-434f-b309-f00423ee4967", self.event["created"])
+                return True
 
-            # Drained Stat for both Siphon & Blooddrain is:
-            # Pitching 0-0.25, Batting 0.25-0.5, Defense 0.5-0.75, Baserunning 0.75-1
-            if self.ty == EventType.BLOODDRAIN_SIPHON:
-                self.roll("which siphon")
-                target_roll = self.roll("Active or Passive Target")
-                pitchers = self.pitching_team.lineup + self.pitching_team.rotation
-                batters = self.batting_team.lineup
-
-                # Siphon on Siphon Violence - They all conveniently fall into the same roll length
-                if self.event["created"] in [
-                    "2021-03-11T16:07:06.900Z",
-                    "2021-04-16T02:23:37.186Z",
-                    "2021-05-19T14:06:37.515Z",
-                    "2021-06-14T21:06:33.264Z",
-                ]:
-                    self.roll("siphon1")
-                    self.roll("siphon2")
+    def handle_weather_blooddrain(self):
+        blood_roll = self.roll("blooddrain")
+        drain_threshold = 0.00065 - 0.001 * self.stadium.fortification
+        if self.ty != EventType.BLOODDRAIN and blood_roll < drain_threshold:
+            self.print("NoDrain?")
+        if self.ty == EventType.BLOODDRAIN:
+            self.log_roll(
+                Csv.WEATHERPROC,
+                "Drain",
+                blood_roll,
+                True,
+            )
+        else:
+            self.log_roll(
+                Csv.WEATHERPROC,
+                "NoDrain",
+                blood_roll,
+                False,
+            )
 
-                else:
-                    for player_id in pitchers:
-                        pitcher = self.data.get_player(player_id)
-                        if pitcher.has_mod(Mod.SIPHON) and pitcher.raw_name in self.desc:
-                            pitchersiphon = True
+        # Drained Stat for both Siphon & Blooddrain is:
+        # Pitching 0-0.25, Batting 0.25-0.5, Defense 0.5-0.75, Baserunning 0.75-1
+        if self.ty == EventType.BLOODDRAIN_SIPHON:
+            self.roll("which siphon")
+            target_roll = self.roll("Active or Passive Target")
+            pitchers = self.pitching_team.lineup + self.pitching_team.rotation
+            batters = self.batting_team.lineup
+
+            # Siphon on Siphon Violence - They all conveniently fall into the same roll length
+            if "siphon_on_siphon" in self.corrections.flags:
+                self.roll("siphon1")
+                self.roll("siphon2")
 
-                            if pitchersiphon:
-                                if target_roll > 0.5 and len(self.update["baseRunners"]) > 0:
+            else:
+                for player_id in pitchers:
+                    pitcher = self.data.get_player(player_id)
+                    if pitcher.has_mod(Mod.SIPHON) and pitcher.raw_name in self.desc:
+                        pitchersiphon = True
+
+                        if pitchersiphon:
+                            if target_roll > 0.5 and len(self.update["baseRunners"]) > 0:
+                                self.roll("siphon target")
+                                self.roll("which stat drained")
+                                self.roll("effect")
+                            else:
+                                self.roll("which stat drained")
+                                self.roll("effect")
+
+                for player_id in batters:
+                    batter = self.data.get_player(player_id)
+                    if batter.has_mod(Mod.SIPHON) and batter.raw_name in self.desc:
+                        battersiphon = True
+
+                        if battersiphon:
+                            for base, runner_id in zip(self.update["basesOccupied"], self.update["baseRunners"]):
+                                runner = self.data.get_player(runner_id)
+                            if len(self.update["baseRunners"]) > 0 and runner.raw_name in self.desc:
+                                self.roll("which stat drained")
+                                self.roll("effect")
+                            else:
+                                if target_roll > 0.5 or player_id == self.batter.id:
                                     self.roll("siphon target")
                                     self.roll("which stat drained")
                                     self.roll("effect")
@@ -2985,460 +2795,419 @@ class Resim:
                                     self.roll("which stat drained")
                                     self.roll("effect")
 
-                    for player_id in batters:
-                        batter = self.data.get_player(player_id)
-                        if batter.has_mod(Mod.SIPHON) and batter.raw_name in self.desc:
-                            battersiphon = True
-
-                            if battersiphon:
-                                for base, runner_id in zip(self.update["basesOccupied"], self.update["baseRunners"]):
-                                    runner = self.data.get_player(runner_id)
-                                if len(self.update["baseRunners"]) > 0 and runner.raw_name in self.desc:
-                                    self.roll("which stat drained")
-                                    self.roll("effect")
-                                else:
-                                    if target_roll > 0.5 or player_id == self.batter.id:
-                                        self.roll("siphon target")
-                                        self.roll("which stat drained")
-                                        self.roll("effect")
-                                    else:
-                                        self.roll("which stat drained")
-                                        self.roll("effect")
-
-                if self.event["created"] == "2021-04-12T22:01:16.338Z":
-                    # this... might be item damage on siphon strikeout...?
-                    self.roll("sorry kidror idk why")
-                return True
-
-            if self.ty == EventType.BLOODDRAIN or self.ty == EventType.BLOODDRAIN_BLOCKED:
-                # This one thinks that an on base runner is the batter
-                if self.event["created"] in ["2021-04-20T06:31:02.337Z"]:
-                    self.roll("blooddrain proc1")
-                    self.roll("blooddrain proc2")
-                    self.roll("blooddrain proc3")
-                    self.roll("Drained Stat")
-                elif (
-                    len(self.update["baseRunners"]) > 0
-                    and self.batter.raw_name not in self.desc
-                    and self.pitcher.raw_name not in self.desc
-                ):
-                    self.roll("blooddrain proc1")
-                    self.roll("blooddrain proc2")
-                    self.roll("blooddrain proc3")
-                    self.roll("blooddrain proc4")
-                    self.roll("Drained Stat")
-                elif self.batter.raw_name in self.desc and self.pitcher.raw_name in self.desc:
-                    self.roll("blooddrain proc1")
-                    self.roll("blooddrain proc2")
-                    self.roll("Drained Stat")
-                else:
-                    self.roll("blooddrain proc1")
-                    self.roll("blooddrain proc2")
-                    self.roll("blooddrain proc3")
-                    self.roll("Drained Stat")
-                return True
-
-        elif self.weather == Weather.PEANUTS:
-            flavor_roll = self.roll("peanuts")
+            if self.event["created"] == "2021-04-12T22:01:16.338Z":
+                # this... might be item damage on siphon strikeout...?
+                self.roll("sorry kidror idk why")
+            return True
 
-            if self.ty == EventType.PEANUT_FLAVOR_TEXT:
-                self.roll("peanut message")
-                return True
-            
-            has_allergic_players = False
-
-            # need to do this the annoying way because inhabiting players don't exist
-            batter_id = self.update["awayBatter"] if self.update["topOfInning"] else self.update["homeBatter"]
-            for player_id in (
-                self.batting_team.lineup
-                + self.batting_team.rotation
-                + self.pitching_team.lineup
-                + self.pitching_team.rotation
-                + self.update["baseRunners"] + [batter_id]
+        if self.ty == EventType.BLOODDRAIN or self.ty == EventType.BLOODDRAIN_BLOCKED:
+            # This one thinks that an on base runner is the batter
+            if "blooddrain_runner_as_batter" in self.corrections.flags:
+                self.roll("blooddrain proc1")
+                self.roll("blooddrain proc2")
+                self.roll("blooddrain proc3")
+                self.roll("Drained Stat")
+            elif (
+                len(self.update["baseRunners"]) > 0
+                and self.batter.raw_name not in self.desc
+                and self.pitcher.raw_name not in self.desc
             ):
-                player = self.data.get_player(player_id)
-                # in game da1fd5a4-45bb-4dd3-811a-ebfb34fddd07, Kaylee Boyea haunts, who's the only allergic player "in the game", and thus needs an extra roll
-                if player.peanut_allergy or player_id in ["cab95673-f31b-4fb1-9764-25ceb03dd761"]:
-                    has_allergic_players = True
-
-            if has_allergic_players:
-                allergy_roll = self.roll("peanuts")
-                if self.ty == EventType.ALLERGIC_REACTION or self.ty == EventType.SUPERALLERGIC_REACTION:
-                    self.log_roll(
-                        Csv.WEATHERPROC,
-                        "Allergy",
-                        allergy_roll,
-                        True,
-                    )
-                    self.roll("target")
-                    if self.ty == EventType.SUPERALLERGIC_REACTION:
-                        self.roll("superallergy???")
-                    return True
-                else:
-                    self.log_roll(
-                        Csv.WEATHERPROC,
-                        "NoAllergy",
-                        allergy_roll,
-                        False,
-                    )
-
-            # def has_allergies(team):
-                # return any(self.data.get_player(p).peanut_allergy for p in team.lineup + team.rotation)
-            batter_threshold = 0.00076 # at least 2021-05-17T17:20:09.894Z 
-            pitcher_threshold = 0.00061
-            extras = [
-                "2021-05-12T15:20:57.747Z", # not impossible this is something else because this threshold is 10x higher???
-            ]
-            if self.batter.has_mod(Mod.HONEY_ROASTED):
-                roast_roll = self.roll("honey roasted")
+                self.roll("blooddrain proc1")
+                self.roll("blooddrain proc2")
+                self.roll("blooddrain proc3")
+                self.roll("blooddrain proc4")
+                self.roll("Drained Stat")
+            elif self.batter.raw_name in self.desc and self.pitcher.raw_name in self.desc:
+                self.roll("blooddrain proc1")
+                self.roll("blooddrain proc2")
+                self.roll("Drained Stat")
+            else:
+                self.roll("blooddrain proc1")
+                self.roll("blooddrain proc2")
+                self.roll("blooddrain proc3")
+                self.roll("Drained Stat")
+            return True
 
-                if self.ty == EventType.TASTE_THE_INFINITE:
-                    self.log_roll(
-                        Csv.MODPROC,
-                        "shelled1",
-                        roast_roll,
-                        True,
-                    )
-                elif roast_roll < batter_threshold or self.event["created"] in extras:
-                    self.roll("honey roasted extra")
-                else:
-                    self.log_roll(
-                        Csv.MODPROC,
-                        "no shell1",
-                        roast_roll,
-                        False,
-                    )
-            elif self.pitcher.has_mod(Mod.HONEY_ROASTED):
-                poast_roll = self.roll("honey roasted")
-                if self.ty == EventType.TASTE_THE_INFINITE:
-                    self.log_roll(
-                        Csv.MODPROC,
-                        "shelled2",
-                        poast_roll,
-                        True,
-                    )
-                elif poast_roll < pitcher_threshold or self.event["created"] in extras:
-                    self.roll("honey roasted extra")
-                else:
-                    self.log_roll(
-                        Csv.MODPROC,
-                        "no shell2",
-                        poast_roll,
-                        False,
-                    )
+    def handle_weather_peanuts(self):
+        flavor_roll = self.roll("peanuts")  # noqa: F841
 
-            if self.ty == EventType.TASTE_THE_INFINITE:
-                # *really* can't figure out what this is for
-                self.roll("target")
-                self.roll("target")
-                return True
+        if self.ty == EventType.PEANUT_FLAVOR_TEXT:
+            self.roll("peanut message")
+            return True
 
-        elif self.weather == Weather.BIRDS:
-            # threshold is at 0.0125 at 0.5 fort
-            bird_threshold = 0.0125 - 0.02 * (self.stadium.fortification - 0.5)
-            if self.season == 17:
-                # in season 18 *specifically*, threshold changed a little (then changed back)
-                bird_threshold = 0.015 - 0.02 * (self.stadium.fortification - 0.5)
-
-            bird_roll = self.roll("birds", threshold=bird_threshold)
-
-            has_shelled_player = False
-            for player_id in (
-                self.pitching_team.lineup
-                + self.pitching_team.rotation
-                + self.batting_team.lineup
-                + self.batting_team.rotation
-            ):
-                # if low roll and shelled player present, roll again
-                # in s14 this doesn't seem to check (inactive) pitchers
-                # (except all shelled pitchers are inactive so idk)
-                player = self.data.get_player(player_id)
-                # also must be specifically PERMANENT mods - moses mason
-                # (shelled in s15 through receiver, so seasonal mod) is exempt
-                if player.has_mod(Mod.SHELLED, ModType.PERMANENT):
-                    has_shelled_player = True
-
-            if self.ty == EventType.BIRDS_CIRCLE:
-                # the birds circle...
-                self.log_roll(Csv.BIRD_MESSAGE, "Circle", bird_roll, True)
-                return True
-            elif not has_shelled_player:
-                self.log_roll(Csv.BIRD_MESSAGE, "NoCircle", bird_roll, False)
+        has_allergic_players = False
 
-            if has_shelled_player and bird_roll < bird_threshold:
-                self.roll("extra bird roll")
-                if self.ty == EventType.BIRDS_UNSHELL:
-                    # ???
-                    self.roll("extra bird roll")
-                    return True
-                pass
+        # need to do this the annoying way because inhabiting players don't exist
+        batter_id = self.update["awayBatter"] if self.update["topOfInning"] else self.update["homeBatter"]
+        for player_id in (
+            self.batting_team.lineup
+            + self.batting_team.rotation
+            + self.pitching_team.lineup
+            + self.pitching_team.rotation
+            + self.update["baseRunners"] + [batter_id]
+        ):
+            player = self.data.get_player(player_id)
+            # in game da1fd5a4-45bb-4dd3-811a-ebfb34fddd07, Kaylee Boyea haunts, who's the only allergic player "in the game", and thus needs an extra roll
+            if player.peanut_allergy or player_id in ["cab95673-f31b-4fb1-9764-25ceb03dd761"]:
+                has_allergic_players = True
 
-        elif self.weather == Weather.FEEDBACK:
-            select_roll = self.roll("feedbackselection")  # noqa: F841 60/40 Batter/Pitcher
-            feedback_roll = self.roll("feedback")  # noqa: F841 feedback event y/n
-            if self.ty == EventType.FEEDBACK_SWAP:
+        if has_allergic_players:
+            allergy_roll = self.roll("peanuts")
+            if self.ty == EventType.ALLERGIC_REACTION or self.ty == EventType.SUPERALLERGIC_REACTION:
                 self.log_roll(
                     Csv.WEATHERPROC,
-                    "Swap",
-                    feedback_roll,
+                    "Allergy",
+                    allergy_roll,
                     True,
                 )
+                self.roll("target")
+                if self.ty == EventType.SUPERALLERGIC_REACTION:
+                    self.roll("superallergy???")
+                return True
             else:
                 self.log_roll(
                     Csv.WEATHERPROC,
-                    "NoSwap",
-                    feedback_roll,
+                    "NoAllergy",
+                    allergy_roll,
                     False,
                 )
 
-            if self.ty == EventType.FEEDBACK_SWAP:
-                # todo: how many rolls?
-                self.roll("target")
-                self.roll("player 1 fate")
-                self.roll("player 2 fate")
-
-                if "LCD Soundsystem" in self.desc:
-                    for _ in range(50):
-                        self.roll("stat")
-                # i think it would be extremely funny if these are item damage rolls
-                # imagine getting feedbacked to charleston *and* you lose your shoes.
-                if self.season >= 15:
-                    # todo: ideally should replace with self.damage; need player references for that
-                    self.roll("feedback item damage")
-                    self.roll("feedback item damage")
+        # def has_allergies(team):
+            # return any(self.data.get_player(p).peanut_allergy for p in team.lineup + team.rotation)
+        batter_threshold = 0.00076 # at least 2021-05-17T17:20:09.894Z 
+        pitcher_threshold = 0.00061
+        if self.batter.has_mod(Mod.HONEY_ROASTED):
+            roast_roll = self.roll("honey roasted")
 
-                return True
+            if self.ty == EventType.TASTE_THE_INFINITE:
+                self.log_roll(
+                    Csv.MODPROC,
+                    "shelled1",
+                    roast_roll,
+                    True,
+                )
+            elif roast_roll < batter_threshold or "honey_roasted_extra" in self.corrections.flags:
+                self.roll("honey roasted extra")
+            else:
+                self.log_roll(
+                    Csv.MODPROC,
+                    "no shell1",
+                    roast_roll,
+                    False,
+                )
+        elif self.pitcher.has_mod(Mod.HONEY_ROASTED):
+            poast_roll = self.roll("honey roasted")
+            if self.ty == EventType.TASTE_THE_INFINITE:
+                self.log_roll(
+                    Csv.MODPROC,
+                    "shelled2",
+                    poast_roll,
+                    True,
+                )
+            elif poast_roll < pitcher_threshold or "honey_roasted_extra" in self.corrections.flags:
+                self.roll("honey roasted extra")
+            else:
+                self.log_roll(
+                    Csv.MODPROC,
+                    "no shell2",
+                    poast_roll,
+                    False,
+                )
 
-            if self.ty == EventType.FEEDBACK_BLOCKED:
-                self.roll("target")
-                for _ in range(25):
-                    self.roll("stat")
-                return True
+        if self.ty == EventType.TASTE_THE_INFINITE:
+            # *really* can't figure out what this is for
+            self.roll("target")
+            self.roll("target")
+            return True
 
-            if self.weather.can_echo() and (
-                (self.batter and self.batter.has_mod(Mod.ECHO)) or (self.pitcher and self.pitcher.has_mod(Mod.ECHO))
-            ):
-                # echo vs static, or batter echo vs pitcher echo?
-                if self.ty in [EventType.ECHO_MESSAGE, EventType.ECHO_INTO_STATIC, EventType.RECEIVER_BECOMES_ECHO]:
-                    eligible_players = []
-                    if self.pitcher.has_mod(Mod.ECHO):
-                        eligible_players.extend(self.batting_team.rotation)
-                        eligible_players = [self.batter.id] + eligible_players
-
-                        # opposite_pitcher = self.away_pitcher if self.update["topOfInning"] else self.home_pitcher
-                        # eligible_players.remove(opposite_pitcher.id)
-                        # eligible_players = [opposite_pitcher.id] + eligible_players
-                    else:
-                        eligible_players.extend(self.pitching_team.lineup)
+    def handle_weather_birds(self):
+        # threshold is at 0.0125 at 0.5 fort
+        bird_threshold = 0.0125 - 0.02 * (self.stadium.fortification - 0.5)
+        if self.season == 17:
+            # in season 18 *specifically*, threshold changed a little (then changed back)
+            bird_threshold = 0.015 - 0.02 * (self.stadium.fortification - 0.5)
+
+        bird_roll = self.roll("birds", threshold=bird_threshold)
+
+        has_shelled_player = False
+        for player_id in (
+            self.pitching_team.lineup
+            + self.pitching_team.rotation
+            + self.batting_team.lineup
+            + self.batting_team.rotation
+        ):
+            # if low roll and shelled player present, roll again
+            # in s14 this doesn't seem to check (inactive) pitchers
+            # (except all shelled pitchers are inactive so idk)
+            player = self.data.get_player(player_id)
+            # also must be specifically PERMANENT mods - moses mason
+            # (shelled in s15 through receiver, so seasonal mod) is exempt
+            if player.has_mod(Mod.SHELLED, ModType.PERMANENT):
+                has_shelled_player = True
+
+        if self.ty == EventType.BIRDS_CIRCLE:
+            # the birds circle...
+            self.log_roll(Csv.BIRD_MESSAGE, "Circle", bird_roll, True)
+            return True
+        elif not has_shelled_player:
+            self.log_roll(Csv.BIRD_MESSAGE, "NoCircle", bird_roll, False)
 
-                        if (self.season, self.day) > (13, 74):
-                            eligible_players.extend(self.pitching_team.rotation)
-                            eligible_players.remove(self.pitcher.id)
+        if has_shelled_player and bird_roll < bird_threshold:
+            self.roll("extra bird roll")
+            if self.ty == EventType.BIRDS_UNSHELL:
+                # ???
+                self.roll("extra bird roll")
+                return True
+            pass
 
-                        eligible_players = [self.pitcher.id] + eligible_players
+    def handle_weather_feedback(self):
+        select_roll = self.roll("feedbackselection")  # noqa: F841 60/40 Batter/Pitcher
+        feedback_roll = self.roll("feedback")  # noqa: F841 feedback event y/n
+        if self.ty == EventType.FEEDBACK_SWAP:
+            self.log_roll(
+                Csv.WEATHERPROC,
+                "Swap",
+                feedback_roll,
+                True,
+            )
+        else:
+            self.log_roll(
+                Csv.WEATHERPROC,
+                "NoSwap",
+                feedback_roll,
+                False,
+            )
 
-                    self.handle_echo_target_selection(eligible_players)
+        if self.ty == EventType.FEEDBACK_SWAP:
+            # todo: how many rolls?
+            self.roll("target")
+            self.roll("player 1 fate")
+            self.roll("player 2 fate")
 
-                    if self.ty in [
-                        EventType.ECHO_INTO_STATIC,
-                        EventType.RECEIVER_BECOMES_ECHO,
-                    ]:
-                        self.roll("echo target 2?")
-                    return True
-        elif self.weather == Weather.REVERB:
-            if self.stadium.has_mod(Mod.ECHO_CHAMBER):
-                chamber_roll = self.roll("echo chamber")
-                if self.ty == EventType.ECHO_CHAMBER:
-                    self.log_roll(
-                        Csv.MODPROC,
-                        "Copy",
-                        chamber_roll,
-                        True,
-                    )
-                if self.ty != EventType.ECHO_CHAMBER:
-                    self.log_roll(
-                        Csv.MODPROC,
-                        "NoCopy",
-                        chamber_roll,
-                        False,
-                    )
-                if self.ty == EventType.ECHO_CHAMBER:
-                    self.roll("echo chamber")
-                    return True
-            # This might not be the right place to remove it, but ECHO_MESSAGE events with ECHO_CHAMBERs seem to have one fewer roll.
-            if not self.stadium.has_mod(Mod.ECHO_CHAMBER) or self.ty != EventType.ECHO_MESSAGE:
-                wiggle_roll = self.roll("reverbproc")
-                if self.ty == EventType.REVERB_ROSTER_SHUFFLE:
-                    self.log_roll(
-                        Csv.WEATHERPROC,
-                        "Shuffle",
-                        wiggle_roll,
-                        True,
-                    )
-                else:
-                    self.log_roll(
-                        Csv.WEATHERPROC,
-                        "NoShuffle",
-                        wiggle_roll,
-                        False,
-                    )
-            if self.ty == EventType.REVERB_ROSTER_SHUFFLE:
-                # approx. ranges for reverb type:
-                # S13–16:
-                # 0–0.15: Add reverberating mod
-                # 0.15–0.25: full team shuffle
-                # 0.25-0.35: several players shuffled
-                # 0.35–0.4: lineup shuffle
-                # 0.4–0.7: unknown (no rolls in this range)
-                # 0.7–1: rotation shuffle
-                #
-                # S17+
-                # No reverberating mod events observed
-                # 0–0.09: full team shuffle
-                # 0.09–0.55: several players shuffled
-                # 0.55–0.95: lineup shuffled
-                # 0.95–1: rotation shuffled
-                self.roll("Reverb Type")
-                target_roll = self.roll("target team")
-                target_team = self.home_team if target_roll < 0.5 else self.away_team
-
-                if "were shuffled in the Reverb!" in self.desc:
-                    # Steph Weeks has gravity mod from armor, but we don't handle mods from old-style items.
-                    if self.event["created"] == "2021-03-11T08:24:46.288Z":
-                        amount = 14
-                    else:
-                        amount = sum(
-                            1
-                            for p in target_team.lineup + target_team.rotation
-                            if not self.data.get_player(p).has_mod(Mod.GRAVITY)
-                        )
-                    for _ in range(amount):
-                        self.roll("reverb shuffle?")
-                elif "several players shuffled" in self.desc:
-                    num_swaps = math.ceil(self.roll("num swaps") * 3) + 1
-                    amount = num_swaps * 2
-                    for _ in range(amount):
-                        self.roll("reverb shuffle?")
-                elif "lineup shuffled in the Reverb!" in self.desc:
-                    amount = sum(1 for p in target_team.lineup if not self.data.get_player(p).has_mod(Mod.GRAVITY))
-                    for _ in range(amount):
-                        self.roll("reverb shuffle?")
-                else:
-                    amount = sum(1 for p in target_team.rotation if not self.data.get_player(p).has_mod(Mod.GRAVITY))
-                    for _ in range(amount):
-                        self.roll("reverb shuffle?")
+            if "LCD Soundsystem" in self.desc:
+                for _ in range(50):
+                    self.roll("stat")
+            # i think it would be extremely funny if these are item damage rolls
+            # imagine getting feedbacked to charleston *and* you lose your shoes.
+            if self.season >= 15:
+                # todo: ideally should replace with self.damage; need player references for that
+                self.roll("feedback item damage")
+                self.roll("feedback item damage")
 
-                return True
+            return True
 
-            if self.ty == EventType.REVERB_BESTOWS_REVERBERATING:
-                self.roll("Reverb Type")
-                return True
+        if self.ty == EventType.FEEDBACK_BLOCKED:
+            self.roll("target")
+            for _ in range(25):
+                self.roll("stat")
+            return True
 
-            if self.batter.has_mod(Mod.ECHO):
-                self.roll("echo?")
+        if self.weather.can_echo() and (
+            (self.batter and self.batter.has_mod(Mod.ECHO)) or (self.pitcher and self.pitcher.has_mod(Mod.ECHO))
+        ):
+            # echo vs static, or batter echo vs pitcher echo?
+            if self.ty in [EventType.ECHO_MESSAGE, EventType.ECHO_INTO_STATIC, EventType.RECEIVER_BECOMES_ECHO]:
+                eligible_players = []
+                if self.pitcher.has_mod(Mod.ECHO):
+                    eligible_players.extend(self.batting_team.rotation)
+                    eligible_players = [self.batter.id] + eligible_players
+
+                    # opposite_pitcher = self.away_pitcher if self.update["topOfInning"] else self.home_pitcher
+                    # eligible_players.remove(opposite_pitcher.id)
+                    # eligible_players = [opposite_pitcher.id] + eligible_players
+                else:
+                    eligible_players.extend(self.pitching_team.lineup)
 
-                if self.ty in [EventType.ECHO_MESSAGE, EventType.ECHO_INTO_STATIC, EventType.RECEIVER_BECOMES_ECHO]:
-                    eligible_players = self.batting_team.lineup + self.batting_team.rotation
-                    eligible_players.remove(self.batter.id)
-                    self.handle_echo_target_selection(eligible_players)
+                    if (self.season, self.day) > (13, 74):
+                        eligible_players.extend(self.pitching_team.rotation)
+                        eligible_players.remove(self.pitcher.id)
 
-                    if self.ty in [EventType.ECHO_INTO_STATIC, EventType.RECEIVER_BECOMES_ECHO]:
-                        self.roll("echo target 2?")
-                    return True
-            if self.pitcher.has_mod(Mod.ECHO):
-                self.roll("echo?")
+                    eligible_players = [self.pitcher.id] + eligible_players
 
-                if self.ty in [EventType.ECHO_MESSAGE, EventType.ECHO_INTO_STATIC, EventType.RECEIVER_BECOMES_ECHO]:
-                    eligible_players = self.pitching_team.lineup + self.pitching_team.rotation
-                    eligible_players.remove(self.pitcher.id)
-                    self.handle_echo_target_selection(eligible_players)
-                    return True
+                self.handle_echo_target_selection(eligible_players)
 
-        elif self.weather == Weather.BLACK_HOLE:
-            pass
+                if self.ty in [
+                    EventType.ECHO_INTO_STATIC,
+                    EventType.RECEIVER_BECOMES_ECHO,
+                ]:
+                    self.roll("echo target 2?")
+                return True
 
-        elif self.weather == Weather.COFFEE:
-            coffee1_roll = self.roll("coffee")
-            if self.ty == EventType.COFFEE_BEAN and not self.stadium.has_mod(Mod.SWEETENER):
+    def handle_weather_reverb(self):
+        if self.stadium.has_mod(Mod.ECHO_CHAMBER):
+            chamber_roll = self.roll("echo chamber")
+            if self.ty == EventType.ECHO_CHAMBER:
                 self.log_roll(
-                    Csv.WEATHERPROC,
-                    "Bean",
-                    coffee1_roll,
+                    Csv.MODPROC,
+                    "Copy",
+                    chamber_roll,
                     True,
                 )
-            if self.ty != EventType.COFFEE_BEAN and not self.stadium.has_mod(Mod.SWEETENER):
+            if self.ty != EventType.ECHO_CHAMBER:
                 self.log_roll(
-                    Csv.WEATHERPROC,
-                    "NoBean",
-                    coffee1_roll,
+                    Csv.MODPROC,
+                    "NoCopy",
+                    chamber_roll,
                     False,
                 )
-            if self.ty == EventType.COFFEE_BEAN and self.stadium.has_mod(Mod.SWEETENER):
+            if self.ty == EventType.ECHO_CHAMBER:
+                self.roll("echo chamber")
+                return True
+        # This might not be the right place to remove it, but ECHO_MESSAGE events with ECHO_CHAMBERs seem to have one fewer roll.
+        if not self.stadium.has_mod(Mod.ECHO_CHAMBER) or self.ty != EventType.ECHO_MESSAGE:
+            wiggle_roll = self.roll("reverbproc")
+            if self.ty == EventType.REVERB_ROSTER_SHUFFLE:
                 self.log_roll(
-                    Csv.SWEET1,
-                    "Bean",
-                    coffee1_roll,
+                    Csv.WEATHERPROC,
+                    "Shuffle",
+                    wiggle_roll,
                     True,
                 )
-            if self.ty != EventType.COFFEE_BEAN and self.stadium.has_mod(Mod.SWEETENER):
+            else:
                 self.log_roll(
-                    Csv.SWEET1,
-                    "NoBean",
-                    coffee1_roll,
+                    Csv.WEATHERPROC,
+                    "NoShuffle",
+                    wiggle_roll,
                     False,
                 )
+        if self.ty == EventType.REVERB_ROSTER_SHUFFLE:
+            # approx. ranges for reverb type:
+            # S13–16:
+            # 0–0.15: Add reverberating mod
+            # 0.15–0.25: full team shuffle
+            # 0.25-0.35: several players shuffled
+            # 0.35–0.4: lineup shuffle
+            # 0.4–0.7: unknown (no rolls in this range)
+            # 0.7–1: rotation shuffle
+            #
+            # S17+
+            # No reverberating mod events observed
+            # 0–0.09: full team shuffle
+            # 0.09–0.55: several players shuffled
+            # 0.55–0.95: lineup shuffled
+            # 0.95–1: rotation shuffled
+            self.roll("Reverb Type")
+            target_roll = self.roll("target team")
+            target_team = self.home_team if target_roll < 0.5 else self.away_team
+
+            if "were shuffled in the Reverb!" in self.desc:
+                # Steph Weeks has gravity mod from armor, but we don't handle mods from old-style items.
+                if self.event["created"] == "2021-03-11T08:24:46.288Z":
+                    amount = 14
+                else:
+                    amount = sum(
+                        1
+                        for p in target_team.lineup + target_team.rotation
+                        if not self.data.get_player(p).has_mod(Mod.GRAVITY)
+                    )
+                for _ in range(amount):
+                    self.roll("reverb shuffle?")
+            elif "several players shuffled" in self.desc:
+                num_swaps = math.ceil(self.roll("num swaps") * 3) + 1
+                amount = num_swaps * 2
+                for _ in range(amount):
+                    self.roll("reverb shuffle?")
+            elif "lineup shuffled in the Reverb!" in self.desc:
+                amount = sum(1 for p in target_team.lineup if not self.data.get_player(p).has_mod(Mod.GRAVITY))
+                for _ in range(amount):
+                    self.roll("reverb shuffle?")
+            else:
+                amount = sum(1 for p in target_team.rotation if not self.data.get_player(p).has_mod(Mod.GRAVITY))
+                for _ in range(amount):
+                    self.roll("reverb shuffle?")
+
+            return True
+
+        if self.ty == EventType.REVERB_BESTOWS_REVERBERATING:
+            self.roll("Reverb Type")
+            return True
 
-            if self.ty == EventType.COFFEE_BEAN:
-                quality_roll = self.roll("coffee proc1")  # noqa: F841
-                flavor_roll = self.roll("coffee proc")  # noqa: F841
+        if self.batter.has_mod(Mod.ECHO):
+            self.roll("echo?")
 
+            if self.ty in [EventType.ECHO_MESSAGE, EventType.ECHO_INTO_STATIC, EventType.RECEIVER_BECOMES_ECHO]:
+                eligible_players = self.batting_team.lineup + self.batting_team.rotation
+                eligible_players.remove(self.batter.id)
+                self.handle_echo_target_selection(eligible_players)
+
+                if self.ty in [EventType.ECHO_INTO_STATIC, EventType.RECEIVER_BECOMES_ECHO]:
+                    self.roll("echo target 2?")
                 return True
+        if self.pitcher.has_mod(Mod.ECHO):
+            self.roll("echo?")
 
-            if self.batter.has_mod(Mod.COFFEE_PERIL) or self.pitcher.has_mod(Mod.COFFEE_PERIL):
-                self.roll("observed?")
-
-        elif self.weather == Weather.COFFEE_2:
-            coffee2_roll = self.roll("coffee 2")
-            if self.ty == EventType.GAIN_FREE_REFILL and not self.stadium.has_mod(Mod.SWEETENER):
-                self.log_roll(Csv.WEATHERPROC, "Refill", coffee2_roll, True)
-            if self.ty != EventType.GAIN_FREE_REFILL and not self.stadium.has_mod(Mod.SWEETENER):
-                self.log_roll(Csv.WEATHERPROC, "NoRefill", coffee2_roll, False)
-            if self.ty == EventType.GAIN_FREE_REFILL and self.stadium.has_mod(Mod.SWEETENER):
-                self.log_roll(Csv.SWEET2, "Refill", coffee2_roll, True)
-            if self.ty != EventType.GAIN_FREE_REFILL and self.stadium.has_mod(Mod.SWEETENER):
-                self.log_roll(Csv.SWEET2, "NoRefill", coffee2_roll, False)
-
-            if self.ty == EventType.GAIN_FREE_REFILL:
-                quality_roll = self.roll("coffee 2 proc1")  # noqa: F841
-                flavor_one_roll = self.roll("coffee 2 proc2")  # noqa: F841
-                flavor_two_roll = self.roll("coffee 2 proc3")  # noqa: F841
+            if self.ty in [EventType.ECHO_MESSAGE, EventType.ECHO_INTO_STATIC, EventType.RECEIVER_BECOMES_ECHO]:
+                eligible_players = self.pitching_team.lineup + self.pitching_team.rotation
+                eligible_players.remove(self.pitcher.id)
+                self.handle_echo_target_selection(eligible_players)
                 return True
 
-            if self.batter.has_mod(Mod.COFFEE_PERIL) or self.pitcher.has_mod(Mod.COFFEE_PERIL):
-                self.roll("observed?")
+    def handle_weather_coffee(self):
+        coffee1_roll = self.roll("coffee")
+        if self.ty == EventType.COFFEE_BEAN and not self.stadium.has_mod(Mod.SWEETENER):
+            self.log_roll(
+                Csv.WEATHERPROC,
+                "Bean",
+                coffee1_roll,
+                True,
+            )
+        if self.ty != EventType.COFFEE_BEAN and not self.stadium.has_mod(Mod.SWEETENER):
+            self.log_roll(
+                Csv.WEATHERPROC,
+                "NoBean",
+                coffee1_roll,
+                False,
+            )
+        if self.ty == EventType.COFFEE_BEAN and self.stadium.has_mod(Mod.SWEETENER):
+            self.log_roll(
+                Csv.SWEET1,
+                "Bean",
+                coffee1_roll,
+                True,
+            )
+        if self.ty != EventType.COFFEE_BEAN and self.stadium.has_mod(Mod.SWEETENER):
+            self.log_roll(
+                Csv.SWEET1,
+                "NoBean",
+                coffee1_roll,
+                False,
+            )
 
-        elif self.weather == Weather.COFFEE_3S:
-            if self.batter.has_mod(Mod.COFFEE_PERIL) or self.pitcher.has_mod(Mod.COFFEE_PERIL):
-                self.roll("observed?")
-            pass
+        if self.ty == EventType.COFFEE_BEAN:
+            quality_roll = self.roll("coffee proc1")  # noqa: F841
+            flavor_roll = self.roll("coffee proc")  # noqa: F841
 
-        elif self.weather == Weather.FLOODING:
-            pass
+            return True
 
-        elif self.weather == Weather.SALMON:
-            pass
+        if self.batter.has_mod(Mod.COFFEE_PERIL) or self.pitcher.has_mod(Mod.COFFEE_PERIL):
+            self.roll("observed?")
+
+    def handle_weather_coffee_2(self):
+        coffee2_roll = self.roll("coffee 2")
+        if self.ty == EventType.GAIN_FREE_REFILL and not self.stadium.has_mod(Mod.SWEETENER):
+            self.log_roll(Csv.WEATHERPROC, "Refill", coffee2_roll, True)
+        if self.ty != EventType.GAIN_FREE_REFILL and not self.stadium.has_mod(Mod.SWEETENER):
+            self.log_roll(Csv.WEATHERPROC, "NoRefill", coffee2_roll, False)
+        if self.ty == EventType.GAIN_FREE_REFILL and self.stadium.has_mod(Mod.SWEETENER):
+            self.log_roll(Csv.SWEET2, "Refill", coffee2_roll, True)
+        if self.ty != EventType.GAIN_FREE_REFILL and self.stadium.has_mod(Mod.SWEETENER):
+            self.log_roll(Csv.SWEET2, "NoRefill", coffee2_roll, False)
+
+        if self.ty == EventType.GAIN_FREE_REFILL:
+            quality_roll = self.roll("coffee 2 proc1")  # noqa: F841
+            flavor_one_roll = self.roll("coffee 2 proc2")  # noqa: F841
+            flavor_two_roll = self.roll("coffee 2 proc3")  # noqa: F841
+            return True
 
-        elif self.weather.is_polarity():
-            # this is handled after party roll...?
-            pass
+        if self.batter.has_mod(Mod.COFFEE_PERIL) or self.pitcher.has_mod(Mod.COFFEE_PERIL):
+            self.roll("observed?")
 
-        elif self.weather == Weather.NIGHT:
-            # rolled at least after party time?
-            pass
-        elif self.weather == Weather.BLACK_HOLE_BLACK_HOLE:
-            pass
-        else:
-            self.print(f"error: {self.weather.name} weather not implemented")
+    def handle_weather_coffee_3s(self):
+        if self.batter.has_mod(Mod.COFFEE_PERIL) or self.pitcher.has_mod(Mod.COFFEE_PERIL):
+            self.roll("observed?")
+
+    def handle_weather_not_implemented(self):
+        self.print(f"error: {self.weather.name} weather not implemented")
 
     def handle_echo_target_selection(self, target_ids):
         target_roll = self.roll("echo target")
@@ -3451,31 +3220,41 @@ class Resim:
             if player.mods:
                 players_with_mods.append(player)
 
-        self.print("all players:")
+        if not self.tracing(TraceCategory.MODS, TraceLevel.DEBUG):
+            return
+
+        self.trace(TraceCategory.MODS, "all players:", level=TraceLevel.DEBUG)
         for i, player in enumerate(all_players):
-            self.print(
-                "- {} ({}/{}, {:.03f}-{:.03f}) {}".format(
-                    player.name,
-                    i,
-                    len(all_players),
-                    i / len(all_players),
-                    (i + 1) / len(all_players),
-                    player.print_mods(),
-                )
+            self.trace(
+                TraceCategory.MODS,
+                "- {} ({}/{}, {:.03f}-{:.03f}) {}",
+                player.name,
+                i,
+                len(all_players),
+                i / len(all_players),
+                (i + 1) / len(all_players),
+                player.print_mods(),
+                level=TraceLevel.DEBUG,
             )
-        self.print("players with mods:")
+        self.trace(TraceCategory.MODS, "players with mods:", level=TraceLevel.DEBUG)
         for i, player in enumerate(players_with_mods):
-            self.print(
-                "- {} ({}/{}, {:.03f}-{:.03f})".format(
-                    player.name,
-                    i,
-                    len(players_with_mods),
-                    i / len(players_with_mods),
-                    (i + 1) / len(players_with_mods),
-                )
+            self.trace(
+                TraceCategory.MODS,
+                "- {} ({}/{}, {:.03f}-{:.03f})",
+                player.name,
+                i,
+                len(players_with_mods),
+                i / len(players_with_mods),
+                (i + 1) / len(players_with_mods),
+                level=TraceLevel.DEBUG,
             )
 
-        self.print(f"(hit {players_with_mods[int(target_roll * len(players_with_mods))].name})")
+        self.trace(
+            TraceCategory.MODS,
+            "(hit {})",
+            players_with_mods[int(target_roll * len(players_with_mods))].name,
+            level=TraceLevel.DEBUG,
+        )
 
     def handle_flooding(self):
         if self.weather == Weather.FLOODING:
@@ -3524,7 +3303,7 @@ class Resim:
                     if (self.season, self.day) >= (15, 64):
                         exempt_mods += [Mod.EGO2, Mod.EGO3, Mod.EGO4, Mod.LEGENDARY]
                     if not runner.has_any(*exempt_mods):
-                        sweep_roll = self.roll(f"sweep ({runner.name})")
+                        sweep_roll = self.roll(LazyLabel("sweep ({})", runner.name))
 
                         if f"{runner.raw_name} was swept Elsewhere" in self.desc or f"{runner.raw_name} is swept Elsewhere" in self.desc:
                             self.log_roll(Csv.SWEEP, "Sweep", sweep_roll, True, relevant_runner=runner)
@@ -3608,14 +3387,14 @@ class Resim:
                 for seeker in seekers:
                     was_seek_successful = pulled_back and seeker.raw_name in self.desc
                     # guessing at threshold here, it seems to have changed at least once, but this lets us search warns
-                    self.roll(f"seeker ({seeker.raw_name} {player.raw_name})", passed=was_seek_successful, threshold=0.005)
+                    self.roll(LazyLabel("seeker ({} {})", seeker.raw_name, player.raw_name), passed=was_seek_successful, threshold=0.005)
                     if was_seek_successful:
                         self.do_elsewhere_return(player)
                         did_elsewhere_return = True
                         break # <-- load-bearing
 
                 if not pulled_back:
-                    self.roll(f"elsewhere ({player.raw_name})")
+                    self.roll(LazyLabel("elsewhere ({})", player.raw_name))
 
                     if returned:
                         self.do_elsewhere_return(player)
@@ -3626,7 +3405,7 @@ class Resim:
         for player_id in players:
             player = self.data.get_player(player_id)
             if player.has_mod(Mod.SCATTERED) and not team.has_mod(Mod.SCATTERED):
-                unscatter_roll = self.roll(f"unscatter ({player.raw_name})")
+                unscatter_roll = self.roll(LazyLabel("unscatter ({})", player.raw_name))
 
                 # todo: find actual threshold
                 threshold = {
@@ -3646,17 +3425,16 @@ class Resim:
 
                 # Seems to not get rolled when Wyatt Mason IV echoes scattered.
                 if unscatter_roll < threshold and (not player.has_mod(Mod.ECHO) or player.raw_name != player.name):
-                    self.roll(f"unscatter letter ({player.raw_name})")
+                    self.roll(LazyLabel("unscatter letter ({})", player.raw_name))
 
     def do_elsewhere_return(self, player):
         scatter_times = 0
         should_scatter = False
         if "days" in self.desc:
-            elsewhere_time = int(self.desc.split("after ")[1].split(" days")[0])
-            if elsewhere_time > 18:
+            if self.description.elsewhere_days > 18:
                 should_scatter = True
         if "season" in self.desc:
-            if self.event["created"] not in ["2021-04-05T16:24:45.346Z", "2021-04-05T20:08:23.286Z", "2021-07-26T17:13:07.143Z", "2021-07-19T21:10:44.664Z"]:
+            if "elsewhere_return_without_scatter" not in self.corrections.flags:
                 should_scatter = True
 
         if should_scatter:
@@ -3683,7 +3461,7 @@ class Resim:
 
         for team in teams:
             if (self.season < 23 and team.level >= 5) or (self.season == 23 and team.level < 5):
-                attack_roll = self.roll(f"consumers ({team.nickname})")
+                attack_roll = self.roll(LazyLabel("consumers ({})", team.nickname))
 
                 if self.ty == EventType.CONSUMERS_ATTACK:
                     attacked_player_id = self.event["playerTags"][0]
@@ -3699,12 +3477,32 @@ class Resim:
                         roster = [self.data.get_player(p) for p in team.lineup + team.rotation]
                         densities = [p.eDensity for p in roster]
                         total_density = sum(densities)
-                        self.print(f"total density: {total_density}, densities: {densities}, target acc is {target_roll * total_density}")
+                        trace_targets = self.tracing(TraceCategory.MODS, TraceLevel.DEBUG)
+                        if trace_targets:
+                            self.trace(
+                                TraceCategory.MODS,
+                                "total density: {}, densities: {}, target acc is {}",
+                                total_density,
+                                densities,
+                                target_roll * total_density,
+                                level=TraceLevel.DEBUG,
+                            )
                         acc = 0
                         target = None
                         for iter_target, density in zip(roster, densities):
                             acc += density
-                            self.print(f"acc is at {acc} for {iter_target.name}, roll between {(acc-density)/total_density}-{acc/total_density}, {iter_target.mods}, {[f'{i.name},{i.health}' for i in iter_target.items]}")
+                            if trace_targets:
+                                self.trace(
+                                    TraceCategory.MODS,
+                                    "acc is at {} for {}, roll between {}-{}, {}, {}",
+                                    acc,
+                                    iter_target.name,
+                                    (acc - density) / total_density,
+                                    acc / total_density,
+                                    iter_target.mods,
+                                    [f"{i.name},{i.health}" for i in iter_target.items],
+                                    level=TraceLevel.DEBUG,
+                                )
                             if acc > target_roll * total_density and not target:
                                 target = iter_target
                                 # break
@@ -3780,7 +3578,7 @@ class Resim:
                 self.roll("extra party?")
 
             return True
-        elif party_roll < party_threshold and self.event["created"] not in []:
+        elif party_roll < party_threshold:
             team_roll = self.roll("target team (not partying)")
             if team_roll < 0.5 and self.home_team.has_mod(Mod.PARTY_TIME):
                 self.print("!!! home team is in party time")
@@ -3993,8 +3791,8 @@ class Resim:
 
             if runner.undefined():
                 # this *might* be secret base?
-                self.roll(f"undefined (secret base enter)")
-                self.roll(f"undefined (secret base enter)")
+                self.roll("undefined (secret base enter)")
+                self.roll("undefined (secret base enter)")
 
             if "enters the Secret Base..." in self.desc:
                 self.log_roll(
@@ -4037,7 +3835,7 @@ class Resim:
             grindfielder = self.get_fielder_for_roll(grindfielder_roll, ignore_elsewhere=False)
 
             if grindfielder.undefined():
-                self.roll(f"undefined (grindfielder) ({grindfielder.name})")
+                self.roll(LazyLabel("undefined (grindfielder) ({})", grindfielder.name))
 
             grinder = self.data.get_player(self.update["baseRunners"][-1])
             if grinder.undefined():
@@ -4072,8 +3870,7 @@ class Resim:
                     
                 self.roll("trick 1 name")
 
-                m = re.search("They do a .*? \(([0-9]+)\)", self.desc)
-                expected_score_1 = int(m.group(1))
+                expected_score_1 = self.description.trick_one_score
                 pro_factor = 2 if "Pro Skater" in self.desc else 1
                 self.print(f"(press: {runner.pressurization}, cinn: {runner.cinnamon})")
                 lo1 = runner.pressurization * 200
@@ -4110,8 +3907,7 @@ class Resim:
 
                 if "lose their balance and bail!" not in self.desc:
                     self.roll("trick 2 name")
-                    m = re.search("They(?: land|'re tagged out doing) a .*? \(([0-9]+)\)", self.desc)
-                    expected_score_2 = int(m.group(1))
+                    expected_score_2 = self.description.trick_two_score
                     lo2 = runner.pressurization * 500
                     hi2 = runner.cinnamon * 3000 + 1000
                     expected_roll_lo_2 = (expected_score_2 - lo2) / (hi2 - lo2)
@@ -4175,12 +3971,12 @@ class Resim:
             ):
                 runner = self.data.get_player(self.update["baseRunners"][i])
 
-                steal_roll = self.roll(f"steal ({base})")
+                steal_roll = self.roll(LazyLabel("steal ({})", base))
                 if steal_fielder.undefined():
                     self.roll("undefined (fielder steal)")
                 if runner.undefined():
-                    self.roll(f"undefined (runner steal {base})")
-                    self.roll(f"undefined (runner steal {base})")
+                    self.roll(LazyLabel("undefined (runner steal {})", base))
+                    self.roll(LazyLabel("undefined (runner steal {})", base))
 
                 was_success = self.ty == EventType.STOLEN_BASE and (
                     base + 1 == base_stolen
@@ -4237,9 +4033,7 @@ class Resim:
                 break
 
     def create_item(self, event, roll_type: ItemRollType, prev_event):
-        match = re.search("(?:gained|The Winner gets) (.+?)( and ditched| and dropped|\.?$)", self.desc)
-
-        expected_item_name = match.group(1) if match else ""
+        expected_item_name = self.description.item_name
         if roll_type == ItemRollType.PRIZE:
             item_id = self.next_update["state"].get("prizeMatch", {}).get("itemId")
         elif roll_type == ItemRollType.CHEST:
@@ -4262,9 +4056,7 @@ class Resim:
                 f"Unknown element {e} for item created at {event['created']}. This probably means either the roll is in the wrong position or the item pool needs to be updated."
             )
             raise
-        if event["created"] in [
-            "2021-04-20T21:43:04.935Z",
-        ]:
+        if "item_creation_extra_roll" in self.corrections.flags:
             self.roll("????")
 
         if expected_item_name != item_name:
@@ -4281,7 +4073,7 @@ class Resim:
             max_items = player.data.get("evolution", 0) + 1
             if self.prev_event and self.prev_event["type"] == EventType.PLAYER_LOST_ITEM:
                 self.roll("item to replace???")
-        elif match.group(2) in (" and ditched", " and dropped"):
+        elif self.description.item_disposal in (" and ditched", " and dropped"):
             self.roll("item to replace???")
 
     def get_eclipse_threshold(self):
@@ -4295,14 +4087,14 @@ class Resim:
 
     def throw_pitch(self, known_result=None):
         meta = self.get_stat_meta()
-        threshold = get_strike_threshold(
+        threshold = self.formulas.strike_threshold(
             self.batter, self.batting_team, self.pitcher, self.pitching_team, self.stadium, meta, self.is_flinching()
         )
         if self.batter.undefined():
             # musc and mox
             self.roll("undefined (strike formula)")
             self.roll("undefined (strike formula)")
-            self.print(f"--- threshold is {threshold}")
+            self.trace(TraceCategory.ROLL, "--- threshold is {}", threshold)
 
         passed_check = None
         if known_result == "ball":
@@ -4327,19 +4119,8 @@ class Resim:
             self.print(f"!!! warn: too low strike roll (threshold {threshold})")
             self.is_strike = False
 
-        known_result_overrides = {
-            "2021-06-21T20:17:23.768Z": True,
-            "2021-06-24T03:00:24.613Z": True,
-            "2021-06-24T04:12:06.096Z": True,
-            "2021-06-21T23:09:15.837Z": True,
-            "2021-06-26T03:06:40.110Z": True,
-            "2021-06-24T05:15:00.980Z": True,
-            "2021-06-24T08:12:41.052Z": True,
-            "2021-06-24T09:20:42.736Z": True,
-            "2021-06-24T11:10:24.784Z": True,
-        }
-        if self.event["created"] in known_result_overrides:
-            self.is_strike = known_result_overrides[self.event["created"]]
+        if self.corrections.is_strike is not None:
+            self.is_strike = self.corrections.is_strike
 
         if self.pitching_team.has_mod("FIERY") and self.strikes < self.max_strikes - 1:
             # event where our formula registers a ball but we know it's a strike by roll count
@@ -4384,31 +4165,23 @@ class Resim:
 
         # threshold seems to vary between 0.0002 and >0.0015
         # depending on which position or which type of roll?
-        damage_roll = self.roll(f"item damage ({player.name})")
+        damage_roll = self.roll(LazyLabel("item damage ({})", player.name))
 
-        was_item_broken_this_event = (
-            " broke!" in self.desc or " were damaged" in self.desc or " was damaged" in self.desc
-        )
+        was_item_broken_this_event = self.description.item_broken
 
         # so, there are a few(?) cases in early s16 where an item was damaged and broke,
         # and no event was logged or displayed.
-        if (self.event["created"], player.id) in [
-            ("2021-04-12T16:22:51.087Z", "c09e64b6-8248-407e-b3af-1931b880dbee")  # Lenny Spruce
-        ]:
+        if player.id in self.corrections.item_broken:
             was_item_broken_this_event = True
 
         # assuming threshold upper bound
         # if an item was broken, we need to guess whether *this particular roll* is the one that did it
         damage_roll_successful = was_item_broken_this_event and damage_roll < 0.003
 
-        manual_damage_overrides = {
-            # gloria bugsnax must NOT trigger break here (pitcher threshold lower??)
-            ("2021-05-11T09:09:39.742Z", "8cd06abf-be10-4a35-a3ab-1a408a329147"): False,
-        }
-        damage_roll_successful = manual_damage_overrides.get((self.event["created"], player.id), damage_roll_successful)
+        damage_roll_successful = self.corrections.item_damage_results.get(player.id, damage_roll_successful)
 
         if damage_roll_successful:
-            self.roll(f"which item? ({player.name})")
+            self.roll(LazyLabel("which item? ({})", player.name))
 
             if f"{player.raw_name}'s " not in self.desc and f"{player.raw_name}' " not in self.desc:
                 self.print(f"!!! warn: wrong item damage player? (expected {player.raw_name})")
@@ -4480,6 +4253,10 @@ class Resim:
 
     def setup_data(self, event):
         self.prev_event = self.event
+        # game_id only changes for events in a game
+        self.corrections = self.corrections_registry.lookup(
+            event["created"], event["gameTags"][0] if event["gameTags"] else self.game_id
+        )
         self.apply_event_changes(event)
 
         meta = event.get("metadata") or {}
@@ -4490,8 +4267,11 @@ class Resim:
         self.event = event
         self.ty = event["type"]
         self.desc = event["description"].replace("\n", " ").strip()
+        self.description = EventDescription(self.desc)
         self.season = event["season"]
         self.day = event["day"]
+        if self.formulas is None or self.formulas.season != self.season:
+            self.formulas = season_formulas(self.season)
 
         if not event["gameTags"]:
             return
@@ -4501,33 +4281,7 @@ class Resim:
         update = self.data.get_update(self.game_id, self.play)
         next_update = self.data.get_update(self.game_id, self.play + 1)
         if not update:
-            # This list is events where using the prev_event is more accurate.
-            if next_update and self.event["created"] not in [
-                "2021-03-01T16:31:50.029Z",
-                "2021-03-01T17:23:04.303Z",
-                "2021-03-01T20:21:59.527Z",
-                "2021-03-01T20:28:29.487Z",
-                "2021-03-01T20:30:01.929Z",
-                "2021-03-01T21:19:19.226Z",
-                "2021-03-01T21:19:52.469Z",
-                "2021-03-01T21:19:52.494Z",
-                "2021-03-01T21:33:49.349Z",
-                "2021-03-01T22:07:52.618Z",
-                "2021-03-01T22:07:53.281Z",
-                "2021-03-01T22:07:53.307Z",
-                "2021-03-01T22:24:36.120Z",
-                "2021-03-01T22:24:37.784Z",
-                "2021-03-02T08:02:06.414Z",
-                "2021-03-02T08:02:06.485Z",
-                "2021-03-02T09:21:45.373Z",
-                "2021-03-02T11:26:53.751Z",
-                "2021-03-02T11:26:56.343Z",
-                "2021-03-02T12:23:40.536Z",
-                "2021-03-02T12:24:43.753Z",
-                "2021-03-02T12:26:07.445Z",
-                "2021-03-02T13:25:06.682Z",
-                "2021-03-02T14:00:17.408Z",
-            ]:
+            if next_update and not self.corrections.use_previous_update:
                 update = NullUpdate(next_update)
             else:
                 if self.play <= 0:
@@ -4539,49 +4293,15 @@ class Resim:
                 update = NullUpdate(prev_update)
 
         # manual fixes for missing data
-        if self.game_id == "9b1c6091-7f04-46c7-af78-0a7af4d31991" and self.play == 250:
-            update = NullUpdate(self.data.get_update(self.game_id, 252))
-        elif self.game_id == "bdb1aacf-a6be-4003-b018-10ef94c50c78" and self.play == 249:
-            update = NullUpdate(self.data.get_update(self.game_id, 251))
-            update["basesOccupied"] = [0]
-
-        missing_update_adjustments = {
-            "2021-03-01T20:21:57.896Z": {"homeBatter": "5eac7fd9-0d19-4bf4-a013-994acc0c40c0"},
-            "2021-03-01T20:31:34.705Z": {"homeBatter": "cbd19e6f-3d08-4734-b23f-585330028665"},
-            "2021-03-02T08:02:06.485Z": {"homeBatter": "cc11963b-a05b-477b-b154-911dc31960df"},
-            "2021-03-02T13:25:04.036Z": {"awayBatter": "126fb128-7c53-45b5-ac2b-5dbf9943d71b"},
-            "2021-03-02T08:02:06.107Z": {"awayBatter": "8ecea7e0-b1fb-4b74-8c8c-3271cb54f659"},
-            "2021-03-02T14:00:17.408Z": {"awayBatter": "32810dca-825c-4dbc-8b65-0702794c424e"},
-            "2021-03-02T14:00:17.613Z": {"awayBatter": "cbd19e6f-3d08-4734-b23f-585330028665"},
-            "2021-03-02T14:24:41.163Z": {"homeBatter": "7932c7c7-babb-4245-b9f5-cdadb97c99fb"},
-            "2021-03-02T14:24:41.888Z": {"homeBatter": "d89da2d2-674c-4b85-8959-a4bd406f760a"},
-            "2021-03-02T14:24:43.752Z": {"homeBatter": "413b3ddb-d933-4567-a60e-6d157480239d"},
-            "2021-03-02T14:24:45.582Z": {"awayBatter": "4ecee7be-93e4-4f04-b114-6b333e0e6408"},
-            "2021-03-02T14:24:46.430Z": {"awayBatter": "4ecee7be-93e4-4f04-b114-6b333e0e6408"},
-            "2021-03-02T14:24:50.559Z": {"homeBatter": "e16c3f28-eecd-4571-be1a-606bbac36b2b"},
-            "2021-03-02T14:24:51.485Z": {"homeBatter": "7932c7c7-babb-4245-b9f5-cdadb97c99fb"},
-            "2021-04-14T15:08:13.123Z": {
-                "basesOccupied": [1],
-                "atBatStrikes": 1,
-                "halfInningOuts": 1,
-            },
-            "2021-04-14T15:21:12.199Z": {
-                "basesOccupied": [2, 0],
-                "baseRunners": ["4b01cc3f-c59f-486d-9c00-b8a82624e620", "5361e381-6658-488b-8236-dde6a264554f"],
-            },
-            "2021-04-14T15:21:10.904Z": {"basesOccupied": [0]},
-            "2021-04-14T15:21:15.954Z": {"basesOccupied": [1]},
-            "2021-04-14T15:21:16.255Z": {"basesOccupied": [0]},
-            "2021-04-14T15:21:16.683Z": {
-                "basesOccupied": [1],
-                "baseRunners": ["b643a520-af38-42e3-8f7b-f660e52facc9"],
-                "secretBaserunner": [],
-            },
-        }
+        replacement = self.corrections.replacement_updates.get(self.play)
+        if replacement:
+            source_play, fields = replacement
+            update = NullUpdate(self.data.get_update(self.game_id, source_play))
+            for k, v in fields.items():
+                update[k] = copy.deepcopy(v)
 
-        if self.event["created"] in missing_update_adjustments:
-            for k, v in missing_update_adjustments[self.event["created"]].items():
-                update[k] = v
+        for k, v in self.corrections.update_fields.items():
+            update[k] = copy.deepcopy(v)
 
         self.update = update
         self.next_update = next_update
@@ -4644,6 +4364,9 @@ class Resim:
 
     def apply_event_changes(self, event):
         # maybe move this function to data.py?
+        if event["type"] not in EVENT_CHANGE_TYPES:
+            return
+
         meta = event.get("metadata", {})
         desc = event["description"]
 
@@ -4659,7 +4382,7 @@ class Resim:
             else:
 
                 if meta["mod"] == "EXTRA_BASE":
-                    self.stadium.mods.add(meta["mod"])
+                    self.stadium.add_mod(meta["mod"])
                     self.stadium.last_update_time = self.event["created"]
                 else:
                     team = self.data.get_team(event["teamTags"][0])
@@ -4679,7 +4402,7 @@ class Resim:
                 return
             
             # bhbh nullifying mods
-            if meta["mod"] in self.stadium.mods:
+            if self.stadium.has_mod(meta["mod"]):
                 self.stadium.remove_mod(meta["mod"])
 
             if event["playerTags"]:
@@ -4824,9 +4547,9 @@ class Resim:
 
         if event["type"] == EventType.PLAYER_SWAP:
             # For some reason, this swap doesn't actually happen. Possibly a bug with a player getting swapped multiple times?
-            if event["created"] in ["2021-04-20T15:01:43.671Z", "2021-06-18T03:11:33.191Z"]:
+            if "player_swap_skipped" in self.corrections.flags:
                 return
-            if event["created"] in ["2021-07-26T18:16:26.686Z", "2021-07-20T04:31:50.511Z"]:
+            if "player_swap_already_applied" in self.corrections.flags:
                 # by the time we get this event it's already happened in our data??
                 return
             team = self.data.get_team(meta["teamId"])
@@ -4894,7 +4617,7 @@ class Resim:
             attr_name = stat_indices[meta["type"]]
 
             # we just set to "after" so doesn't matter if it's increase or decrease
-            player.data[attr_name] = meta["after"]
+            player.set_raw_stat(attr_name, meta["after"])
             player.update_stats()
             player.last_update_time = self.event["created"]
 
@@ -4908,34 +4631,114 @@ class Resim:
                 if update["inning"] == inning:
                     return update["awayScore"], update["homeScore"]
 
-    def run(self, start_timestamp, end_timestamp, progress_callback):
-        self.data.fetch_league_data(start_timestamp)
+    def run(self, start_timestamp, end_timestamp, progress_callback, checkpoint=None, stop_at=None):
+        """
+        Runs the fragment, or part of it: from a checkpoint, and/or until the event a later checkpoint was taken at
+        (stop_at is that checkpoint's header), which this checks the state against.
+        """
         feed_events = get_feed_between(start_timestamp, end_timestamp)
+        if checkpoint is None:
+            self.data.fetch_league_data(start_timestamp)
+            start_index = 0
+        else:
+            start_index = self.restore_checkpoint(checkpoint, feed_events)
+        stop_index = len(feed_events) if stop_at is None else stop_at["feed_index"]
 
-        for event in feed_events:
+        for i in range(start_index, stop_index):
+            event = feed_events[i]
             if progress_callback:
                 progress_callback()
             event["type"] = EventType(event["type"])
+            if (
+                self.checkpoint_dir is not None
+                and event["type"] == EventType.LETS_GO
+                and (event["season"], event["day"]) not in self.started_days
+            ):
+                self.save_checkpoint(i, event)
             self.handle(event)
 
+        if stop_at is not None:
+            self.verify_checkpoint(stop_at, feed_events)
+
+        load_stats = self.data.load_stats
+        self.print(
+            f"entity snapshots: {load_stats['hits']} from parsed cache ({load_stats['hit_secs']:.2f}s), "
+            f"{load_stats['misses']} parsed from json ({load_stats['miss_secs']:.2f}s)"
+        )
         self.save_data()
+        if self.checkpoint_dir is not None and stop_at is None:
+            mark_complete(self.checkpoint_dir)
+
+    def state_fingerprint(self):
+        # the parts of the state a segment's end is compared on - anything that drifted will show up in these
+        return {
+            "rng": self.rng.get_state(),
+            "started_days": sorted(self.started_days),
+            "fetched_days": sorted(self.fetched_days),
+            "pending_attractor": getattr(self.pending_attractor, "id", self.pending_attractor),
+            "entities": {
+                entity_id: (entity.digest, entity.last_update_time)
+                for entities in (self.data.players, self.data.teams, self.data.stadiums)
+                for entity_id, entity in entities.items()
+            },
+        }
 
-    def emit_roll_to_stream(self, label: str, value: float, passed: Optional[bool], threshold: Optional[float]):
-        if self.stream_file is None:
+    def save_checkpoint(self, feed_index, event):
+        # everything needed to carry on from this event exactly like the full run would
+        header = {
+            "feed_index": feed_index,
+            "event_id": event["id"],
+            "fingerprint": self.state_fingerprint(),
+        }
+        state = {
+            "resim": {k: v for k, v in self.__dict__.items() if k not in CHECKPOINT_EXCLUDED},
+            "seen_odds": seen_odds,
+            "roll_stream_position": self.roll_stream.position if self.roll_stream is not None else None,
+        }
+        write_checkpoint(self.checkpoint_dir, event["season"], event["day"], header, state)
+
+    def verify_checkpoint(self, header, feed_events):
+        feed_index = header["feed_index"]
+        if feed_index >= len(feed_events) or feed_events[feed_index]["id"] != header["event_id"]:
+            raise ValueError("the feed doesn't line up with this checkpoint, it needs to be made again")
+        fingerprint = self.state_fingerprint()
+        if fingerprint != header["fingerprint"]:
+            expected = header["fingerprint"]
+            differences = [key for key in fingerprint if key != "entities" and fingerprint[key] != expected[key]]
+            differences += [
+                entity_id
+                for entity_id in fingerprint["entities"].keys() | expected["entities"].keys()
+                if fingerprint["entities"].get(entity_id) != expected["entities"].get(entity_id)
+            ]
+            raise ValueError(
+                f"state at {feed_events[feed_index]['created']} doesn't match the checkpoint there: "
+                f"{', '.join(differences[:10])}"
+            )
+
+    def restore_checkpoint(self, checkpoint, feed_events) -> int:
+        """
+        Loads state from a checkpoint, returns the index in feed_events to carry on from
+        """
+        feed_index = checkpoint["feed_index"]
+        if feed_index >= len(feed_events) or feed_events[feed_index]["id"] != checkpoint["event_id"]:
+            raise ValueError("the feed doesn't line up with this checkpoint, it needs to be made again")
+
+        self.__dict__.update(checkpoint["resim"])
+        seen_odds.clear()
+        seen_odds.update(checkpoint["seen_odds"])
+        if self.roll_stream is not None and checkpoint["roll_stream_position"] is not None:
+            self.roll_stream.position = checkpoint["roll_stream_position"]
+        return feed_index
+
+    def emit_roll_to_stream(self, label, value: float, passed: Optional[bool], threshold: Optional[float]):
+        if self.roll_stream is None:
             return
-        self.stream_file.write(json.dumps({
-            "label": label,
-            "roll": value,
-            "passed": passed,
-            "threshold": threshold
-        }) + "\n")
+        self.roll_stream.write_roll(label, value, passed, threshold)
 
     def emit_correction_to_stream(self, to_step: int):
-        if self.stream_file is None:
+        if self.roll_stream is None:
             return
-        self.stream_file.write(json.dumps({
-            "correction": to_step
-        }) + "\n")
+        self.roll_stream.write_correction(to_step)
 
     def roll(
         self,
@@ -4946,7 +4749,8 @@ class Resim:
         threshold: Optional[float] = None,
     ) -> float:
         value = self.rng.next()
-        self.print(f"{label}: {value}")
+        if self.trace_rolls:
+            print(f"{label}: {value}", file=self.out_file)
         self.emit_roll_to_stream(label, value, passed, threshold)
 
         if threshold is not None and passed is not None:
@@ -4960,14 +4764,16 @@ class Resim:
                 "!!! warn: value {}={} out of bounds (should be within {}-{})".format(label, value, lower, upper)
             )
 
-        # hacky way to figure out what index this roll is in the overall list
-        idx = 0
-        if self.roll_log:
-            if self.roll_log[-1].event_id == self.event["id"]:
-                idx = self.roll_log[-1].index + 1
+        if self.roll_log is not None:
+            # index of this roll within the event
+            if self.roll_log_event_id == self.event["id"]:
+                self.roll_log_index += 1
+            else:
+                self.roll_log_event_id = self.event["id"]
+                self.roll_log_index = 0
 
-        log_obj = LoggedRoll(self.event["id"], idx, self.event["created"], label, lower, upper)
-        self.roll_log.append(log_obj)
+            log_obj = LoggedRoll(self.event["id"], self.roll_log_index, self.event["created"], str(label), lower, upper)
+            self.roll_log.append(log_obj)
         return value
 
     def generate_player(self):
@@ -4985,16 +4791,19 @@ class Resim:
     def save_data(self):
         for csv in self.csvs.values():
             csv.close()
+        if self.csv_writer is not None:
+            # the store's connection belongs to the writer thread, so it has to be closed there too
+            self.csv_writer.submit(self.object_store.close)
+            # waits for everything queued to be written
+            self.csv_writer.close()
 
-        if self.stream_file is not None:
-            self.stream_file.close()
+        if self.roll_stream is not None:
+            self.roll_stream.close()
 
-        import csv, dataclasses
-        if self.odds_log:
-            with open(f"roll_data/odds_{self.run_name}.csv", "w", newline="") as f:
-                dw = csv.DictWriter(f, fieldnames=list(self.odds_log[0].__dict__.keys()))
-                dw.writeheader()
-                dw.writerows((dataclasses.asdict(ol) for ol in self.odds_log))
+        if self.odds_log is not None:
+            self.odds_log.close()
+        if self.roll_log is not None:
+            self.roll_log.close()
 
 
 def advance_bases(occupied, amount, up_to=4):
@@ -5056,6 +4865,280 @@ def calculate_advances(bases_before, bases_after, bases_hit, home_base=Base.FOUR
     return rolls
 
 
+def build_dispatch_table(entries):
+    # earlier entries win, same as the if-chains these replaced
+    table = {}
+    for event_types, handler in entries:
+        for event_type in event_types:
+            table.setdefault(event_type, handler)
+    return table
+
+
+MISC_HANDLERS = build_dispatch_table(
+    [
+        (
+            [EventType.HALF_INNING, EventType.SUN_30, EventType.HOLIDAY_INNING, EventType.SALMON_SWIM],
+            Resim.handle_inning_start_event,
+        ),
+        (
+            [
+                EventType.HOME_FIELD_ADVANTAGE,
+                EventType.BECOME_TRIPLE_THREAT,
+                EventType.SOLAR_PANELS_AWAIT,
+                EventType.SOLAR_PANELS_ACTIVATION,
+                EventType.EVENT_HORIZON_AWAITS,
+                EventType.EVENT_HORIZON_ACTIVATION,
+                EventType.HOMEBODY,
+                EventType.SUPERYUMMY,
+                EventType.PERK,
+                EventType.SHAME_DONOR,
+                EventType.PSYCHO_ACOUSTICS,
+                EventType.AMBITIOUS,
+                EventType.UNAMBITIOUS,
+                EventType.LATE_TO_THE_PARTY,
+                EventType.MIDDLING,
+                EventType.SHAMING_RUN,
+                EventType.EARLBIRD,
+                EventType.PRIZE_MATCH,
+                EventType.A_BLOOD_TYPE,
+                EventType.COASTING,
+                EventType.TEAM_RECEIVED_GIFT,
+                EventType.BLESSING_OR_GIFT_WON,
+                EventType.PLAYER_SOUL_INCREASED,
+            ],
+            Resim.handle_pregame_message,
+        ),
+        (
+            [
+                EventType.OVER_UNDER,
+                EventType.UNDER_OVER,
+                EventType.UNDERSEA,
+                EventType.ADDED_MOD_FROM_OTHER_MOD,
+                EventType.REMOVED_MODIFICATION,
+                EventType.CHANGED_MODIFIER,
+                EventType.REMOVED_MULTIPLE_MODIFICATIONS_ECHO,
+                EventType.ADDED_MULTIPLE_MODIFICATIONS_ECHO,
+                EventType.LEAGUE_MODIFICATION_REMOVED,
+            ],
+            Resim.handle_mod_change_message,
+        ),
+        (
+            [
+                EventType.BLACK_HOLE,
+                EventType.BLACK_HOLE_BLACK_HOLE,
+                EventType.SUN2,
+                EventType.SUN_2_OUTCOME,
+                EventType.BLACK_HOLE_OUTCOME,
+                EventType.SUN_SUN_PRESSURE,
+            ],
+            Resim.handle_sun2_black_hole,
+        ),
+        (
+            [
+                EventType.PLAYER_STAT_INCREASE,
+                EventType.PLAYER_STAT_DECREASE,
+                EventType.PLAYER_STAT_DECREASE_FROM_SUPERALLERGIC,
+            ],
+            Resim.handle_stat_change,
+        ),
+        # skipping incineration stuff
+        (
+            [
+                EventType.PLAYER_BORN_FROM_INCINERATION,
+                EventType.ENTER_HALL_OF_FLAME,
+                EventType.EXIT_HALL_OF_FLAME,
+                EventType.PLAYER_HATCHED,
+            ],
+            Resim.handle_skipped_event,
+        ),
+        # skipping echo/static
+        ([EventType.PLAYER_REMOVED_FROM_TEAM, EventType.MODIFICATION_CHANGE], Resim.handle_skipped_event),
+        ([EventType.INCINERATION], Resim.handle_incineration),
+        # s skipping pitcher change?
+        ([EventType.PITCHER_CHANGE], Resim.handle_skipped_event),
+        (
+            [
+                EventType.REMOVED_MOD,
+                EventType.PLAYER_MOVE,
+                EventType.INVESTIGATION_PROGRESS,
+                EventType.ENTERING_CRIMESCENE,
+                EventType.WEATHER_EVENT,
+                EventType.RUNS_SCORED,
+                EventType.TUNNEL_FLED_ELSEWHERE,
+                EventType.TUNNEL_FOUND_NOTHING,
+                EventType.TRADE_FAILED,
+                EventType.TRADE_SUCCESS,
+                EventType.PLAYER_MOVE_FAILED_FORCE,
+            ],
+            Resim.handle_skipped_event,
+        ),
+        ([EventType.EXISTING_PLAYER_ADDED_TO_ILB], Resim.handle_added_to_ilb),
+        # skip postseason
+        (
+            [
+                EventType.PLAYER_ADDED_TO_TEAM,
+                EventType.BIG_DEAL,
+                EventType.WON_INTERNET_SERIES,
+                EventType.UNDEFINED_TYPE,
+            ],
+            Resim.handle_skipped_event,
+        ),
+        ([EventType.POSTSEASON_SPOT], Resim.handle_postseason_spot),
+        (
+            [EventType.REVERB_ROTATION_SHUFFLE, EventType.REVERB_FULL_SHUFFLE, EventType.REVERB_LINEUP_SHUFFLE],
+            Resim.handle_reverb_shuffle,
+        ),
+        # skip feedback
+        ([EventType.PLAYER_TRADED], Resim.handle_skipped_event),
+        ([EventType.INNING_END], Resim.handle_inning_end),
+        (
+            [
+                EventType.GAME_END,
+                EventType.ADDED_MOD,
+                EventType.REMOVED_MOD,
+                EventType.MOD_EXPIRES,
+                EventType.FINAL_STANDINGS,
+                EventType.TEAM_WAS_SHAMED,
+                EventType.TEAM_DID_SHAME,
+                EventType.ELIMINATED_FROM_POSTSEASON,
+                EventType.POSTSEASON_ADVANCE,
+                EventType.HYPE_BUILT,
+                EventType.PRACTICING_MODERATION,
+                EventType.WIN_COLLECTED_REGULAR,
+                EventType.WIN_COLLECTED_POSTSEASON,
+                EventType.GAME_OVER,
+                EventType.BALLOONS_INFLATED,
+                EventType.VOICEMAIL,
+            ],
+            Resim.handle_game_end,
+        ),
+        ([EventType.THIEVES_GUILD_PLAYER], Resim.handle_thieves_guild_player),
+        ([EventType.THIEVES_GUILD_ITEM], Resim.handle_thieves_guild_item),
+        ([EventType.LETS_GO], Resim.handle_lets_go),
+        ([EventType.PLAY_BALL], Resim.handle_play_ball),
+        ([EventType.FLAG_PLANTED], Resim.handle_flag_planted),
+        ([EventType.RENOVATION_BUILT], Resim.handle_renovation_built),
+        ([EventType.LIGHT_SWITCH_TOGGLED], Resim.handle_skipped_event),
+        ([EventType.ELEMENT_ADDED_TO_ITEM], Resim.handle_skipped_event),
+        ([EventType.TAROT_READING], Resim.handle_skipped_event),
+        ([EventType.LOVERS_LINEUP_OPTIMIZED], Resim.handle_skipped_event),
+        ([EventType.EMERGENCY_ALERT, EventType.BIG_DEAL], Resim.handle_emergency_alert),
+        ([EventType.TEAM_JOINED_LEAGUE], Resim.handle_skipped_event),
+        ([EventType.TEAM_INCINERATION_REPLACEMENT], Resim.handle_skipped_event),
+        ([EventType.TEAM_FORMED], Resim.handle_skipped_event),
+        (
+            [
+                EventType.ITEM_BREAKS,
+                EventType.ITEM_DAMAGE,
+                EventType.PLAYER_GAINED_ITEM,
+                EventType.PLAYER_LOST_ITEM,
+                EventType.BROKEN_ITEM_REPAIRED,
+                EventType.DAMAGED_ITEM_REPAIRED,
+                EventType.TUNNEL_STOLE_ITEM,
+            ],
+            Resim.handle_item_change,
+        ),
+        ([EventType.PLAYER_SWAP], Resim.handle_skipped_event),
+        ([EventType.PLAYER_HIDDEN_STAT_INCREASE, EventType.PLAYER_HIDDEN_STAT_DECREASE], Resim.handle_skipped_event),
+        ([EventType.WEATHER_CHANGE], Resim.handle_skipped_event),
+        ([EventType.JAZZ], Resim.handle_jazz),
+        ([EventType.COMMUNITY_CHEST_GAME_EVENT], Resim.handle_community_chest),
+        ([EventType.BALLPARK_MOD_RATIFIED], Resim.handle_skipped_event),
+        ([EventType.RELOAD_PROC], Resim.handle_skipped_event),
+    ]
+)
+
+
+def weather_handler_for(weather: Weather):
+    # same order the checks used to be in handle_weather
+    if weather == Weather.SUN_2:
+        return Resim.handle_weather_none
+    if weather in [Weather.ECLIPSE, Weather.SUPERNOVA_ECLIPSE]:
+        return Resim.handle_weather_eclipse
+    if weather == Weather.GLITTER:
+        # this is handled inside the ballpark proc block(?????)
+        return Resim.handle_weather_none
+    if weather == Weather.BLOODDRAIN:
+        return Resim.handle_weather_blooddrain
+    if weather == Weather.PEANUTS:
+        return Resim.handle_weather_peanuts
+    if weather == Weather.BIRDS:
+        return Resim.handle_weather_birds
+    if weather == Weather.FEEDBACK:
+        return Resim.handle_weather_feedback
+    if weather == Weather.REVERB:
+        return Resim.handle_weather_reverb
+    if weather == Weather.BLACK_HOLE:
+        return Resim.handle_weather_none
+    if weather == Weather.COFFEE:
+        return Resim.handle_weather_coffee
+    if weather == Weather.COFFEE_2:
+        return Resim.handle_weather_coffee_2
+    if weather == Weather.COFFEE_3S:
+        return Resim.handle_weather_coffee_3s
+    if weather == Weather.FLOODING:
+        return Resim.handle_weather_none
+    if weather == Weather.SALMON:
+        return Resim.handle_weather_none
+    if weather.is_polarity():
+        # this is handled after party roll...?
+        return Resim.handle_weather_none
+    if weather == Weather.NIGHT:
+        # rolled at least after party time?
+        return Resim.handle_weather_none
+    if weather == Weather.BLACK_HOLE_BLACK_HOLE:
+        return Resim.handle_weather_none
+    return Resim.handle_weather_not_implemented
+
+
+WEATHER_HANDLERS = {weather: weather_handler_for(weather) for weather in Weather}
+
+PITCH_HANDLERS = build_dispatch_table(
+    [
+        ([EventType.WALK, EventType.BALL, EventType.MILD_PITCH], Resim.handle_ball),
+        ([EventType.FLY_OUT, EventType.GROUND_OUT], Resim.handle_out),
+        ([EventType.STRIKEOUT, EventType.STRIKE], Resim.handle_strike),
+        ([EventType.HOME_RUN], Resim.handle_hr),
+        ([EventType.HIT], Resim.handle_base_hit),
+        ([EventType.FOUL_BALL], Resim.handle_foul),
+    ]
+)
+
+# every event type apply_event_changes does something for
+EVENT_CHANGE_TYPES = frozenset(
+    [
+        EventType.ADDED_MOD,
+        EventType.ADDED_MOD_FROM_OTHER_MOD,
+        EventType.REMOVED_MOD,
+        EventType.REMOVED_MODIFICATION,
+        EventType.CHANGED_MODIFIER,
+        EventType.MOD_EXPIRES,
+        EventType.REMOVED_MULTIPLE_MODIFICATIONS_ECHO,
+        EventType.ADDED_MULTIPLE_MODIFICATIONS_ECHO,
+        EventType.PLAYER_STAT_INCREASE,
+        EventType.PLAYER_STAT_DECREASE,
+        EventType.PLAYER_STAT_DECREASE_FROM_SUPERALLERGIC,
+        EventType.PLAYER_HATCHED,
+        EventType.PLAYER_GAINED_ITEM,
+        EventType.PLAYER_LOST_ITEM,
+        EventType.TRADE_SUCCESS,
+        EventType.PLAYER_REMOVED_FROM_TEAM,
+        EventType.MODIFICATION_CHANGE,
+        EventType.PLAYER_TRADED,
+        EventType.PLAYER_MOVE,
+        EventType.PLAYER_SWAP,
+        EventType.PLAYER_BORN_FROM_INCINERATION,
+        EventType.ITEM_BREAKS,
+        EventType.ITEM_DAMAGE,
+        EventType.BROKEN_ITEM_REPAIRED,
+        EventType.DAMAGED_ITEM_REPAIRED,
+        EventType.HYPE_BUILT,
+        EventType.PLAYER_HIDDEN_STAT_INCREASE,
+        EventType.PLAYER_HIDDEN_STAT_DECREASE,
+    ]
+)
+
+
 @dataclass
 class LoggedRoll:
     event_id: str
@@ -0,0 +1,92 @@
+import collections
+import csv
+import dataclasses
+import os
+from enum import Enum, unique
+from typing import Optional
+
+
+@unique
+class RollLogMode(Enum):
+    """
+    Where Resim's per-roll log (LoggedRoll entries) goes. Off by default, since nothing
+    in a normal run reads it and it grows with every roll of the fragment.
+    """
+
+    OFF = "off"
+    RING = "ring"  # keep the last N rolls and write them out on an error or at the end, to see what led up to it
+    FILE = "file"  # stream every roll to a csv
+    MEMORY = "memory"  # keep everything, divine.py needs this
+
+
+class MemoryRollLog(list):
+    def close(self):
+        pass
+
+
+class StreamedCsvLog:
+    """
+    Appends dataclass rows to a csv as they come in instead of holding them in memory.
+    Like SaveCsv, it writes to a .partial file that only gets its real name on close.
+    """
+
+    def __init__(self, filename: str):
+        self.final_filename = filename
+        self.partial_filename = f"{filename}.partial"
+        # Created when first row is written
+        self.file = None
+        self.csv = None
+        self.rows = 0
+
+    def append(self, row):
+        if self.csv is None:
+            os.makedirs(os.path.dirname(self.final_filename) or ".", exist_ok=True)
+            self.file = open(self.partial_filename, "w", newline="", encoding="utf-8")
+            self.csv = csv.writer(self.file)
+            self.csv.writerow(field.name for field in dataclasses.fields(row))
+        self.csv.writerow(dataclasses.astuple(row))
+        self.rows += 1
+
+    def __len__(self):
+        return self.rows
+
+    def close(self):
+        if not self.file:
+            return
+        self.file.close()
+        self.file = None
+        self.csv = None
+
+        os.replace(self.partial_filename, self.final_filename)
+
+
+class RingRollLog(collections.deque):
+    """
+    The last `size` rolls. They get written to the csv (replacing what an earlier dump wrote) when Resim reports an
+    error and when the log is closed
+    """
+
+    def __init__(self, filename: str, size: int):
+        super().__init__(maxlen=size)
+        self.filename = filename
+
+    def dump(self):
+        if not self:
+            return
+        log = StreamedCsvLog(self.filename)
+        for row in self:
+            log.append(row)
+        log.close()
+
+    def close(self):
+        self.dump()
+
+
+def make_roll_log(mode: RollLogMode, filename: str, size: int = 10000) -> Optional[object]:
+    if mode == RollLogMode.OFF:
+        return None
+    if mode == RollLogMode.RING:
+        return RingRollLog(filename, size)
+    if mode == RollLogMode.FILE:
+        return StreamedCsvLog(filename)
+    return MemoryRollLog()
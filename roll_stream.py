@@ -0,0 +1,249 @@
+import bisect
+import json
+import math
+import mmap
+import struct
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+# roll value, threshold, rng position, event index, label id, flags, padding: 36 bytes per roll.
+# label ids are 32 bits, since LazyLabels with player names in them can make a lot of distinct labels in a fragment
+RECORD = struct.Struct("<ddqIIB3x")
+STREAM_EXTENSION = ".rolls"
+INDEX_EXTENSION = ".rolls.idx.json"
+
+FLAG_PASSED = 1
+FLAG_HAS_PASSED = 2
+FLAG_HAS_THRESHOLD = 4
+# an rng correction from corrections.json, the roll value is how many steps
+FLAG_CORRECTION = 8
+
+# records are collected into a buffer and written in chunks of about this size
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+class RollRecord(NamedTuple):
+    label: str
+    roll: float
+    passed: Optional[bool]
+    threshold: Optional[float]
+    # index into the stream's events
+    event_index: int
+    # how many times the rng had been stepped (rolls and corrections) since the start of the stream
+    position: int
+    is_correction: bool
+
+    def to_json(self) -> dict:
+        # what the old .ndjson stream had on each line
+        if self.is_correction:
+            return {"correction": int(self.roll)}
+        return {"label": self.label, "roll": self.roll, "passed": self.passed, "threshold": self.threshold}
+
+
+class RollStreamWriter:
+    """
+    Writes every roll of a fragment as a fixed-width binary record to <run>.rolls, and on close a sidecar
+    <run>.rolls.idx.json with the label names and where each event's records start.
+    """
+
+    def __init__(self, path_prefix: Path):
+        self.stream_path = path_prefix.with_name(path_prefix.name + STREAM_EXTENSION)
+        self.index_path = path_prefix.with_name(path_prefix.name + INDEX_EXTENSION)
+        self.file = open(self.stream_path, "wb")
+        self.buffer = bytearray()
+        self.record_count = 0
+        self.position = 0
+        # label -> id, and the labels by id
+        self.label_ids: Dict[str, int] = {}
+        self.label_names: List[str] = []
+        # [event id, timestamp, first record] for each event
+        self.events: List[list] = []
+        self.event_index = -1
+
+    def start_event(self, event_id: str, timestamp: str):
+        self.events.append([event_id, timestamp, self.record_count])
+        self.event_index += 1
+
+    def label_id(self, label) -> int:
+        # most labels are strs already, but LazyLabels have to be formatted (and hash by identity, so can't be keys)
+        name = label if type(label) is str else str(label)
+        label_id = self.label_ids.get(name)
+        if label_id is None:
+            label_id = len(self.label_names)
+            self.label_names.append(name)
+            self.label_ids[name] = label_id
+        return label_id
+
+    def write_roll(self, label, value: float, passed: Optional[bool], threshold: Optional[float]):
+        flags = 0
+        if passed is not None:
+            flags = FLAG_HAS_PASSED | (FLAG_PASSED if passed else 0)
+        if threshold is not None:
+            flags |= FLAG_HAS_THRESHOLD
+        else:
+            threshold = math.nan
+        self._write(value, threshold, self.label_id(label), flags)
+        self.position += 1
+
+    def write_correction(self, to_step: int):
+        self._write(float(to_step), math.nan, 0, FLAG_CORRECTION)
+        self.position += to_step
+
+    def _write(self, value: float, threshold: float, label_id: int, flags: int):
+        self.buffer += RECORD.pack(value, threshold, self.position, max(self.event_index, 0), label_id, flags)
+        self.record_count += 1
+        if len(self.buffer) >= WRITE_BUFFER_SIZE:
+            self.file.write(self.buffer)
+            self.buffer.clear()
+
+    def close(self):
+        if self.file is None:
+            return
+        self.file.write(self.buffer)
+        self.buffer.clear()
+        self.file.close()
+        self.file = None
+
+        with open(self.index_path, "w") as f:
+            json.dump({"record_size": RECORD.size, "labels": self.label_names, "events": self.events}, f)
+
+
+class RollStream:
+    """
+    Reads a stream written by RollStreamWriter. The records are memory-mapped, so opening a season-sized stream
+    and jumping to one event doesn't read the rest of it.
+    """
+
+    def __init__(self, path_prefix: Path):
+        path_prefix = Path(path_prefix)
+        with open(path_prefix.with_name(path_prefix.name + INDEX_EXTENSION)) as f:
+            index = json.load(f)
+        if index["record_size"] != RECORD.size:
+            raise ValueError(f"{path_prefix} has {index['record_size']} byte records, expected {RECORD.size}")
+        self.labels: List[str] = index["labels"]
+        self.event_ids: List[str] = [event_id for event_id, _, _ in index["events"]]
+        self.event_timestamps: List[str] = [timestamp for _, timestamp, _ in index["events"]]
+        self.event_starts: List[int] = [start for _, _, start in index["events"]]
+        self.event_indexes: Dict[str, int] = {event_id: i for i, event_id in enumerate(self.event_ids)}
+
+        self.file = open(path_prefix.with_name(path_prefix.name + STREAM_EXTENSION), "rb")
+        size = self.file.seek(0, 2)
+        # can't mmap an empty file
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self.record_count = size // RECORD.size
+
+    def __len__(self) -> int:
+        return self.record_count
+
+    def __getitem__(self, i: int) -> RollRecord:
+        if i < 0:
+            i += self.record_count
+        if not 0 <= i < self.record_count:
+            raise IndexError(i)
+        value, threshold, position, event_index, label_id, flags = RECORD.unpack_from(self.data, i * RECORD.size)
+        is_correction = bool(flags & FLAG_CORRECTION)
+        return RollRecord(
+            label=None if is_correction else self.labels[label_id],
+            roll=value,
+            passed=bool(flags & FLAG_PASSED) if flags & FLAG_HAS_PASSED else None,
+            threshold=threshold if flags & FLAG_HAS_THRESHOLD else None,
+            event_index=event_index,
+            position=position,
+            is_correction=is_correction,
+        )
+
+    def records(self, start: int = 0, stop: Optional[int] = None) -> Iterator[RollRecord]:
+        for i in range(start, self.record_count if stop is None else stop):
+            yield self[i]
+
+    def event_range(self, event_index: int) -> range:
+        start = self.event_starts[event_index]
+        stop = self.event_starts[event_index + 1] if event_index + 1 < len(self.event_starts) else self.record_count
+        return range(start, stop)
+
+    def event_records(self, event_id: str) -> List[RollRecord]:
+        return [self[i] for i in self.event_range(self.event_indexes[event_id])]
+
+    def find_event(self, timestamp: str) -> int:
+        """
+        Index of the first event at or after the timestamp
+        """
+        return bisect.bisect_left(self.event_timestamps, timestamp)
+
+    def records_from(self, timestamp: str) -> Iterator[RollRecord]:
+        event_index = self.find_event(timestamp)
+        if event_index == len(self.event_starts):
+            return iter(())
+        return self.records(self.event_starts[event_index])
+
+    def to_numpy(self):
+        """
+        All the records as a numpy structured array, without copying them out of the mmap.
+        The array has to be gone before close() can unmap it.
+        """
+        import numpy as np
+
+        dtype = np.dtype(
+            [
+                ("roll", "<f8"),
+                ("threshold", "<f8"),
+                ("position", "<i8"),
+                ("event_index", "<u4"),
+                ("label_id", "<u4"),
+                ("flags", "u1"),
+                ("padding", "V3"),
+            ]
+        )
+        return np.frombuffer(self.data, dtype=dtype, count=self.record_count)
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.file.close()
+
+
+def merge_streams(path_prefixes: List[Path], out_path_prefix: Path):
+    """
+    Writes the streams one after the other into one stream, like a single run would have written them.
+    Label ids and event indexes are renumbered, rng positions are kept as they are
+    """
+    writer = RollStreamWriter(out_path_prefix)
+    for path_prefix in path_prefixes:
+        stream = RollStream(path_prefix)
+        label_ids = [writer.label_id(label) for label in stream.labels]
+        first_event_index = len(writer.events)
+        for event_id, timestamp, start in zip(stream.event_ids, stream.event_timestamps, stream.event_starts):
+            writer.events.append([event_id, timestamp, writer.record_count + start])
+        for i in range(len(stream)):
+            value, threshold, position, event_index, label_id, flags = RECORD.unpack_from(stream.data, i * RECORD.size)
+            if not flags & FLAG_CORRECTION:
+                label_id = label_ids[label_id]
+            writer.position = position
+            writer.event_index = first_event_index + event_index
+            writer._write(value, threshold, label_id, flags)
+        stream.close()
+    writer.close()
+
+
+def main():
+    parser = ArgumentParser(description="Prints a --roll-stream file as json lines, one per roll")
+    parser.add_argument("stream", type=Path, help="Path of the .rolls file")
+    parser.add_argument("--event", default=None, help="Only print the rolls of the event with this id")
+    parser.add_argument("--from-time", default=None, help="Start from the first event at or after this timestamp")
+    args = parser.parse_args()
+
+    stream = RollStream(args.stream.with_name(args.stream.name.removesuffix(STREAM_EXTENSION)))
+    if args.event:
+        records = stream.event_records(args.event)
+    elif args.from_time:
+        records = stream.records_from(args.from_time)
+    else:
+        records = stream.records()
+    for record in records:
+        print(json.dumps(record.to_json()))
+    stream.close()
+
+
+if __name__ == "__main__":
+    main()
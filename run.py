@@ -1,9 +1,12 @@
-import json
+import multiprocessing
+import os
+import secrets
 import time
 from argparse import ArgumentParser
 from collections import defaultdict
+from dataclasses import dataclass
 from enum import Enum, auto
-from multiprocessing import Pool, Queue
+from multiprocessing import Process, Queue, TimeoutError
 from os.path import splitext
 from pathlib import Path
 from queue import Empty
@@ -11,9 +14,24 @@ from sys import stdout
 from tqdm import tqdm
 from typing import Optional, List, Dict
 
-from data import get_feed_between
+from checkpoint import (
+    checkpoint_dir_for,
+    clear_checkpoints,
+    find_checkpoint,
+    is_complete,
+    read_checkpoint,
+    read_checkpoint_header,
+)
+from segments import merge_segment_outputs, plan_segments
+from data import get_feed_meta
+from distributed import DEFAULT_PORT, Coordinator, parse_address, run_in_staging_dir, run_worker, serve
+from manifest import invalidate, is_up_to_date, make_manifest, write_manifest
+from output import RollDataFormat
 from resim import Csv, Resim
 from rng import Rng
+from scheduling import estimate_costs, load_timings, longest_first, predict_makespan, save_timings
+from roll_log import RollLogMode, make_roll_log
+from tracing import TraceCategory, TraceLevel
 
 # fmt: off
 # season (0-indexed), (s0, s1), rng offset, event offset, start timestamp, end timestamp
@@ -278,6 +296,25 @@ class ProgressEventType(Enum):
     FRAGMENT_FINISH = auto()
 
 
+@dataclass
+class FragmentOptions:
+    """
+    Settings shared by every fragment in a run, passed to each pool worker.
+    """
+
+    silent: bool
+    out_file_name: str
+    csvs_to_log: List[Csv]
+    stream_file_dir: Optional[Path]
+    compact_players: bool = False
+    trace_level: TraceLevel = TraceLevel.DEBUG
+    trace_categories: Optional[List[TraceCategory]] = None
+    roll_log: RollLogMode = RollLogMode.OFF
+    roll_log_size: int = 10000
+    roll_format: RollDataFormat = RollDataFormat.CSV
+    checkpoints: bool = False
+
+
 def parse_args():
     parser = ArgumentParser("resim")
 
@@ -301,24 +338,101 @@ def parse_args():
                         help="Process only this fragment. Fragments are identified by start date (which must exactly "
                              "match the string from run.py). You may specify this argument multiple times to process "
                              "multiple fragments. This overrides --season.")
+    parser.add_argument("--compact-players", default=False, action="store_true",
+                        help="Use the lower-memory CompactPlayerData representation for players")
+    parser.add_argument("--trace-level", default="debug", choices=[level.name.lower() for level in TraceLevel],
+                        help="Only write output at or above this level. Default is everything")
+    parser.add_argument("--trace", nargs="+", default=None, metavar="CATEGORY",
+                        choices=[category.value for category in TraceCategory],
+                        help="Only write output in these categories. Default is all of them")
+    parser.add_argument("--roll-log", default="off",
+                        choices=[mode.value for mode in RollLogMode if mode != RollLogMode.MEMORY],
+                        help="Keep a log of every roll in roll_data/rolls_<fragment>.csv: 'ring' keeps the last "
+                             "--roll-log-size rolls in memory and writes them there on an error and at the end of the "
+                             "fragment, 'file' streams all of them there. Default is off")
+    parser.add_argument("--roll-log-size", default=10000, type=int,
+                        help="How many rolls --roll-log ring keeps")
+    parser.add_argument("--roll-format", default="csv", choices=[roll_format.value for roll_format in RollDataFormat],
+                        help="Write roll data as csv, or as typed columns in roll_data/columnar (parquet if pyarrow is "
+                             "installed, otherwise npz). Merge those with compact_roll_data.py. Default is csv")
+    parser.add_argument("--checkpoints", default=False, action="store_true",
+                        help="Save a checkpoint before each game day of a fragment, in checkpoints/<fragment>/")
+    parser.add_argument("--resume", default=False, action="store_true",
+                        help="Continue each fragment from its latest checkpoint, skipping fragments that finished")
+    parser.add_argument("--from-day", default=None, type=int,
+                        help="Start each fragment from its latest checkpoint at or before this day (zero-indexed). "
+                             "Output for the rest of the fragment is the same as a full run's, in files named "
+                             "<fragment>-from-s<season>d<day>")
+    parser.add_argument("--segments", default=False, action="store_true",
+                        help="Split fragments that have checkpoints from an earlier --checkpoints run into one segment "
+                             "per game day, and run those in parallel. Each segment's end state is checked against "
+                             "the next checkpoint, and their output is merged into the fragment's")
+    parser.add_argument("--incremental", default=False, action="store_true",
+                        help="Skip fragments whose output was made from the same fragment, feed, source and options, "
+                             "going by the manifests in manifests/")
+
+    parser.add_argument("--serve", nargs="?", const=f"localhost:{DEFAULT_PORT}", default=None, metavar="HOST:PORT",
+                        help="Instead of running the fragments here, hand them out to --worker processes over TCP and "
+                             f"collect their output. Default address is localhost:{DEFAULT_PORT}, give "
+                             f"0.0.0.0:{DEFAULT_PORT} to take workers from other machines")
+    parser.add_argument("--worker", nargs="?", const=f"localhost:{DEFAULT_PORT}", default=None, metavar="HOST:PORT",
+                        help="Run fragments for a --serve coordinator until it runs out, in --jobs processes. Uses "
+                             "this directory's cache, everything else is sent back to the coordinator")
+    parser.add_argument("--authkey", default=None,
+                        help="Shared secret between --serve and --worker. Anyone with it can run code on the "
+                             "coordinator. --worker needs it, --serve makes up a random one and prints it if not given")
 
     args = parser.parse_args()
+    if args.serve and (args.worker or args.no_multiprocessing):
+        parser.error("--serve hands the fragments out to workers, it can't be combined with --worker or -no")
+    if args.worker and args.authkey is None:
+        parser.error("--worker needs the --authkey the coordinator was started with")
+    if args.segments and (args.resume or args.from_day is not None):
+        parser.error("--segments runs whole fragments, it can't be combined with --resume or --from-day")
     if args.no_csv:
         args.csv = []
     else:
         args.csv = [Csv(Csv.__members__.get(csv, csv)) for csv in args.csv]
+    args.trace_level = TraceLevel[args.trace_level.upper()]
+    if args.trace is not None:
+        args.trace = [TraceCategory(category) for category in args.trace]
     return args
 
 
+def get_out_file_name(out_file_name, start_time):
+    basic_filename, extension = splitext(out_file_name)
+    return f"{basic_filename}-{start_time.replace(':', '_')}{extension}"
+
+
+def get_task_name(start_time, checkpoint, segment):
+    """
+    What a fragment's output is named, and what its timing is recorded under
+    """
+    if segment is not None:
+        # merged into the fragment's output once every segment is done
+        return segment.output_name(start_time)
+    if checkpoint is None:
+        return start_time
+    checkpoint_season, checkpoint_day, _ = checkpoint
+    # the full run's output stays where it is
+    return f"{start_time}-from-s{checkpoint_season}d{checkpoint_day}"
+
+
+def get_task_events(fragment_events: int, checkpoint, segment):
+    if segment is not None:
+        return segment.event_count(fragment_events)
+    if checkpoint is None:
+        return fragment_events
+    return fragment_events - read_checkpoint_header(checkpoint[2])["feed_index"]
+
+
 def get_out_file(silent, out_file_name, start_time):
     if silent:
         return None
     if out_file_name == "-":
         return stdout
 
-    basic_filename, extension = splitext(out_file_name)
-    filename = f"{basic_filename}-{start_time.replace(':', '_')}{extension}"
-    return open(filename, "w", encoding="utf8")
+    return open(get_out_file_name(out_file_name, start_time), "w", encoding="utf8")
 
 
 def main():
@@ -329,6 +443,18 @@ def main():
             print(f"  {csv.name}")
         return
 
+    if args.worker:
+        address = parse_address(args.worker)
+        jobs = int(args.jobs) if args.jobs else os.cpu_count()
+        processes = [
+            Process(target=run_worker, args=(address, args.authkey.encode(), run_remote_task)) for _ in range(jobs)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        return
+
     if args.fragment:
         fragments_to_process = [
             fragment for fragment in FRAGMENTS_WITH_SEASON if fragment[4] in args.fragment
@@ -340,21 +466,81 @@ def main():
     else:
         fragments_to_process = FRAGMENTS_WITH_SEASON
 
-    total_events = get_total_events([fragment[4] for fragment in fragments_to_process])
+    if args.resume:
+        fragments_to_process = [
+            fragment
+            for fragment in fragments_to_process
+            if not is_complete(checkpoint_dir_for(f"s{fragment[0]}-{fragment[4]}"))
+        ]
+    options = FragmentOptions(
+        silent=args.silent,
+        out_file_name=args.outfile,
+        csvs_to_log=args.csv,
+        stream_file_dir=args.roll_stream,
+        compact_players=args.compact_players,
+        trace_level=args.trace_level,
+        trace_categories=args.trace,
+        roll_log=RollLogMode(args.roll_log),
+        roll_log_size=args.roll_log_size,
+        roll_format=RollDataFormat(args.roll_format),
+        checkpoints=args.checkpoints,
+    )
+    if args.incremental:
+        up_to_date = [
+            fragment
+            for fragment in fragments_to_process
+            if is_up_to_date(f"s{fragment[0]}-{fragment[4]}", make_manifest(fragment, options))
+        ]
+        if up_to_date:
+            print(f"Skipping {len(up_to_date)} fragments whose output is up to date")
+        fragments_to_process = [fragment for fragment in fragments_to_process if fragment not in up_to_date]
+
+    checkpoints = {}
+    if args.resume or args.from_day is not None:
+        for fragment in fragments_to_process:
+            checkpoint = find_checkpoint(checkpoint_dir_for(f"s{fragment[0]}-{fragment[4]}"), args.from_day)
+            if checkpoint:
+                print(f"Starting {fragment[4]} from its checkpoint at s{checkpoint[0]}d{checkpoint[1]}")
+            checkpoints[fragment[4]] = checkpoint
+
+    fragment_events = get_fragment_events(fragments_to_process)
+    total_events = sum(fragment_events.values())
 
     print("Running resim...")
     with tqdm(total=total_events, unit=" events", unit_scale=True) as progress:
-        all_pool_args = [
-            ((args.silent, args.outfile, args.csv, args.roll_stream), fragment)
-            for fragment in fragments_to_process
-        ]
+        all_pool_args = []
+        segmented_fragments = {}
+        for fragment in fragments_to_process:
+            segments = plan_segments(checkpoint_dir_for(f"s{fragment[0]}-{fragment[4]}")) if args.segments else None
+            if segments:
+                segmented_fragments[fragment] = segments
+                invalidate(f"s{fragment[0]}-{fragment[4]}")
+                all_pool_args.extend((options, fragment, segment.start, segment) for segment in segments)
+            else:
+                all_pool_args.append((options, fragment, checkpoints.get(fragment[4]), None))
+
+        # longest first, so the long fragments aren't left running on their own at the end
+        task_events = {
+            get_task_name(fragment[4], checkpoint, segment): get_task_events(
+                fragment_events[fragment[4]], checkpoint, segment
+            )
+            for _, fragment, checkpoint, segment in all_pool_args
+        }
+        task_costs = estimate_costs(task_events, load_timings())
+        task_order = {name: i for i, name in enumerate(longest_first(task_costs))}
+        all_pool_args.sort(key=lambda pool_args: task_order[get_task_name(pool_args[1][4], *pool_args[2:])])
+        workers = 1 if args.no_multiprocessing else int(args.jobs) if args.jobs else os.cpu_count()
+        timings = {}
+        run_start_time = time.perf_counter()
+
+        def record_timing(result):
+            name, secs, startup_secs = result
+            timings[name] = {"secs": secs, "events": task_events[name], "startup_secs": startup_secs}
+
         if args.no_multiprocessing:
             for pool_args in all_pool_args:
-                run_fragment(pool_args, progress_callback=lambda: progress.update())
+                record_timing(run_fragment(pool_args, progress_callback=lambda: progress.update()))
         else:
-            global PROGRESS_QUEUE  # not really necessary but it gets rid of the shadowing warning in pycharm
-            PROGRESS_QUEUE = Queue()
-            processes = int(args.jobs) if args.jobs else None
             fragments_waiting = len(all_pool_args)
             fragments_processing = 0
             fragments_finished = 0
@@ -364,65 +550,146 @@ def main():
                     f"Fragments W:{fragments_waiting}|P:{fragments_processing}|F:{fragments_finished}"
                 )
 
+            def handle_progress_event(progress_event_type, data):
+                nonlocal fragments_waiting, fragments_processing, fragments_finished
+                if progress_event_type == ProgressEventType.EVENTS:
+                    progress.update(data)
+                elif progress_event_type == ProgressEventType.FRAGMENT_START:
+                    fragments_waiting -= 1
+                    fragments_processing += 1
+                    update_progress_postfix()
+                elif progress_event_type == ProgressEventType.FRAGMENT_FINISH:
+                    fragments_processing -= 1
+                    fragments_finished += 1
+                    update_progress_postfix()
+                else:
+                    raise ValueError("Unknown ProgressEventType")
+
             update_progress_postfix()
-            with Pool(processes=processes, initializer=init_pool_worker, initargs=(PROGRESS_QUEUE,)) as pool:
-                result = pool.map_async(run_fragment, all_pool_args)
-                while not result.ready():
-                    try:
-                        (progress_event_type, data) = PROGRESS_QUEUE.get(timeout=1)
-                    except Empty:
-                        pass  # Check loop condition and wait again
-                    else:
-                        if progress_event_type == ProgressEventType.EVENTS:
-                            progress.update(data)
-                        elif progress_event_type == ProgressEventType.FRAGMENT_START:
-                            fragments_waiting -= 1
-                            fragments_processing += 1
-                            update_progress_postfix()
-                        elif progress_event_type == ProgressEventType.FRAGMENT_FINISH:
-                            fragments_processing -= 1
-                            fragments_finished += 1
-                            update_progress_postfix()
+            if args.serve:
+                coordinator = Coordinator(
+                    all_pool_args,
+                    [get_task_inputs(checkpoint) for _, _, checkpoint, _ in all_pool_args],
+                    log=tqdm.write,
+                )
+                authkey = args.authkey or secrets.token_hex(16)
+                with serve(coordinator, parse_address(args.serve), authkey.encode()):
+                    tqdm.write(f"Waiting for workers on {args.serve}")
+                    if args.authkey is None:
+                        tqdm.write(f"Start them with --worker {args.serve} --authkey {authkey}")
+                    while not coordinator.finished():
+                        try:
+                            handle_progress_event(*coordinator.events.get(timeout=1))
+                        except Empty:
+                            pass
+                        # a task that failed or was lost started more than once
+                        fragments_waiting, fragments_processing, fragments_finished = coordinator.status()
+                        update_progress_postfix()
+                workers = len(coordinator.workers)
+                for result in coordinator.results.values():
+                    record_timing(result)
+            else:
+                global PROGRESS_QUEUE  # not really necessary but it gets rid of the shadowing warning in pycharm
+                context = get_pool_context()
+                PROGRESS_QUEUE = context.Queue()
+                with context.Pool(processes=workers, initializer=init_pool_worker, initargs=(PROGRESS_QUEUE,)) as pool:
+                    # one at a time, so each worker picks up the next longest when it's free
+                    results = pool.imap_unordered(run_fragment, all_pool_args, chunksize=1)
+                    while len(timings) < len(all_pool_args):
+                        try:
+                            # reraises any exception from the processes
+                            result = results.next(timeout=0)
+                        except TimeoutError:
+                            pass
                         else:
-                            raise ValueError("Unknown ProgressEventType")
-                result.get()  # reraise any exception from the processes
-    print("Finished")
+                            record_timing(result)
+                            continue
+                        try:
+                            (progress_event_type, data) = PROGRESS_QUEUE.get(timeout=1)
+                        except Empty:
+                            pass  # Check loop condition and wait again
+                        else:
+                            handle_progress_event(progress_event_type, data)
 
+    if all_pool_args:
+        predicted_makespan, _ = predict_makespan([task_costs[name] for name in task_order], workers)
+        print(
+            f"Took {time.perf_counter() - run_start_time:.0f}s on {workers} workers, "
+            f"predicted {predicted_makespan:.0f}s from event counts and earlier runs"
+        )
+        startup_secs = [timing["startup_secs"] for timing in timings.values()]
+        print(
+            f"Fragment startup (reading the feed and league data or checkpoint, before the first event): "
+            f"mean {sum(startup_secs) / len(startup_secs):.2f}s, max {max(startup_secs):.2f}s, "
+            f"{sum(startup_secs):.0f}s total"
+        )
+    save_timings(timings)
 
-def _total_events_for_fragments(fragment_events: Dict[str, int], fragment_starts: List[str]):
-    return sum(fragment_events[fragment_start] for fragment_start in fragment_starts)
+    for fragment, segments in segmented_fragments.items():
+        season, _, _, _, start_time, _ = fragment
+        segment_names = [segment.output_name(start_time) for segment in segments]
+        if args.silent or args.outfile == "-":
+            out_files = None
+        else:
+            out_files = (
+                [get_out_file_name(args.outfile, name) for name in segment_names],
+                get_out_file_name(args.outfile, start_time),
+            )
+        merge_segment_outputs(
+            f"s{season}-{start_time}", [f"s{season}-{name}" for name in segment_names], args.roll_stream, out_files
+        )
+        write_manifest(f"s{season}-{start_time}", make_manifest(fragment, options))
+    print("Finished")
 
 
-def get_total_events(fragment_starts: List[str]):
-    # Using json as a "hash" because it's easy and the value we're hashing isn't too huge.
-    # Note python's builtin `hash()` can't be used because it's not stable between runs.
-    # "version" here is just a cachebuster
-    fragments_hash = json.dumps({"version": 3, "fragments": FRAGMENTS_WITH_SEASON})
-    try:
-        with open("cache/event_count.json") as f:
-            event_count_cache = json.load(f)
-    except FileNotFoundError:
-        pass
-    else:
-        if event_count_cache["fragments_hash"] == fragments_hash:
-            return _total_events_for_fragments(event_count_cache["fragments"], fragment_starts)
-    print("Counting events...")
-    print("This may take a long time if new events need to be fetched from chron")
+def get_fragment_events(fragments) -> Dict[str, int]:
+    """
+    How many events are in each fragment's feed, by start time. Read from the feed cache's metadata, so only fragments
+    whose feed hasn't been fetched (or was cached before the metadata existed) take a while
+    """
     fragment_events = {}
-    with tqdm(total=len(FRAGMENTS_WITH_SEASON), unit=" fragments") as progress:
-        for season, _, _, _, start_time, end_time in FRAGMENTS_WITH_SEASON:
-            fragment_events[start_time] = len(get_feed_between(start_time, end_time))
+    with tqdm(total=len(fragments), unit=" fragments", desc="Counting events", leave=False) as progress:
+        for _, _, _, _, start_time, end_time in fragments:
+            fragment_events[start_time] = get_feed_meta(start_time, end_time)["count"]
             progress.update()
-            progress.set_description(f"Season {season}")
-    with open("cache/event_count.json", "w") as f:
-        json.dump(
-            {
-                "fragments_hash": fragments_hash,
-                "fragments": fragment_events,
-            },
-            f,
-        )
-    return _total_events_for_fragments(fragment_events, fragment_starts)
+    return fragment_events
+
+
+def get_task_inputs(checkpoint) -> Dict[str, bytes]:
+    # a worker on another machine won't have the checkpoint a task starts from
+    if checkpoint is None or os.path.isabs(checkpoint[2]):
+        return {}
+    with open(checkpoint[2], "rb") as f:
+        return {checkpoint[2]: f.read()}
+
+
+def run_remote_task(pool_args, inputs, progress_queue):
+    init_pool_worker(progress_queue)
+    options = pool_args[0]
+    dirs = []
+    if not options.silent and options.out_file_name != "-":
+        dirs.append(os.path.dirname(options.out_file_name))
+    if options.stream_file_dir is not None:
+        dirs.append(str(options.stream_file_dir))
+    # only relative paths end up in the staging directory, anything else is written where it says
+    dirs = [directory for directory in dirs if directory and not os.path.isabs(directory)]
+    return run_in_staging_dir(lambda: run_fragment(pool_args), inputs, dirs)
+
+
+# imported once by the forkserver that the pool workers are forked from - this imports everything else
+POOL_PRELOAD = ["run"]
+
+
+def get_pool_context():
+    # pool workers are forked from a server process that has already imported everything (the sin and item tables,
+    # the formulas...), so they start warm and share those pages, instead of each importing it all again like spawn
+    # does. Forking this process directly would copy tqdm's thread mid-run. The forkserver imports these from the
+    # working directory, so outside the repo it just starts cold
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(POOL_PRELOAD)
+        return context
+    return multiprocessing.get_context()
 
 
 def init_pool_worker(init_args):
@@ -433,11 +700,41 @@ def init_pool_worker(init_args):
 def run_fragment(pool_args, progress_callback=None):
     if PROGRESS_QUEUE:
         PROGRESS_QUEUE.put((ProgressEventType.FRAGMENT_START, None))
-    (silent, out_file_name, csvs_to_log, stream_file_dir), (season, rng_state, rng_offset, step, start_time, end_time) = pool_args
-    out_file = get_out_file(silent, out_file_name, start_time)
+    options, (season, rng_state, rng_offset, step, start_time, end_time), checkpoint, segment = pool_args
+    checkpoint_dir = checkpoint_dir_for(f"s{season}-{start_time}")
+    fragment_start_time = time.perf_counter()
+    first_event_time = None
+    checkpoint_state = read_checkpoint(checkpoint[2]) if checkpoint is not None else None
+    output_name = get_task_name(start_time, checkpoint, segment)
+    # only a run of the whole fragment replaces its output
+    is_full_run = checkpoint is None and segment is None
+    if is_full_run:
+        invalidate(f"s{season}-{start_time}")
+        if options.checkpoints:
+            # otherwise a crash partway through still looks complete to --resume, with the old checkpoints after it
+            clear_checkpoints(checkpoint_dir)
+    out_file = get_out_file(options.silent, options.out_file_name, output_name)
+    # a checkpoint has the rng state, this just gets overwritten
     rng = Rng(rng_state, rng_offset)
     rng.step(step)
-    resim = Resim(rng, out_file, run_name=f"s{season}-{start_time}", raise_on_errors=False, csvs_to_log=csvs_to_log, stream_file_dir=stream_file_dir)
+    run_name = f"s{season}-{output_name}"
+    roll_log = make_roll_log(
+        options.roll_log, f"roll_data/rolls_{run_name.replace(':', '_')}.csv", options.roll_log_size
+    )
+    resim = Resim(
+        rng,
+        out_file,
+        run_name=run_name,
+        raise_on_errors=False,
+        csvs_to_log=options.csvs_to_log,
+        stream_file_dir=options.stream_file_dir,
+        compact_players=options.compact_players,
+        trace_level=options.trace_level,
+        trace_categories=options.trace_categories,
+        roll_log=roll_log,
+        roll_format=options.roll_format,
+        checkpoint_dir=checkpoint_dir if options.checkpoints and segment is None else None,
+    )
 
     unreported_progress = 0
 
@@ -453,7 +750,15 @@ def run_fragment(pool_args, progress_callback=None):
                 unreported_progress = 0
                 last_progress_report_time = now
 
-    resim.run(start_time, end_time, progress_callback)
+    report_progress = progress_callback
+
+    def progress_callback():
+        nonlocal first_event_time
+        if first_event_time is None:
+            first_event_time = time.perf_counter()
+        report_progress()
+
+    resim.run(start_time, end_time, progress_callback, checkpoint_state, segment.stop_at if segment else None)
 
     if out_file:
         out_file.close()
@@ -461,6 +766,11 @@ def run_fragment(pool_args, progress_callback=None):
     if PROGRESS_QUEUE:
         PROGRESS_QUEUE.put((ProgressEventType.EVENTS, unreported_progress))
         PROGRESS_QUEUE.put((ProgressEventType.FRAGMENT_FINISH, None))
+    if is_full_run:
+        write_manifest(run_name, make_manifest(pool_args[1], options))
+    finish_time = time.perf_counter()
+    startup_secs = (first_event_time or finish_time) - fragment_start_time
+    return output_name, finish_time - fragment_start_time, startup_secs
 
 
 if __name__ == "__main__":
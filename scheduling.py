@@ -0,0 +1,59 @@
+import heapq
+import json
+import os
+from typing import Dict, List, Tuple
+
+TIMINGS_FILE = "cache/fragment_timings.json"
+
+# for when nothing has been timed yet. only the ratios between fragments matter for ordering them
+DEFAULT_SECS_PER_EVENT = 0.001
+
+
+def load_timings() -> Dict[str, Dict[str, float]]:
+    """
+    How long each fragment (or segment) took the last time it ran: name -> {"secs": ..., "events": ...}
+    """
+    try:
+        with open(TIMINGS_FILE) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_timings(new_timings: Dict[str, Dict[str, float]]):
+    timings = load_timings()
+    timings.update(new_timings)
+    os.makedirs(os.path.dirname(TIMINGS_FILE), exist_ok=True)
+    with open(f"{TIMINGS_FILE}.partial", "w") as f:
+        json.dump(timings, f, indent=2, sort_keys=True)
+    os.replace(f"{TIMINGS_FILE}.partial", TIMINGS_FILE)
+
+
+def estimate_costs(event_counts: Dict[str, int], timings: Dict[str, Dict[str, float]]) -> Dict[str, float]:
+    """
+    Estimated seconds for each task. Tasks that ran before use their last time, the rest their event count times
+    the average time per event of everything that's been timed.
+    """
+    timed_secs = sum(timing["secs"] for timing in timings.values())
+    timed_events = sum(timing["events"] for timing in timings.values())
+    secs_per_event = timed_secs / timed_events if timed_events else DEFAULT_SECS_PER_EVENT
+    return {
+        name: timings[name]["secs"] if name in timings else events * secs_per_event
+        for name, events in event_counts.items()
+    }
+
+
+def longest_first(costs: Dict[str, float]) -> List[str]:
+    return sorted(costs, key=costs.get, reverse=True)
+
+
+def predict_makespan(costs: List[float], workers: int) -> Tuple[float, List[float]]:
+    """
+    Wall-clock time for running tasks in this order on a pool, each one going to whichever worker frees up first.
+    Also returns how busy each worker would be.
+    """
+    loads = [0.0] * max(workers, 1)
+    heapq.heapify(loads)
+    for cost in costs:
+        heapq.heappush(loads, heapq.heappop(loads) + cost)
+    return max(loads), sorted(loads, reverse=True)
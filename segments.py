@@ -0,0 +1,148 @@
+import csv
+import os
+import shutil
+from dataclasses import dataclass
+from glob import glob
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from checkpoint import is_complete, list_checkpoints, read_checkpoint_header
+from columnar import COLUMNAR_DIR, EXTENSION, merge_runs
+from roll_stream import INDEX_EXTENSION, STREAM_EXTENSION, merge_streams
+
+
+@dataclass
+class Segment:
+    """
+    The part of a fragment between two of its checkpoints, which can run at the same time as the other parts.
+    """
+
+    index: int
+    # (season, day, path) of the checkpoint it starts from, None for the start of the fragment
+    start: Optional[Tuple[int, int, str]]
+    # header of the checkpoint it ends at, which its end state gets checked against. None for the end of the fragment
+    stop_at: Optional[Dict[str, Any]]
+    # index in the fragment's feed of the first event it handles
+    start_index: int = 0
+
+    def output_name(self, start_time: str) -> str:
+        return f"{start_time}-seg{self.index:03d}"
+
+    def event_count(self, fragment_events: int) -> int:
+        stop_index = fragment_events if self.stop_at is None else self.stop_at["feed_index"]
+        return stop_index - self.start_index
+
+
+def plan_segments(checkpoint_dir: str) -> Optional[List[Segment]]:
+    """
+    Splits a fragment at each of its checkpoints. None if an earlier run didn't finish making them
+    """
+    checkpoints = list_checkpoints(checkpoint_dir)
+    if not checkpoints or not is_complete(checkpoint_dir):
+        return None
+    starts = [None] + checkpoints
+    stops = [read_checkpoint_header(path) for _, _, path in checkpoints] + [None]
+    start_indexes = [0] + [stop_at["feed_index"] for stop_at in stops[:-1]]
+    if stops[0]["feed_index"] == 0:
+        # the fragment starts right at a game day, nothing comes before the first checkpoint
+        starts, stops, start_indexes = starts[1:], stops[1:], start_indexes[1:]
+    return [
+        Segment(i, start, stop_at, start_index)
+        for i, (start, stop_at, start_index) in enumerate(zip(starts, stops, start_indexes))
+    ]
+
+
+def merge_csvs(paths: List[str], out_path: str):
+    """
+    Appends csvs in order. A full run only writes the columns its first row had, so later files' rows are cut down to
+    the first file's columns the same way.
+    """
+    with open(f"{out_path}.partial", "w", newline="", encoding="utf-8") as out:
+        writer = None
+        for path in paths:
+            with open(path, "r", newline="", encoding="utf-8") as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
+                if header is None:
+                    continue
+                if writer is None:
+                    fieldnames = header
+                    writer = csv.writer(out)
+                    writer.writerow(fieldnames)
+                if header == fieldnames:
+                    writer.writerows(reader)
+                else:
+                    columns = [header.index(name) if name in header else None for name in fieldnames]
+                    for row in reader:
+                        writer.writerow("" if i is None else row[i] for i in columns)
+    os.replace(f"{out_path}.partial", out_path)
+
+
+def merge_text(paths: List[str], out_path: str):
+    with open(f"{out_path}.partial", "wb") as out:
+        for path in paths:
+            with open(path, "rb") as f:
+                shutil.copyfileobj(f, out)
+    os.replace(f"{out_path}.partial", out_path)
+
+
+def _merge(paths: List[Optional[str]], out_path: str, merge):
+    paths = [path for path in paths if path is not None and os.path.exists(path)]
+    if not paths:
+        return
+    merge(paths, out_path)
+    for path in paths:
+        os.remove(path)
+
+
+def merge_segment_outputs(
+    run_name: str,
+    segment_run_names: List[str],
+    stream_file_dir: Optional[Path],
+    out_files: Optional[Tuple[List[str], str]] = None,
+):
+    """
+    Puts the outputs of a fragment's segments together into what a single run of the fragment would have written,
+    and removes the segments' files. out_files is the segments' text output files and the file to merge them into.
+    """
+    run_name = run_name.replace(":", "_")
+    segment_run_names = [name.replace(":", "_") for name in segment_run_names]
+
+    categories = set()
+    for name in segment_run_names:
+        for path in glob(f"roll_data/{name}-*.csv"):
+            categories.add(os.path.basename(path)[len(name) + 1 : -len(".csv")])
+    for category in sorted(categories):
+        _merge(
+            [f"roll_data/{name}-{category}.csv" for name in segment_run_names],
+            f"roll_data/{run_name}-{category}.csv",
+            merge_csvs,
+        )
+    for prefix in ("odds", "rolls"):
+        _merge(
+            [f"roll_data/{prefix}_{name}.csv" for name in segment_run_names],
+            f"roll_data/{prefix}_{run_name}.csv",
+            merge_csvs,
+        )
+
+    for category_dir in glob(os.path.join(COLUMNAR_DIR, "*", "")):
+        _merge(
+            [os.path.join(category_dir, name + EXTENSION) for name in segment_run_names],
+            os.path.join(category_dir, run_name + EXTENSION),
+            lambda paths, out_path: merge_runs(paths, out_path, run_name),
+        )
+
+    if stream_file_dir is not None:
+        segment_streams = [
+            stream_file_dir / name
+            for name in segment_run_names
+            if (stream_file_dir / (name + STREAM_EXTENSION)).exists()
+        ]
+        if segment_streams:
+            merge_streams(segment_streams, stream_file_dir / run_name)
+            for prefix in segment_streams:
+                os.remove(prefix.with_name(prefix.name + STREAM_EXTENSION))
+                os.remove(prefix.with_name(prefix.name + INDEX_EXTENSION))
+
+    if out_files is not None:
+        _merge(*out_files, merge_text)
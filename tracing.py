@@ -0,0 +1,72 @@
+from enum import Enum, IntEnum, unique
+from typing import Iterable, Optional, TextIO
+
+
+class TraceLevel(IntEnum):
+    DEBUG = 10
+    INFO = 20
+    WARN = 30
+    ERROR = 40
+
+
+@unique
+class TraceCategory(Enum):
+    """
+    What a line of Resim output is about, so whole groups of it can be switched off.
+    """
+
+    EVENT = "event"  # the ===== header for each event
+    MODS = "mods"  # mod lists, echo/consumer target tables
+    ROLL = "roll"  # every roll, and roll debugging like fielder offset searches
+    ODDS = "odds"  # game odds and pitcher predictions at the start of each day
+    MISC = "misc"  # everything else that goes through Resim.print
+
+
+# higher than any real level, for categories that are switched off
+_OFF = 100
+
+
+class Tracer:
+    """
+    Level- and category-gated output. Messages are str.format templates, and nothing gets
+    formatted unless the category is enabled at that level, so a silent run doesn't pay for
+    building strings nobody reads.
+    """
+
+    def __init__(
+        self,
+        out_file: Optional[TextIO],
+        level: TraceLevel = TraceLevel.DEBUG,
+        categories: Optional[Iterable[TraceCategory]] = None,
+    ):
+        self.out_file = out_file
+        if out_file is None:
+            categories = []
+        elif categories is None:
+            categories = list(TraceCategory)
+        self._levels = {category: level for category in categories}
+
+    def enabled(self, category: TraceCategory, level: TraceLevel = TraceLevel.INFO) -> bool:
+        return level >= self._levels.get(category, _OFF)
+
+    def log(self, category: TraceCategory, message: str, *args, level: TraceLevel = TraceLevel.INFO):
+        if level >= self._levels.get(category, _OFF):
+            print(message.format(*args) if args else message, file=self.out_file)
+
+
+class LazyLabel:
+    """
+    A roll label that's only formatted if something actually looks at it.
+    """
+
+    __slots__ = ("template", "args")
+
+    def __init__(self, template: str, *args):
+        self.template = template
+        self.args = args
+
+    def __str__(self):
+        return self.template.format(*self.args)
+
+    def __repr__(self):
+        return repr(str(self))